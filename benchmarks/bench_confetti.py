@@ -0,0 +1,73 @@
+"""
+Per-frame cost of ConfettiWidget (integration + paint) for several particle
+counts, against the 16 ms confetti frame budget.
+
+Paints offscreen into a QImage, so it measures the raster engine only.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_confetti.py
+    python benchmarks/bench_confetti.py --counts 300 5000 20000 --frames 120
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def measure(count, frames, width, height):
+    from PyQt6.QtCore import QPoint
+    from PyQt6.QtGui import QImage
+
+    from src.presentation.slides.chart_slide import ConfettiWidget
+
+    widget = ConfettiWidget()
+    widget.resize(width, height)
+    widget.particle_count = lambda: count
+    widget.explode()
+    widget.stop_timer.stop()
+
+    image = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+    update_ms, paint_ms = [], []
+    for _ in range(frames):
+        start = time.perf_counter()
+        widget.update_particles()
+        update_ms.append((time.perf_counter() - start) * 1000)
+        if not widget.active:
+            break
+        image.fill(0)
+        start = time.perf_counter()
+        widget.render(image, QPoint())
+        paint_ms.append((time.perf_counter() - start) * 1000)
+    widget.stop()
+    return statistics.median(update_ms), statistics.median(paint_ms)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--counts", type=int, nargs="+", default=[300, 2000, 5000])
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--width", type=int, default=900)
+    parser.add_argument("--height", type=int, default=600)
+    args = parser.parse_args()
+
+    from PyQt6.QtWidgets import QApplication
+
+    from src.presentation.slides.chart_slide import _CONFETTI_FRAME_MS
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])  # noqa: F841
+
+    print(f"{args.frames} frames at {args.width}x{args.height}\n")
+    print(f"{'particles':>10} {'update ms':>10} {'paint ms':>10} {'budget':>8}")
+    for count in args.counts:
+        update_ms, paint_ms = measure(count, args.frames, args.width, args.height)
+        total = update_ms + paint_ms
+        verdict = "ok" if total < _CONFETTI_FRAME_MS else "over"
+        print(f"{count:>10} {update_ms:>10.2f} {paint_ms:>10.2f} {verdict:>8}")
+
+
+if __name__ == "__main__":
+    main()
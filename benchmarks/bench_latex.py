@@ -0,0 +1,190 @@
+"""
+Cold-render latency of LaTeX fragments: legacy two-figure + PNG path vs the
+single-pass mathtext path used by LaTeXRenderer.
+
+Each path runs in its own fresh interpreter so matplotlib's mathtext and font
+caches are cold for every formula (one unrelated warm-up formula pays for
+imports and font loading). Times include producing a QPixmap.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_latex.py
+    python benchmarks/bench_latex.py --config examples/dashboard_fourier_tables.json
+"""
+
+import argparse
+import io
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+DEFAULT_CONFIG = ROOT / "examples" / "dashboard_fourier_tables.json"
+WARMUP = r"\beta_0 + \gamma"
+
+
+def legacy_render(latex_str, fontsize, color, dpi):
+    """The pre-mathtext implementation: measure figure, savefig, PNG decode."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from PyQt6.QtGui import QPixmap
+
+    fig = Figure(figsize=(0.01, 0.01), dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    fig.patch.set_alpha(0.0)
+    text = fig.text(
+        0,
+        0,
+        f"${latex_str}$",
+        fontsize=fontsize,
+        color=color,
+        verticalalignment="bottom",
+        horizontalalignment="left",
+    )
+    canvas.draw()
+    bbox = text.get_window_extent(canvas.get_renderer())
+    bbox_inches = bbox.transformed(fig.dpi_scale_trans.inverted())
+
+    fig = Figure(
+        figsize=(bbox_inches.width + 0.1, bbox_inches.height + 0.1), dpi=dpi
+    )
+    FigureCanvasAgg(fig)
+    fig.patch.set_alpha(0.0)
+    ax = fig.add_axes([0, 0, 1, 1])
+    ax.axis("off")
+    ax.text(
+        0.5,
+        0.5,
+        f"${latex_str}$",
+        fontsize=fontsize,
+        color=color,
+        verticalalignment="center",
+        horizontalalignment="center",
+        transform=ax.transAxes,
+    )
+    buffer = io.BytesIO()
+    fig.savefig(
+        buffer,
+        format="png",
+        dpi=dpi,
+        bbox_inches="tight",
+        pad_inches=0.05,
+        transparent=True,
+    )
+    pixmap = QPixmap()
+    pixmap.loadFromData(buffer.getvalue(), "PNG")
+    return pixmap
+
+
+def mathtext_render(latex_str, fontsize, color, dpi):
+    from src.presentation.components.latex_renderer import (
+        _pixmap_from_rgba,
+        _render_rgba,
+    )
+
+    return _pixmap_from_rgba(_render_rgba(latex_str, fontsize, color, dpi))
+
+
+PATHS = {"legacy": legacy_render, "mathtext": mathtext_render}
+
+
+def collect_formulas(config_path):
+    from src.presentation.components.latex_renderer import LATEX_PATTERN
+
+    with open(config_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    formulas = []
+
+    def walk(node):
+        if isinstance(node, dict):
+            node = node.values()
+        if isinstance(node, str):
+            for match in LATEX_PATTERN.finditer(node):
+                latex = match.group(1) or match.group(2)
+                if latex not in formulas:
+                    formulas.append(latex)
+        elif not isinstance(node, (int, float, bool, type(None))):
+            for item in node:
+                walk(item)
+
+    walk(data)
+    return formulas
+
+
+def run_worker(path, formulas, fontsize, color, dpi):
+    """Runs inside the child interpreter; prints per-formula timings as JSON."""
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])  # noqa: F841
+    render = PATHS[path]
+    render(WARMUP, fontsize, color, dpi)
+
+    timings = []
+    for latex in formulas:
+        start = time.perf_counter()
+        pixmap = render(latex, fontsize, color, dpi)
+        elapsed = time.perf_counter() - start
+        timings.append((elapsed * 1000, pixmap.width(), pixmap.height()))
+    print(json.dumps(timings))
+
+
+def spawn(path, args):
+    cmd = [
+        sys.executable,
+        __file__,
+        "--worker",
+        path,
+        "--config",
+        str(args.config),
+        "--fontsize",
+        str(args.fontsize),
+        "--color",
+        args.color,
+        "--dpi",
+        str(args.dpi),
+    ]
+    out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
+    parser.add_argument("--fontsize", type=int, default=20)
+    parser.add_argument("--color", default="#ffffff")
+    parser.add_argument("--dpi", type=int, default=150)
+    parser.add_argument("--worker", choices=sorted(PATHS), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    formulas = collect_formulas(args.config)
+    if args.worker:
+        run_worker(args.worker, formulas, args.fontsize, args.color, args.dpi)
+        return
+
+    results = {path: spawn(path, args) for path in PATHS}
+
+    print(f"{len(formulas)} formulas from {args.config.name}, dpi {args.dpi}\n")
+    print(f"{'formula':<40} {'legacy ms':>10} {'mathtext ms':>12} {'speedup':>8}")
+    for i, latex in enumerate(formulas):
+        old_ms = results["legacy"][i][0]
+        new_ms = results["mathtext"][i][0]
+        print(
+            f"{latex[:40]:<40} {old_ms:>10.2f} {new_ms:>12.2f} "
+            f"{old_ms / new_ms:>7.1f}x"
+        )
+
+    old = [t[0] for t in results["legacy"]]
+    new = [t[0] for t in results["mathtext"]]
+    print(
+        f"\n{'median':<40} {statistics.median(old):>10.2f} "
+        f"{statistics.median(new):>12.2f} "
+        f"{statistics.median(old) / statistics.median(new):>7.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+Cold startup against a time budget: `ssc <cmd>` until it exits, and the app
+from launch until the current slide has painted its first frame.
+
+Each run is a fresh interpreter with its own temporary config directory,
+seeded with the given dashboard file, so a running app and its data are left
+alone. Exits with status 1 when a median is over budget. --profile adds the
+slowest top-level imports of each (python -X importtime).
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --config examples/dashboard_reset.json
+    python benchmarks/bench_startup.py --cli slide list --profile
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+DEFAULT_CONFIG = ROOT / "examples" / "dashboard_fourier_tables.json"
+CLI_BUDGET_MS = 150
+APP_BUDGET_MS = 1500
+APP_TIMEOUT = 60
+
+
+# Runs in the child interpreter, so that only the app's own imports are
+# profiled; prints the wall time once the current slide has painted
+APP_WORKER = """
+import sys
+import time
+
+sys.path.insert(0, sys.argv[1])
+
+from PyQt6.QtCore import QEvent, QObject, Qt, QTimer
+from PyQt6.QtWidgets import QApplication
+
+from src.presentation.main_window import SlideScrollerApp
+
+QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
+app = QApplication(sys.argv[:1])
+
+
+def on_frame():
+    print(time.time(), flush=True)
+    # A normal exit, so the LaTeX pre-render workers are joined
+    window.close()
+    app.quit()
+
+
+class FirstFrame(QObject):
+    # A paint of the current slide, or of anything inside it, is the first
+    # frame once the event loop has finished that paint pass
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint and in_current_slide(obj):
+            app.removeEventFilter(self)
+            QTimer.singleShot(0, on_frame)
+        return False
+
+
+def in_current_slide(obj):
+    slide = window.stack.currentWidget()
+    while obj is not None:
+        if obj is slide:
+            return True
+        obj = obj.parent()
+    return False
+
+
+watcher = FirstFrame()
+app.installEventFilter(watcher)
+window = SlideScrollerApp()
+app.exec()
+"""
+
+
+def make_env(config_dir, config):
+    env = dict(os.environ)
+    env["XDG_CONFIG_HOME"] = str(config_dir)
+    data_dir = Path(config_dir) / "slide-scroller"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    shutil.copy(config, data_dir / "dashboard.json")
+    return env
+
+
+def time_cli(cli_args, env, flags=()):
+    cmd = [sys.executable, *flags, str(ROOT / "src" / "cli.py"), *cli_args]
+    start = time.time()
+    proc = subprocess.run(cmd, env=env, capture_output=True, text=True)
+    elapsed = (time.time() - start) * 1000
+    if proc.returncode != 0:
+        raise RuntimeError(f"ssc {' '.join(cli_args)} failed:\n{proc.stderr}")
+    return elapsed, proc.stderr
+
+
+def time_app(env, flags=()):
+    cmd = [sys.executable, *flags, "-c", APP_WORKER, str(ROOT)]
+    start = time.time()
+    proc = subprocess.run(
+        cmd, env=env, capture_output=True, text=True, timeout=APP_TIMEOUT
+    )
+    lines = proc.stdout.strip().splitlines()
+    if not lines:
+        raise RuntimeError(f"App did not paint a frame:\n{proc.stderr}")
+    return (float(lines[-1]) - start) * 1000, proc.stderr
+
+
+def slowest_imports(importtime_log, count):
+    """Top-level imports from -X importtime output, slowest (cumulative) first."""
+    rows = []
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not name.startswith("  "):
+            rows.append((int(cumulative) / 1000, name.strip()))
+    return sorted(rows, reverse=True)[:count]
+
+
+def report(label, samples, budget, profile):
+    median = statistics.median(samples)
+    verdict = "ok" if median <= budget else "over"
+    print(
+        f"{label:<28} {median:>9.1f} {min(samples):>9.1f} {budget:>8} {verdict:>6}"
+    )
+    for ms, name in profile:
+        print(f"    {ms:>8.1f} ms  {name}")
+    return median <= budget
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--config", type=Path, default=DEFAULT_CONFIG)
+    parser.add_argument(
+        "--cli",
+        nargs="+",
+        default=["border", "show"],
+        help="ssc command to time (default: border show)",
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--cli-budget", type=float, default=CLI_BUDGET_MS)
+    parser.add_argument("--app-budget", type=float, default=APP_BUDGET_MS)
+    parser.add_argument("--profile", action="store_true")
+    args = parser.parse_args()
+
+    if not args.config.exists():
+        parser.error(f"{args.config} not found")
+    with tempfile.TemporaryDirectory() as config_dir:
+        env = make_env(config_dir, args.config)
+        # First runs compile bytecode and fill font caches; not counted
+        time_cli(args.cli, env)
+        time_app(env)
+
+        cli_ms = [time_cli(args.cli, env)[0] for _ in range(args.runs)]
+        app_ms = [time_app(env)[0] for _ in range(args.runs)]
+        cli_profile = app_profile = []
+        if args.profile:
+            log = time_cli(args.cli, env, ("-X", "importtime"))[1]
+            cli_profile = slowest_imports(log, 8)
+            log = time_app(env, ("-X", "importtime"))[1]
+            app_profile = slowest_imports(log, 8)
+
+    print(f"{args.runs} cold runs each, dashboard from {args.config.name}\n")
+    print(f"{'':<28} {'median ms':>9} {'min ms':>9} {'budget':>8} {'':>6}")
+    ok = report(
+        f"ssc {' '.join(args.cli)}", cli_ms, args.cli_budget, cli_profile
+    )
+    ok &= report("app to first frame", app_ms, args.app_budget, app_profile)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
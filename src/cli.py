@@ -1,24 +1,33 @@
 import argparse
 import os
 import signal
-import subprocess
 import sys
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
 from src.infrastructure.config import get_config_dir, load_data, save_data
-
-PID_FILE = get_config_dir() / "app.pid"
+from src.infrastructure.ipc import read_pid_file, send_command
 
 
 def get_current_pid():
-    if PID_FILE.exists():
-        try:
-            return int(PID_FILE.read_text().strip())
-        except Exception:
-            return None
-    return None
+    return read_pid_file()[0]
+
+
+def notify_app(command, message):
+    """
+    Sends command to the running app and prints message once it is applied
+    (or the app's error). Returns False if no app is listening, in which case
+    the caller falls back to editing dashboard.json.
+    """
+    reply = send_command(command)
+    if reply is None:
+        return False
+    if reply.get("ok"):
+        print(message)
+    else:
+        print(f"Error: {reply.get('error')}")
+    return True
 
 
 def is_running(pid):
@@ -33,6 +42,8 @@ def is_running(pid):
 
 def cmd_launch(args):
     """Launch the application in the background."""
+    import subprocess
+
     pid = get_current_pid()
     if is_running(pid):
         print(f"Application is already running (PID: {pid})")
@@ -132,6 +143,10 @@ def cmd_inc(args):
     """Increment chart bar value with animation."""
     import time
 
+    message = f"Triggered increment for bar {args.id} by {args.val}"
+    if notify_app({"type": "inc", "bar_id": args.id, "val": args.val}, message):
+        return
+
     data = load_data()
     if "global_config" not in data:
         data["global_config"] = {}
@@ -144,7 +159,7 @@ def cmd_inc(args):
         "ts": time.time(),
     }
     save_data(data)
-    print(f"Triggered increment for bar {args.id} by {args.val}")
+    print(message)
 
 
 def cmd_invert(args):
@@ -223,11 +238,48 @@ def cmd_border(args):
             data["global_config"]["visuals"]["animation_enabled"] = val
             print(f"Border animation set to: {val}")
             save_data(data)
+        case "fps":
+            val = max(1, int(args.val))
+            data["global_config"]["visuals"]["fps_cap"] = val
+            print(f"Animation FPS cap set to: {val}")
+            save_data(data)
+        case "powersave":
+            val = args.state.lower() == "on"
+            data["global_config"]["visuals"]["power_save"] = val
+            print(f"Power-save mode set to: {val}")
+            save_data(data)
+        case "confetti":
+            val = max(0, int(args.val))
+            data["global_config"]["visuals"]["confetti_particles"] = val
+            print(f"Confetti particles set to: {val}")
+            save_data(data)
+        case "engine":
+            data["global_config"]["visuals"]["chart_engine"] = args.val
+            print(f"Chart engine set to: {args.val}")
+            save_data(data)
         case "show":
             vis = data.get("global_config", {}).get("visuals", {})
             print(f"Current roughness: {vis.get('rough_slide', 1.0)}")
             print(f"Current radius: {vis.get('border_radius', 10.0)}")
             print(f"Animation enabled: {vis.get('animation_enabled', True)}")
+            print(f"FPS cap: {vis.get('fps_cap', 60)}")
+            print(f"Power-save mode: {vis.get('power_save', False)}")
+            print(f"Confetti particles: {vis.get('confetti_particles', 300)}")
+            print(f"Chart engine: {vis.get('chart_engine', 'matplotlib')}")
+
+
+def new_slide_uid():
+    return os.urandom(4).hex()
+
+
+def ensure_slide_uids(slides):
+    """
+    Gives every slide a stable uid so the app can tell an edited or moved
+    slide from a new one (the CLI's --id stays the list position).
+    """
+    for s in slides:
+        if not s.get("uid"):
+            s["uid"] = new_slide_uid()
 
 
 def get_active_class(data):
@@ -314,6 +366,8 @@ def cmd_slide_content(args):
         cls_data["active_slides"] = []
 
     slides = cls_data["active_slides"]
+    if args.content_action != "list":
+        ensure_slide_uids(slides)
     slide_idx = args.slide_id
 
     if not (0 <= slide_idx < len(slides)):
@@ -367,6 +421,8 @@ def cmd_slide_content(args):
                     if len(content) > 60:
                         preview += "..."
                     print(f"[{i}] {preview}")
+            # Read-only: leave dashboard.json (and the app) alone
+            return
 
     save_data(data)
 
@@ -387,19 +443,22 @@ def cmd_dock(args):
 
             save_data(data)
         case "tl" | "tr" | "bl" | "br":
-            # Update dock action
-            data["global_config"]["dock_action"] = {
-                "pos": args.action,
-                "ts": time.time(),
-            }
-
             start_map = {
                 "tl": "Top-Left",
                 "tr": "Top-Right",
                 "bl": "Bottom-Left",
                 "br": "Bottom-Right",
             }
-            print(f"Docking to {start_map[args.action]}...")
+            message = f"Docking to {start_map[args.action]}..."
+            if notify_app({"type": "dock", "pos": args.action}, message):
+                return
+
+            # Update dock action
+            data["global_config"]["dock_action"] = {
+                "pos": args.action,
+                "ts": time.time(),
+            }
+            print(message)
             save_data(data)
         case "taskbar":
             val = int(args.val)
@@ -408,6 +467,50 @@ def cmd_dock(args):
             save_data(data)
 
 
+def _format_bytes(n):
+    for unit in ("B", "KB", "MB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GB"
+
+
+def cmd_cache(args):
+    """Inspect or clear the LaTeX render cache."""
+    from src.infrastructure.latex_cache import LaTeXDiskCache
+
+    disk = LaTeXDiskCache()
+    match args.action:
+        case "stats":
+            stats = disk.stats()
+            print(f"LaTeX cache: {disk.root}")
+            print(
+                f"  Disk:   {stats['entries']} entries, "
+                f"{_format_bytes(stats['bytes'])} / "
+                f"{_format_bytes(stats['max_bytes'])}"
+            )
+            print(
+                f"          hits {stats['hits']}, misses {stats['misses']}, "
+                f"evictions {stats['evictions']}"
+            )
+            mem = disk.last_session
+            if mem:
+                print(
+                    f"  Memory (last session): {mem.get('entries', 0)} entries, "
+                    f"{_format_bytes(mem.get('bytes', 0))} / "
+                    f"{_format_bytes(mem.get('max_bytes', 0))}"
+                )
+                print(
+                    f"          hits {mem.get('hits', 0)}, "
+                    f"misses {mem.get('misses', 0)}, "
+                    f"evictions {mem.get('evictions', 0)}"
+                )
+        case "clear":
+            count = len(disk.entries)
+            disk.clear()
+            print(f"Removed {count} cached LaTeX renders")
+
+
 def cmd_slide(args):
     """Manage slides."""
     data = load_data()
@@ -418,16 +521,23 @@ def cmd_slide(args):
         cls_data["state"] = {}
 
     slides = cls_data["active_slides"]
+    if args.action in ("rm", "add", "edit"):
+        ensure_slide_uids(slides)
 
     match args.action:
         case "lock":
             idx = int(args.id)
             if 0 <= idx < len(slides):
+                message = f"Locked on slide {idx}"
+                if notify_app({"type": "lock", "id": idx}, message):
+                    return
                 cls_data["state"]["locked_slide"] = idx
-                print(f"Locked on slide {idx}")
+                print(message)
             else:
                 print(f"Error: Index {idx} out of range")
         case "unlock":
+            if notify_app({"type": "unlock"}, "Unlocked slides"):
+                return
             cls_data["state"]["locked_slide"] = -1
             print("Unlocked slides")
         case "rm":
@@ -438,7 +548,11 @@ def cmd_slide(args):
             else:
                 print(f"Error: Index {idx} out of range")
         case "add":
-            new_slide = {"type": args.type, "duration": args.duration}
+            new_slide = {
+                "type": args.type,
+                "duration": args.duration,
+                "uid": new_slide_uid(),
+            }
 
             match args.type:
                 case "web":
@@ -515,6 +629,17 @@ def cmd_slide(args):
                     print(f"Edited slide {idx}.")
             else:
                 print(f"Edited slide {idx}.")
+        case "pool":
+            pool = data.setdefault("global_config", {}).setdefault("slide_pool", {})
+            if args.live is not None:
+                pool["live"] = max(1, args.live)
+            if args.radius is not None:
+                pool["radius"] = max(0, args.radius)
+            if args.preroll is not None:
+                pool["preroll"] = max(0, args.preroll)
+            print(f"Live slide widgets: at most {pool.get('live', 4)}")
+            print(f"Preloaded neighbours: {pool.get('radius', 1)} on each side")
+            print(f"Next slide warmed up: {pool.get('preroll', 2)}s before switch")
         case "list":
             if not slides:
                 print("No slides configured.")
@@ -563,6 +688,8 @@ def cmd_slide(args):
                     for line in info:
                         print(f"    - {line}")
                     print("")
+            # Read-only: leave dashboard.json (and the app) alone
+            return
     save_data(data)
 
 
@@ -676,6 +803,49 @@ def main():
         "--state", required=True, choices=["on", "off"], help="Animation state"
     )
 
+    # Border FPS Cap
+    p_border_fps = border_subs.add_parser(
+        "fps",
+        help="Cap the animation frame rate",
+        formatter_class=ColoredHelpFormatter,
+    )
+    p_border_fps.add_argument(
+        "--val", required=True, type=int, help="Frames per second"
+    )
+
+    # Border Power Save
+    p_border_power = border_subs.add_parser(
+        "powersave",
+        help="Toggle power-save mode (animations at 10 FPS)",
+        formatter_class=ColoredHelpFormatter,
+    )
+    p_border_power.add_argument(
+        "--state", required=True, choices=["on", "off"], help="Power-save state"
+    )
+
+    # Border Confetti
+    p_border_confetti = border_subs.add_parser(
+        "confetti",
+        help="Set the number of confetti particles",
+        formatter_class=ColoredHelpFormatter,
+    )
+    p_border_confetti.add_argument(
+        "--val", required=True, type=int, help="Particle count (e.g. 300, 5000)"
+    )
+
+    # Border Chart Engine
+    p_border_engine = border_subs.add_parser(
+        "engine",
+        help="Choose the bar chart renderer",
+        formatter_class=ColoredHelpFormatter,
+    )
+    p_border_engine.add_argument(
+        "--val",
+        required=True,
+        choices=["matplotlib", "qpainter"],
+        help="matplotlib (reference) or qpainter (lightweight)",
+    )
+
     # Border Show
     border_subs.add_parser(
         "show",
@@ -715,6 +885,25 @@ def main():
 
     p_dock.set_defaults(func=cmd_dock)
 
+    # Cache
+    p_cache = subparsers.add_parser(
+        "cache",
+        help="Inspect or clear the LaTeX render cache.",
+        formatter_class=ColoredHelpFormatter,
+    )
+    cache_subs = p_cache.add_subparsers(dest="action", required=True)
+    cache_subs.add_parser(
+        "stats",
+        help="Show cache size, hits, misses and evictions",
+        formatter_class=ColoredHelpFormatter,
+    )
+    cache_subs.add_parser(
+        "clear",
+        help="Delete all cached renders",
+        formatter_class=ColoredHelpFormatter,
+    )
+    p_cache.set_defaults(func=cmd_cache)
+
     # Bar
     p_bar = subparsers.add_parser(
         "bar", help="Manage chart bar values.", formatter_class=ColoredHelpFormatter
@@ -810,6 +999,24 @@ def main():
         "list", help="List all slides", formatter_class=ColoredHelpFormatter
     )
 
+    # Slide Pool
+    p_slide_pool = slide_subs.add_parser(
+        "pool",
+        help="Limit how many slides are kept in memory",
+        formatter_class=ColoredHelpFormatter,
+    )
+    p_slide_pool.add_argument(
+        "--live", type=int, help="Maximum number of slide widgets alive at once"
+    )
+    p_slide_pool.add_argument(
+        "--radius", type=int, help="Slides around the current one to keep ready"
+    )
+    p_slide_pool.add_argument(
+        "--preroll",
+        type=int,
+        help="Seconds before a switch to warm up the next slide (0 disables)",
+    )
+
     # Slide Remove
     p_slide_rm = slide_subs.add_parser(
         "rm",
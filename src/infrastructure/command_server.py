@@ -0,0 +1,72 @@
+from PyQt6.QtCore import QObject
+from PyQt6.QtNetwork import QLocalServer
+
+from src.infrastructure.ipc import decode, encode
+
+MAX_PENDING_CONNECTIONS = 128
+
+
+class CommandServer(QObject):
+    """
+    Receives commands from `ssc` over a local socket (a named pipe on
+    Windows) and applies them in the GUI thread.
+
+    Commands are newline-delimited JSON objects. Each is passed to
+    handler(command), which returns None on success or an error message.
+    Each command gets a one-line reply once it has been applied. A
+    connection may carry any number of commands, and connections are
+    independent, so concurrent or bursty clients never drop commands.
+    """
+
+    def __init__(self, name, handler, parent=None):
+        super().__init__(parent)
+        self.handler = handler
+        self.buffers = {}
+
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        self.server.setMaxPendingConnections(MAX_PENDING_CONNECTIONS)
+        self.server.newConnection.connect(self.accept)
+        QLocalServer.removeServer(name)  # Stale socket from a crashed run
+        if not self.server.listen(name):
+            print(f"Command channel unavailable: {self.server.errorString()}")
+
+    @property
+    def name(self):
+        return self.server.fullServerName()
+
+    def is_listening(self):
+        return self.server.isListening()
+
+    def accept(self):
+        while self.server.hasPendingConnections():
+            conn = self.server.nextPendingConnection()
+            self.buffers[conn] = b""
+            conn.readyRead.connect(lambda c=conn: self.read(c))
+            conn.disconnected.connect(lambda c=conn: self.drop(c))
+
+    def read(self, conn):
+        data = self.buffers.get(conn, b"") + bytes(conn.readAll())
+        *lines, self.buffers[conn] = data.split(b"\n")
+        for line in lines:
+            if line.strip():
+                conn.write(encode(self.dispatch(line)))
+        conn.flush()
+
+    def dispatch(self, line):
+        try:
+            command = decode(line)
+        except ValueError as e:
+            return {"ok": False, "error": f"Malformed command: {e}"}
+        try:
+            error = self.handler(command)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        return {"ok": error is None, "error": error}
+
+    def drop(self, conn):
+        self.buffers.pop(conn, None)
+        conn.deleteLater()
+
+    def close(self):
+        self.server.close()
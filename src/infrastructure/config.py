@@ -1,7 +1,11 @@
+import copy
 import json
 import os
 import platform
+import threading
+import time
 from pathlib import Path
+from types import MappingProxyType
 
 
 def get_config_dir():
@@ -17,6 +21,12 @@ def get_config_dir():
 
 DATA_FILE = get_config_dir() / "dashboard.json"
 
+# Updates arriving within this window share one write
+WRITE_BEHIND_DELAY = 0.25
+# global_config.fsync: fsync every write, only the final one at exit, or none
+FSYNC_POLICIES = ("always", "shutdown", "never")
+DEFAULT_FSYNC = "always"
+
 
 def load_data():
     """Loads the dashboard data from JSON."""
@@ -55,32 +65,307 @@ def load_data():
         return {}
 
 
+def _write_temp(text, fsync):
+    """
+    Writes text next to DATA_FILE and returns the temp path, ready to be
+    renamed over it. Per-process names keep concurrent writers apart.
+    """
+    temp_file = DATA_FILE.with_name(f"{DATA_FILE.stem}.{os.getpid()}.tmp")
+    try:
+        with open(temp_file, "w", encoding="utf-8") as f:
+            f.write(text)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+    except Exception:
+        temp_file.unlink(missing_ok=True)
+        raise
+    return temp_file
+
+
+def _fsync_dir(path):
+    """Makes a rename inside path durable (no-op where unsupported)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _serialize(data):
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
 def save_data(data):
     """Saves the dashboard data to JSON atomically."""
     try:
         # Atomic write: write to temp file then rename
-        temp_file = DATA_FILE.with_suffix(".tmp")
-        with open(temp_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
-        # Rename is atomic on POSIX
-        temp_file.replace(DATA_FILE)
+        temp_file = _write_temp(_serialize(data), fsync=False)
+        try:
+            # Rename is atomic on POSIX
+            temp_file.replace(DATA_FILE)
+        finally:
+            temp_file.unlink(missing_ok=True)
+        config_store.publish(data)
     except Exception as e:
         print(f"Error saving data: {e}")
-        if "temp_file" in locals() and temp_file.exists():
+
+
+def current_class_state(data):
+    """The mutable `state` dict of the current class in data, created if missing."""
+    cid = data.setdefault("global_config", {}).get("current_class_id", "Geral")
+    cls = data.setdefault("classes", {}).setdefault(cid, {})
+    return cls.setdefault("state", {})
+
+
+def _freeze(value):
+    """Recursively converts parsed JSON into read-only mappings and tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+_EMPTY = _freeze({})
+
+
+class ConfigStore:
+    """
+    Process-wide, read-only view of dashboard.json.
+
+    The file is parsed at most once per on-disk change (detected through its
+    mtime/size/inode, which the atomic rename in save_data always changes), and
+    every reader shares the same frozen snapshot. Use load_data() when a mutable
+    copy is needed to feed save_data().
+
+    Inside the app, changes go through update() instead: the mutation is
+    applied to the in-memory document and published at once, and a background
+    writer persists the result, coalescing everything that arrives within
+    WRITE_BEHIND_DELAY into one compact write. Each update bumps `generation`;
+    `written_generation` is the last one on disk, and the stamp of that write
+    is remembered so changed_on_disk() can tell the watcher's echo of our own
+    write from an edit by the CLI, even one a refresh() already picked up.
+    Updates not yet written are kept and re-applied if the file changes
+    underneath them, so nothing is lost to a concurrent writer.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._stamp = None
+        self._external_change = False
+        self._snapshot = _EMPTY
+        self._class_data = _EMPTY
+
+        # Write-behind state, guarded by _lock
+        self._lock = threading.Condition(threading.RLock())
+        self._document = {}
+        self._pending = []
+        self.generation = 0
+        self.written_generation = 0
+        self._writer = None
+        self._flushing = False
+
+    def _file_stamp(self):
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _freeze_document(self):
+        self._snapshot = _freeze(self._document)
+
+        global_conf = self._snapshot.get("global_config", _EMPTY)
+        current_id = global_conf.get("current_class_id", "Geral")
+        classes = self._snapshot.get("classes", _EMPTY)
+        self._class_data = classes.get(current_id, _EMPTY)
+
+    def publish(self, data):
+        """Replaces the snapshot with data this process has just saved."""
+        with self._lock:
+            self._stamp = self._file_stamp()
+            self._load(copy.deepcopy(data or {}))
+
+    def _load(self, document):
+        # Updates not written yet stay on top of whatever is loaded
+        self._document = document
+        for mutator in self._pending:
+            self._apply(mutator)
+        self._freeze_document()
+        if self._pending:
+            self._lock.notify_all()
+
+    def refresh(self):
+        """
+        Re-parses the file only if it changed since the last snapshot.
+        Updates that have not been written yet are re-applied on top.
+        """
+        with self._lock:
+            stamp = self._file_stamp()
+            if stamp is not None and stamp == self._stamp:
+                return
+            if self._stamp is not None:
+                # Not a write of ours, which always records its stamp
+                self._external_change = True
+            if stamp is None:
+                # load_data() writes the default file, and save_data()
+                # publishes it along with the new file's stamp
+                data = load_data()
+                if self._file_stamp() is None:
+                    self._stamp = None
+                    self._load(data)  # Could not be saved; serve it anyway
+                return
+            self._stamp = stamp
+            self._load(load_data())
+
+    def snapshot(self):
+        self.refresh()
+        return self._snapshot
+
+    def current_class(self):
+        self.refresh()
+        return self._class_data
+
+    def invalidate(self):
+        with self._lock:
+            self._stamp = None
+
+    def changed_on_disk(self):
+        """
+        True if another process changed the file since the last call,
+        whether or not a refresh() has read the change yet. The echo of our
+        own writes is False.
+        """
+        with self._lock:
+            stamp = self._file_stamp()
+            changed = stamp is None or stamp != self._stamp or self._external_change
+            self._external_change = False
+            return changed
+
+    # --- Write-behind ---
+
+    def _apply(self, mutator):
+        try:
+            mutator(self._document)
+        except Exception as e:
+            print(f"Error applying update: {e}")
+
+    def update(self, mutator):
+        """
+        Calls mutator(data) on the in-memory document and publishes the result
+        immediately. Writing it to disk happens later, on the writer thread.
+        mutator may run again if the file is reloaded before the write, so it
+        should express the change (set a key, add a delta), not a whole state.
+        """
+        with self._lock:
+            self.refresh()
+            self._apply(mutator)
+            self._pending.append(mutator)
+            self.generation += 1
+            self._freeze_document()
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._run_writer, name="config-writer", daemon=True
+                )
+                self._writer.start()
+            self._lock.notify_all()
+
+    def flush(self, timeout=5.0):
+        """Blocks until every update so far is on disk. Returns success."""
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            self._flushing = True
+            self._lock.notify_all()
+            while self.written_generation < self.generation:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._writer is None:
+                    break
+                self._lock.wait(remaining)
+            self._flushing = False
+            return self.written_generation >= self.generation
+
+    def _fsync_policy(self):
+        policy = self._document.get("global_config", {}).get("fsync", DEFAULT_FSYNC)
+        return policy if policy in FSYNC_POLICIES else DEFAULT_FSYNC
+
+    def _run_writer(self):
+        while True:
+            with self._lock:
+                while not self._pending:
+                    self._lock.wait()
+
+                # Let the burst finish so it lands in a single write
+                deadline = time.monotonic() + WRITE_BEHIND_DELAY
+                while not self._flushing:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._lock.wait(remaining)
+
+                text = _serialize(self._document)
+                generation = self.generation
+                count = len(self._pending)
+                expected = self._stamp
+                policy = self._fsync_policy()
+                fsync = policy == "always" or (policy == "shutdown" and self._flushing)
+
             try:
-                temp_file.unlink()
-            except Exception:
-                pass
+                temp_file = _write_temp(text, fsync)
+            except Exception as e:
+                print(f"Error saving data: {e}")
+                time.sleep(WRITE_BEHIND_DELAY)
+                continue
+
+            with self._lock:
+                if self._file_stamp() != expected:
+                    # Someone else wrote the file since we last read it: merge
+                    # our pending updates into their version and try again
+                    temp_file.unlink(missing_ok=True)
+                    self.refresh()
+                    continue
+                try:
+                    temp_file.replace(self.path)
+                except Exception as e:
+                    print(f"Error saving data: {e}")
+                    temp_file.unlink(missing_ok=True)
+                    written = False
+                else:
+                    written = True
+                    self._stamp = self._file_stamp()
+                    del self._pending[:count]
+                    self.written_generation = generation
+                    self._lock.notify_all()
+
+            if not written:
+                time.sleep(WRITE_BEHIND_DELAY)
+            elif fsync:
+                _fsync_dir(self.path.parent)
+
+
+config_store = ConfigStore(DATA_FILE)
+
+
+def get_snapshot():
+    """Shared read-only view of the whole dashboard data."""
+    return config_store.snapshot()
 
 
 def get_current_class_data():
-    """Helper to get the data for the currently active class."""
-    data = load_data()
-    if not data:
-        return {}
+    """Helper to get the (read-only) data for the currently active class."""
+    return config_store.current_class()
+
+
+def update_data(mutator):
+    """Write-behind counterpart of load_data() + save_data(); see ConfigStore."""
+    config_store.update(mutator)
 
-    global_conf = data.get("global_config", {})
-    current_id = global_conf.get("current_class_id", "Geral")
-    classes = data.get("classes", {})
 
-    return classes.get(current_id, {})
+def flush_data(timeout=5.0):
+    """Waits for pending update_data() writes to reach the disk."""
+    return config_store.flush(timeout)
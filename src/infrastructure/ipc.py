@@ -0,0 +1,143 @@
+import json
+import os
+import socket
+import threading
+import time
+from pathlib import Path
+
+from src.infrastructure.config import get_config_dir
+
+PID_FILE = get_config_dir() / "app.pid"
+REPLY_TIMEOUT = 2.0
+CONNECT_RETRY = 0.005
+# Windows: every instance of the app's named pipe is in use
+ERROR_PIPE_BUSY = 231
+
+
+def get_socket_name(pid):
+    """Local server name for the app with the given PID."""
+    if os.name == "nt":
+        return f"slide-scroller-{pid}"  # Named pipe
+    import tempfile
+
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return str(Path(base) / f"slide-scroller-{pid}.sock")
+
+
+def write_pid_file(socket_name):
+    """Records the running app: PID on the first line, command socket on the second."""
+    PID_FILE.write_text(f"{os.getpid()}\n{socket_name}\n")
+
+
+def read_pid_file():
+    """Returns (pid, socket_name); either may be None."""
+    try:
+        lines = PID_FILE.read_text().split("\n")
+        pid = int(lines[0].strip())
+    except Exception:
+        return None, None
+    name = lines[1].strip() if len(lines) > 1 else ""
+    return pid, name or None
+
+
+def encode(message):
+    return json.dumps(message).encode("utf-8") + b"\n"
+
+
+def decode(line):
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        raise ValueError("expected a JSON object")
+    return message
+
+
+def _connect(name, timeout):
+    """Connects to the app, waiting while its accept backlog is full."""
+    deadline = time.monotonic() + timeout
+    while True:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        try:
+            sock.connect(name)
+            return sock
+        except BlockingIOError:
+            sock.close()
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(CONNECT_RETRY)
+        except OSError:
+            sock.close()
+            raise
+
+
+def _open_pipe(name, timeout):
+    """Opens the app's named pipe, waiting while all its instances are busy."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return open(name, "r+b", buffering=0)
+        except OSError as e:
+            busy = getattr(e, "winerror", None) == ERROR_PIPE_BUSY
+            if not busy or time.monotonic() > deadline:
+                raise
+            time.sleep(CONNECT_RETRY)
+
+
+def _open_channel(name, timeout):
+    """
+    Binary stream to the app's CommandServer: its local socket, or on
+    Windows the named pipe QLocalServer listens on.
+    """
+    if os.name == "nt":
+        return _open_pipe(name, timeout)
+    if not hasattr(socket, "AF_UNIX"):
+        raise OSError("no local sockets on this platform")
+    sock = _connect(name, timeout)
+    # The stream keeps the connection open until it is closed itself
+    stream = sock.makefile("rwb")
+    sock.close()
+    return stream
+
+
+def _read_reply(stream, timeout):
+    if os.name != "nt":
+        return stream.readline()  # The socket timeout applies
+    # A pipe read cannot time out; wait for it on a throwaway thread
+    lines = []
+    reader = threading.Thread(
+        target=lambda: lines.append(stream.readline()), daemon=True
+    )
+    reader.start()
+    reader.join(timeout)
+    if not lines:
+        raise TimeoutError("no reply")
+    return lines[0]
+
+
+def send_command(command, timeout=REPLY_TIMEOUT):
+    """
+    Sends one command to the running app and waits until it has been applied.
+
+    Returns the reply ({"ok": bool, "error": str | None}), or None when no app
+    is listening, in which case the caller falls back to editing the data file.
+    Once the command is written it is never reported as undelivered, so the
+    fallback cannot apply it a second time.
+    """
+    _, name = read_pid_file()
+    if name is None:
+        return None
+
+    try:
+        stream = _open_channel(name, timeout)
+    except OSError:
+        return None
+    with stream:
+        try:
+            stream.write(encode(command))
+            stream.flush()
+        except OSError:
+            return None
+        try:
+            return decode(_read_reply(stream, timeout))
+        except (OSError, ValueError):
+            return {"ok": False, "error": "No reply from application"}
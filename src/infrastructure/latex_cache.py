@@ -0,0 +1,161 @@
+import json
+import os
+import time
+from pathlib import Path
+
+MANIFEST_NAME = "manifest.json"
+DISK_BUDGET_BYTES = 64 * 1024 * 1024
+DISK_MAX_AGE = 30 * 24 * 3600
+
+
+def get_latex_cache_dir():
+    return Path.home() / ".cache" / "slide-scroller" / "latex"
+
+
+class LaTeXDiskCache:
+    """
+    Size- and age-bounded on-disk tier of the LaTeX cache.
+
+    Each entry is one 8-bit coverage mask PNG named after its key. The
+    manifest maps key -> [bytes, last_used] so pruning does not have to stat
+    every file, and also keeps cumulative counters plus the memory-tier stats
+    of the last session for `ssc cache stats`. It is reconciled against the
+    directory on load, so files written by render workers or left behind by
+    a crash are picked up and entries whose file vanished are dropped.
+
+    Only touches the filesystem, so the CLI can use it without Qt.
+    """
+
+    def __init__(
+        self, root=None, max_bytes=DISK_BUDGET_BYTES, max_age=DISK_MAX_AGE
+    ):
+        self.root = Path(root or get_latex_cache_dir())
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.entries = {}
+        self.counters = {"hits": 0, "misses": 0, "evictions": 0}
+        self.last_session = {}
+        self.load()
+
+    @property
+    def manifest_file(self):
+        return self.root / MANIFEST_NAME
+
+    def path(self, key):
+        return self.root / f"{key}.png"
+
+    @property
+    def total_bytes(self):
+        return sum(size for size, _ in self.entries.values())
+
+    def load(self):
+        try:
+            with open(self.manifest_file, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            manifest = {}
+        except Exception as e:
+            print(f"LaTeX cache manifest unreadable, rebuilding: {e}")
+            manifest = {}
+
+        known = manifest.get("entries", {})
+        for name in ("hits", "misses", "evictions"):
+            self.counters[name] = int(manifest.get("counters", {}).get(name, 0))
+        self.last_session = manifest.get("last_session", {})
+
+        self.entries = {}
+        with os.scandir(self.root) as it:
+            for entry in it:
+                if not entry.name.endswith(".png") or not entry.is_file():
+                    continue
+                key = entry.name[:-4]
+                stat = entry.stat()
+                last_used = known.get(key, (0, stat.st_mtime))[1]
+                self.entries[key] = [stat.st_size, last_used]
+        self.prune()
+
+    def get(self, key):
+        """Returns the file path for key, or None on a miss."""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.counters["misses"] += 1
+            return None
+        path = self.path(key)
+        if not path.exists():
+            del self.entries[key]
+            self.counters["misses"] += 1
+            return None
+        entry[1] = time.time()
+        self.counters["hits"] += 1
+        return path
+
+    def add(self, key):
+        """Registers a file that has just been written for key."""
+        try:
+            size = self.path(key).stat().st_size
+        except OSError:
+            return
+        self.entries[key] = [size, time.time()]
+        self.prune()
+
+    def prune(self):
+        now = time.time()
+        expired = [
+            key
+            for key, (_, last_used) in self.entries.items()
+            if now - last_used > self.max_age
+        ]
+        for key in expired:
+            self._evict(key)
+
+        total = self.total_bytes
+        if total <= self.max_bytes:
+            return
+        for key in sorted(self.entries, key=lambda k: self.entries[k][1]):
+            total -= self.entries[key][0]
+            self._evict(key)
+            if total <= self.max_bytes:
+                break
+
+    def _evict(self, key):
+        del self.entries[key]
+        self.counters["evictions"] += 1
+        try:
+            self.path(key).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"LaTeX cache eviction error: {e}")
+
+    def clear(self):
+        for key in list(self.entries):
+            self._evict(key)
+        self.counters = {"hits": 0, "misses": 0, "evictions": 0}
+        self.last_session = {}
+        self.save()
+
+    def save(self, session_stats=None):
+        """Writes the manifest atomically."""
+        if session_stats is not None:
+            self.last_session = session_stats
+        manifest = {
+            "entries": self.entries,
+            "counters": self.counters,
+            "last_session": self.last_session,
+        }
+        temp_file = self.manifest_file.with_suffix(".tmp")
+        try:
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(manifest, f)
+            temp_file.replace(self.manifest_file)
+        except Exception as e:
+            print(f"Error saving LaTeX cache manifest: {e}")
+
+    def stats(self):
+        return {
+            "entries": len(self.entries),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            **self.counters,
+        }
@@ -9,6 +9,7 @@ class AppSignals(QObject):
     lock_slide = pyqtSignal(int)
     lock_notice = pyqtSignal(int)
     border_frame_update = pyqtSignal(float)
+    latex_rendered = pyqtSignal(str)
     close_app = pyqtSignal()
 
 
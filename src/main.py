@@ -9,6 +9,14 @@ os.environ["QT_LOGGING_RULES"] = "qt.accessibility.atspi* = false"
 os.environ["QT_QPA_PLATFORM"] = "xcb"
 # os.environ["QTWEBENGINE_CHROMIUM_FLAGS"] = "--disable-gpu-compositing"
 
+# Web slides are imported on first use, after QApplication exists, so the
+# rendering setup QtWebEngine reads at startup is done here
+os.environ["QT_QUICK_BACKEND"] = "software"
+os.environ["QT_OPENGL"] = "software"
+os.environ["QT_ENABLE_GBM"] = "0"
+os.environ["QT_WEBENGINE_CHROMIUM_FLAGS"] = "--use-vulkan --ignore-gpu-blocklist"
+
+from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QApplication
 
 from src.infrastructure.config import get_config_dir
@@ -38,6 +46,8 @@ sys.excepthook = handle_exception
 def main():
     try:
         logging.info("Starting application...")
+        # Lets QtWebEngineWidgets be imported after the application is created
+        QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
         app = QApplication(sys.argv)
 
         logging.info("Initializing MainWindow...")
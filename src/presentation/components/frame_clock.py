@@ -0,0 +1,190 @@
+from PyQt6.QtCore import QElapsedTimer, QEvent, QObject, Qt, QTimer
+from PyQt6.QtGui import QGuiApplication
+
+from src.infrastructure.config import get_snapshot
+from src.infrastructure.signals import signals
+
+DEFAULT_FPS_CAP = 60
+POWER_SAVE_FPS = 10
+
+
+class _Subscription:
+    __slots__ = ("callback", "widget", "interval", "due", "connection")
+
+    def __init__(self, callback, widget, interval, due):
+        self.callback = callback
+        self.widget = widget
+        self.interval = interval
+        self.due = due
+        # The widget's destroyed -> unregister connection
+        self.connection = None
+
+
+class FrameClock(QObject):
+    """
+    Single tick source for everything that animates.
+
+    Components register a callback with the interval they want (50 ms for the
+    border wiggle, 16 ms for confetti, ...). One precise single-shot timer is
+    armed for the earliest due subscription, never sooner than one frame
+    after the previous tick, and every subscription due within half a frame
+    runs on that same wakeup. A frame is the screen refresh interval, capped
+    by `visuals.fps_cap` and by POWER_SAVE_FPS in `visuals.power_save` mode.
+    That only spaces the wakeups; they are not aligned to vsync, which
+    QWidget painting has no callback for.
+
+    Subscriptions tied to a widget are suspended while it is hidden or fully
+    obscured; they do not keep the timer armed and resume on its next Show,
+    or on the first Paint once it is uncovered.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.subscriptions = []
+        # Subscriptions the last schedule() left out, hidden or obscured
+        self._suspended = []
+        self.fps_cap = DEFAULT_FPS_CAP
+        self.power_save = False
+
+        self._clock = QElapsedTimer()
+        self._clock.start()
+        self._last_tick = -1e9
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.tick)
+
+        signals.update_data.connect(self.update_config)
+        self.update_config()
+
+    def update_config(self):
+        vis = get_snapshot().get("global_config", {}).get("visuals", {})
+        self.fps_cap = max(1, int(vis.get("fps_cap", DEFAULT_FPS_CAP)))
+        self.power_save = bool(vis.get("power_save", False))
+        self.schedule()
+
+    def now(self):
+        return self._clock.nsecsElapsed() / 1e6
+
+    def frame_interval(self):
+        """Shortest time between two wakeups, in ms."""
+        fps = self.fps_cap
+        screen = QGuiApplication.primaryScreen()
+        if screen is not None and screen.refreshRate() > 0:
+            fps = min(fps, screen.refreshRate())
+        if self.power_save:
+            fps = min(fps, POWER_SAVE_FPS)
+        return 1000.0 / fps
+
+    def register(self, callback, interval_ms, widget=None):
+        """
+        Calls callback every interval_ms (rounded to whole frames). If widget
+        is given, the subscription pauses while the widget is not visible and
+        ends when it is destroyed. Returns a handle for unregister().
+        """
+        sub = _Subscription(callback, widget, interval_ms, self.now() + interval_ms)
+        if widget is not None:
+            if not self.watches(widget):
+                widget.installEventFilter(self)
+            sub.connection = widget.destroyed.connect(lambda *_: self.unregister(sub))
+        self.subscriptions.append(sub)
+        self.schedule()
+        return sub
+
+    def unregister(self, sub):
+        if sub not in self.subscriptions:
+            return
+        self.subscriptions.remove(sub)
+        widget = sub.widget
+        if widget is not None:
+            try:
+                widget.destroyed.disconnect(sub.connection)
+                if not self.watches(widget):
+                    widget.removeEventFilter(self)
+            except (RuntimeError, TypeError):
+                pass  # Unregistered by the widget's own destruction
+        self.schedule()
+
+    def watches(self, widget):
+        """Whether any subscription is tied to widget (and filters its events)."""
+        return any(s.widget is widget for s in self.subscriptions)
+
+    def is_suspended(self, sub):
+        widget = sub.widget
+        if widget is None:
+            return False
+        try:
+            return not widget.isVisible() or widget.visibleRegion().isEmpty()
+        except RuntimeError:
+            # Wrapped C++ widget already deleted
+            return True
+
+    def eventFilter(self, obj, event):
+        kind = event.type()
+        if kind == QEvent.Type.Show:
+            self.resume(obj)
+        elif kind == QEvent.Type.Paint:
+            # Painting a widget that was fully covered: it is exposed again
+            if any(s.widget is obj for s in self._suspended):
+                self.resume(obj)
+        elif kind == QEvent.Type.Hide:
+            self.schedule()
+        return False
+
+    def resume(self, widget):
+        now = self.now()
+        for sub in self.subscriptions:
+            if sub.widget is widget:
+                sub.due = now
+        self.schedule()
+
+    def schedule(self):
+        active = []
+        self._suspended = []
+        for sub in self.subscriptions:
+            if self.is_suspended(sub):
+                self._suspended.append(sub)
+            else:
+                active.append(sub.due)
+        try:
+            if not active:
+                self.timer.stop()
+                return
+            now = self.now()
+            wake = max(min(active), self._last_tick + self.frame_interval())
+            self.timer.start(max(0, round(wake - now)))
+        except RuntimeError:
+            pass  # Widgets outliving the clock at interpreter exit
+
+    def tick(self):
+        now = self.now()
+        self._last_tick = now
+        frame = self.frame_interval()
+
+        for sub in list(self.subscriptions):
+            if sub.due > now + frame / 2 or sub not in self.subscriptions:
+                continue
+            # Keep the cadence, but never try to catch up on missed frames
+            interval = max(sub.interval, frame)
+            sub.due += interval
+            if sub.due <= now:
+                sub.due = now + interval
+            if self.is_suspended(sub):
+                continue
+            try:
+                sub.callback()
+            except Exception as e:
+                print(f"Animation callback error: {e}")
+
+        self.schedule()
+
+
+_global_clock = None
+
+
+def get_frame_clock():
+    global _global_clock
+    if _global_clock is None:
+        _global_clock = FrameClock()
+    return _global_clock
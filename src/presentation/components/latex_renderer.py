@@ -1,113 +1,394 @@
 import hashlib
+import os
 import re
-from pathlib import Path
+from collections import OrderedDict
 
-import matplotlib
-import matplotlib.pyplot as plt
-from PyQt6.QtCore import QBuffer, QIODevice
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap
 
-matplotlib.use("Agg")
+from src.infrastructure.latex_cache import (
+    DISK_BUDGET_BYTES,
+    DISK_MAX_AGE,
+    LaTeXDiskCache,
+)
+from src.infrastructure.signals import signals
 
+# matplotlib is only imported once a formula is rendered, here or in a
+# pre-render worker (which inherits the environment)
+os.environ.setdefault("MPLBACKEND", "Agg")
 
-class LaTeXRenderer:
-    def __init__(self, cache_dir=None):
-        self.cache_dir = (
-            cache_dir or Path.home() / ".cache" / "slide-scroller" / "latex"
-        )
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.cache = {}
-
-    def _get_cache_key(self, latex_str, fontsize, color):
-        content = f"{latex_str}_{fontsize}_{color}"
-        return hashlib.md5(content.encode()).hexdigest()
+LATEX_PATTERN = re.compile(r"\$\$(.+?)\$\$|\$(.+?)\$")
+MEMORY_BUDGET_BYTES = 32 * 1024 * 1024
+VARIANT_BUDGET_BYTES = 16 * 1024 * 1024
 
-    def render_latex(
-        self, latex_str, fontsize=16, color="white", dpi=150, max_width=None
-    ):
-        cache_key = self._get_cache_key(latex_str, fontsize, color)
 
-        if cache_key in self.cache:
-            pixmap = self.cache[cache_key]
-            if max_width and pixmap.width() > max_width:
-                return pixmap.scaledToWidth(max_width)
-            return pixmap
+def _font_identity():
+    """
+    The font settings every mask depends on: mathtext.fontset and the default
+    font families. Fixed once matplotlib has read its rc files.
+    """
+    import matplotlib
 
-        cache_file = self.cache_dir / f"{cache_key}.png"
-        if cache_file.exists():
-            pixmap = QPixmap(str(cache_file))
-            self.cache[cache_key] = pixmap
-            if max_width and pixmap.width() > max_width:
-                return pixmap.scaledToWidth(max_width)
-            return pixmap
+    fontset = matplotlib.rcParams["mathtext.fontset"]
+    fonts = ",".join(matplotlib.rcParams["font.family"])
+    return f"{fontset}_{fonts}"
 
-        try:
-            fig = plt.figure(figsize=(0.01, 0.01), dpi=dpi)
-            fig.patch.set_alpha(0.0)
-
-            text = fig.text(
-                0,
-                0,
-                f"${latex_str}$",
-                fontsize=fontsize,
-                color=color,
-                verticalalignment="bottom",
-                horizontalalignment="left",
-            )
 
-            fig.canvas.draw()
-            bbox = text.get_window_extent(fig.canvas.get_renderer())
-            bbox_inches = bbox.transformed(fig.dpi_scale_trans.inverted())
-
-            width = bbox_inches.width + 0.1
-            height = bbox_inches.height + 0.1
-
-            plt.close(fig)
-
-            fig = plt.figure(figsize=(width, height), dpi=dpi)
-            fig.patch.set_alpha(0.0)
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.axis("off")
-            ax.text(
-                0.5,
-                0.5,
-                f"${latex_str}$",
-                fontsize=fontsize,
-                color=color,
-                verticalalignment="center",
-                horizontalalignment="center",
-                transform=ax.transAxes,
-            )
+def _render_mask(latex_str, fontsize, dpi):
+    """
+    Renders one formula in a single mathtext pass.
 
-            buffer = QBuffer()
-            buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    Returns a (height, width) uint8 glyph coverage mask from the Agg mathtext
+    backend inside a 0.1" transparent margin (what the tight bbox plus
+    pad_inches=0.05 used to give). The mask is color independent; _tint()
+    turns it into RGBA. Runs in the pre-render worker processes too, so it
+    must not touch Qt.
+    """
+    import numpy as np
+    from matplotlib.font_manager import FontProperties
+    from matplotlib.mathtext import MathTextParser
 
-            fig.savefig(
-                buffer,
-                format="png",
-                dpi=dpi,
-                bbox_inches="tight",
-                pad_inches=0.05,
-                transparent=True,
-            )
+    parsed = MathTextParser("agg").parse(
+        f"${latex_str}$", dpi=dpi, prop=FontProperties(size=fontsize)
+    )
+    mask = np.asarray(parsed.image)
+
+    pad = round(0.1 * dpi)
+    return np.pad(mask, pad)
+
+
+def _tint(mask, color):
+    """Coverage mask -> (height, width, 4) uint8 RGBA array in the given color."""
+    import numpy as np
+    from matplotlib.colors import to_rgba
+
+    rgba = np.empty(mask.shape + (4,), dtype=np.uint8)
+    r, g, b, a = to_rgba(color)
+    rgba[..., 0] = round(r * 255)
+    rgba[..., 1] = round(g * 255)
+    rgba[..., 2] = round(b * 255)
+    rgba[..., 3] = (mask * a).astype(np.uint8)
+    return rgba
+
+
+def _render_rgba(latex_str, fontsize, color, dpi):
+    return _tint(_render_mask(latex_str, fontsize, dpi), color)
+
+
+def _write_mask(path, mask):
+    # 8-bit grayscale PNG: a quarter of the raw size of RGBA and shared by
+    # every text color
+    from PIL import Image
+
+    Image.fromarray(mask).save(path, format="PNG", optimize=True)
+
+
+def _read_mask(path):
+    import numpy as np
+    from PIL import Image
+
+    with Image.open(path) as image:
+        return np.asarray(image.convert("L"))
+
+
+def _prerender_job(latex_str, fontsize, dpi, cache_file):
+    """Worker entry point: renders and writes the on-disk cache entry."""
+    mask = _render_mask(latex_str, fontsize, dpi)
+    try:
+        _write_mask(cache_file, mask)
+    except Exception as e:
+        print(f"LaTeX cache write error: {e}")
+    return mask
 
-            plt.close(fig)
 
-            pixmap = QPixmap()
-            pixmap.loadFromData(buffer.data(), "PNG")
+def _pixmap_from_rgba(rgba):
+    # Wrap the array without copying; fromImage does the one conversion
+    h, w = rgba.shape[:2]
+    image = QImage(rgba.data, w, h, 4 * w, QImage.Format.Format_RGBA8888)
+    return QPixmap.fromImage(image)
 
-            pixmap.save(str(cache_file), "PNG")
 
-            self.cache[cache_key] = pixmap
+class _RenderBridge(QObject):
+    """Carries finished pre-renders from the executor thread to the GUI thread."""
 
-            if max_width and pixmap.width() > max_width:
-                return pixmap.scaledToWidth(max_width)
+    finished = pyqtSignal(str, object)
+
+
+class _PixmapLRU:
+    """Memory tier: least-recently-used pixmaps within a byte budget."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.items = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _size(pixmap):
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
+
+    def get(self, key):
+        pixmap = self.items.get(key)
+        if pixmap is None:
+            self.misses += 1
+            return None
+        self.items.move_to_end(key)
+        self.hits += 1
+        return pixmap
+
+    def put(self, key, pixmap):
+        old = self.items.pop(key, None)
+        if old is not None:
+            self.bytes -= self._size(old)
+        self.items[key] = pixmap
+        self.bytes += self._size(pixmap)
+        # Always keep the newest entry, even if it alone exceeds the budget
+        while self.bytes > self.max_bytes and len(self.items) > 1:
+            _, evicted = self.items.popitem(last=False)
+            self.bytes -= self._size(evicted)
+            self.evictions += 1
+
+    def clear(self):
+        self.items.clear()
+        self.bytes = 0
+
+    def stats(self):
+        return {
+            "entries": len(self.items),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class LaTeXRenderer:
+    def __init__(
+        self,
+        cache_dir=None,
+        memory_budget=MEMORY_BUDGET_BYTES,
+        disk_budget=DISK_BUDGET_BYTES,
+        disk_max_age=DISK_MAX_AGE,
+    ):
+        self.disk = LaTeXDiskCache(cache_dir, disk_budget, disk_max_age)
+        self.cache_dir = self.disk.root
+        self.cache = _PixmapLRU(memory_budget)
+        # Resized copies of cached renders, keyed on (pixmap, target size)
+        self.variants = _PixmapLRU(VARIANT_BUDGET_BYTES)
+
+        # Background pre-rendering: memory key -> (disk key, color)
+        self.pending = {}
+        self.failed = set()
+        self.placeholders = {}
+        self._pool = None
+        self._pool_failed = False
+        self._bridge = _RenderBridge()
+        self._bridge.finished.connect(self._on_prerendered)
+        # _font_identity(), resolved on the first lookup
+        self._font_id = None
+
+    def _get_cache_key(self, latex_str, fontsize, dpi):
+        """Disk key: everything that affects the coverage mask, but not color."""
+        if self._font_id is None:
+            self._font_id = _font_identity()
+        content = f"{latex_str}_{fontsize}_{dpi}_{self._font_id}"
+        return hashlib.md5(content.encode()).hexdigest()
+
+    def _get_keys(self, latex_str, fontsize, color, dpi):
+        disk_key = self._get_cache_key(latex_str, fontsize, dpi)
+        return disk_key, f"{disk_key}_{color}"
+
+    def _get_pool(self):
+        if self._pool is None and not self._pool_failed:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            try:
+                # spawn: forking a running Qt application is not safe
+                self._pool = ProcessPoolExecutor(
+                    max_workers=max(1, min(4, (os.cpu_count() or 2) - 1)),
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            except Exception as e:
+                print(f"LaTeX pre-render pool unavailable: {e}")
+                self._pool_failed = True
+        return self._pool
+
+    def _lookup(self, cache_key, disk_key, color):
+        """Memory, then disk cache. Returns None on a miss."""
+        pixmap = self.cache.get(cache_key)
+        if pixmap is not None:
             return pixmap
 
+        cache_file = self.disk.get(disk_key)
+        if cache_file is not None:
+            try:
+                return self._store(cache_key, disk_key, _read_mask(cache_file), color)
+            except Exception as e:
+                print(f"LaTeX cache read error: {e}")
+        return None
+
+    def _store(self, cache_key, disk_key, mask, color, write_disk=False):
+        if write_disk:
+            try:
+                _write_mask(self.disk.path(disk_key), mask)
+                self.disk.add(disk_key)
+            except Exception as e:
+                print(f"LaTeX cache write error: {e}")
+        pixmap = _pixmap_from_rgba(_tint(mask, color))
+        self.cache.put(cache_key, pixmap)
+        return pixmap
+
+    def prerender(self, latex_str, fontsize=16, color="white", dpi=150):
+        """Schedules a background render. Returns False if it cannot be queued."""
+        disk_key, cache_key = self._get_keys(latex_str, fontsize, color, dpi)
+        if cache_key in self.pending or cache_key in self.failed:
+            return True
+        if self._lookup(cache_key, disk_key, color) is not None:
+            return True
+
+        pool = self._get_pool()
+        if pool is None:
+            return False
+        try:
+            future = pool.submit(
+                _prerender_job,
+                latex_str,
+                fontsize,
+                dpi,
+                str(self.disk.path(disk_key)),
+            )
         except Exception as e:
-            print(f"LaTeX rendering error: {e}")
+            print(f"LaTeX pre-render pool broken, rendering inline: {e}")
+            self.shutdown()
+            self._pool_failed = True
+            return False
+
+        self.pending[cache_key] = (disk_key, color)
+
+        def done(f):
+            # Executor thread: only hand the result over to the GUI thread
+            try:
+                result = f.result()
+            except Exception as e:
+                result = e
+            self._bridge.finished.emit(cache_key, result)
+
+        future.add_done_callback(done)
+        return True
+
+    def prefetch(self, messages, fontsize=16, color="white", dpi=150):
+        """Queues every $...$ fragment found in the given messages."""
+        for msg in messages:
+            if "$" not in msg:
+                continue
+            for match in LATEX_PATTERN.finditer(msg):
+                latex_content = match.group(1) if match.group(1) else match.group(2)
+                if not self.prerender(latex_content, fontsize, color, dpi):
+                    return
+
+    def _on_prerendered(self, cache_key, result):
+        disk_key, color = self.pending.pop(cache_key)
+        if isinstance(result, Exception):
+            print(f"LaTeX rendering error: {result}")
+            self.failed.add(cache_key)
+        else:
+            # The worker already wrote the mask file
+            self.disk.add(disk_key)
+            self._store(cache_key, disk_key, result, color)
+        signals.latex_rendered.emit(cache_key)
+
+    def stats(self):
+        return {
+            "memory": self.cache.stats(),
+            "variants": self.variants.stats(),
+            "disk": self.disk.stats(),
+        }
+
+    def scaled(self, pixmap, width, height=None):
+        """
+        Smoothly scaled copy of a rendered pixmap, cached per target size.
+        Fits (width, height) keeping the aspect ratio, or only width when
+        height is None.
+        """
+        if pixmap.width() == width and (height is None or pixmap.height() == height):
+            return pixmap
+        key = (pixmap.cacheKey(), width, height)
+        variant = self.variants.get(key)
+        if variant is None:
+            if height is None:
+                variant = pixmap.scaledToWidth(
+                    width, Qt.TransformationMode.SmoothTransformation
+                )
+            else:
+                variant = pixmap.scaled(
+                    width,
+                    height,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation,
+                )
+            self.variants.put(key, variant)
+        return variant
+
+    def placeholder(self, latex_str, fontsize, color, dpi):
+        """Faint box roughly the size of the formula, shown until it renders."""
+        em = fontsize * dpi / 72
+        w = max(int(em), int(len(latex_str) * em * 0.45))
+        h = int(em * 1.6)
+        key = (w, h, color)
+        if key not in self.placeholders:
+            pixmap = QPixmap(w, h)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            fill = QColor(color)
+            fill.setAlpha(40)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(fill)
+            painter.drawRoundedRect(0, h // 4, w, h // 2, h // 4, h // 4)
+            painter.end()
+            self.placeholders[key] = pixmap
+        return self.placeholders[key]
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        self.disk.save(session_stats=self.cache.stats())
+
+    def render_latex(
+        self,
+        latex_str,
+        fontsize=16,
+        color="white",
+        dpi=150,
+        max_width=None,
+    ):
+        disk_key, cache_key = self._get_keys(latex_str, fontsize, color, dpi)
+        if cache_key in self.failed:
             return None
 
+        pixmap = self._lookup(cache_key, disk_key, color)
+        if pixmap is None:
+            # Miss: render in the background and draw a placeholder meanwhile
+            if self.prerender(latex_str, fontsize, color, dpi):
+                pixmap = self.placeholder(latex_str, fontsize, color, dpi)
+            else:
+                try:
+                    mask = _render_mask(latex_str, fontsize, dpi)
+                except Exception as e:
+                    print(f"LaTeX rendering error: {e}")
+                    self.failed.add(cache_key)
+                    return None
+                pixmap = self._store(cache_key, disk_key, mask, color, True)
+
+        if max_width and pixmap.width() > max_width:
+            return self.scaled(pixmap, max_width)
+        return pixmap
+
     def parse_and_render(
         self, text, fontsize=16, color="white", dpi=150, max_width=None
     ):
@@ -116,10 +397,9 @@ class LaTeXRenderer:
         Each segment is either ('text', str) or ('latex', QPixmap).
         """
         segments = []
-        pattern = r"\$\$(.+?)\$\$|\$(.+?)\$"
 
         last_end = 0
-        for match in re.finditer(pattern, text):
+        for match in LATEX_PATTERN.finditer(text):
             if match.start() > last_end:
                 segments.append(("text", text[last_end : match.start()]))
 
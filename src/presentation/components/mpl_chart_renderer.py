@@ -0,0 +1,201 @@
+from collections import OrderedDict
+from functools import lru_cache
+
+import matplotlib.patheffects as path_effects
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from mpl_toolkits.mplot3d import proj3d
+from PyQt6.QtCore import QPointF
+from PyQt6.QtGui import QImage
+
+# Renderers (one Agg figure each) kept for recently used widget sizes
+_RENDERER_SIZES = 2
+
+
+@lru_cache(maxsize=256)
+def _outlined_label(text, color, fontsize, stroke, va, dpi, ratio):
+    """
+    Renders a bold, white-outlined chart label once with Agg.
+    Returns (QImage, anchor_x, anchor_y), the anchor being the pixel where
+    the (ha="center", va=va) text position falls inside the cropped image.
+    """
+    em = fontsize * dpi / 72
+    w_px, h_px = int(em * (len(text) + 2)), int(em * 4)
+    fig = Figure(figsize=(w_px / dpi, h_px / dpi), dpi=dpi)
+    fig.patch.set_alpha(0)
+    canvas = FigureCanvasAgg(fig)
+    fig.text(
+        0.5,
+        0.5,
+        text,
+        ha="center",
+        va=va,
+        fontsize=fontsize,
+        fontweight="bold",
+        color=color,
+        path_effects=[
+            path_effects.withStroke(linewidth=stroke, foreground="white"),
+            path_effects.Normal(),
+        ],
+    )
+    canvas.draw()
+
+    rgba = np.asarray(canvas.buffer_rgba())
+    rows, cols = np.nonzero(rgba[..., 3])
+    if not len(rows):
+        return None
+    y0, y1, x0, x1 = rows.min(), rows.max() + 1, cols.min(), cols.max() + 1
+    crop = np.ascontiguousarray(rgba[y0:y1, x0:x1])
+    image = QImage(
+        crop.data, x1 - x0, y1 - y0, 4 * (x1 - x0), QImage.Format.Format_RGBA8888
+    ).copy()
+    image.setDevicePixelRatio(ratio)
+    # Buffer rows start at the top, figure pixels at the bottom
+    return image, fig.bbox.width / 2 - x0, (h_px - fig.bbox.height / 2) - y0
+
+
+class ChartRenderer:
+    """
+    Off-screen Agg figure with the 3D bar scene. Only one chart is on screen
+    at a time, so all chart slides of the same pixel size share one (see
+    get_chart_renderer) instead of each owning a Figure, 3D axes and Agg
+    buffer; a slide keeps its animation state as arrays and hands it over
+    for each frame it needs drawn.
+    """
+
+    def __init__(self, width, height, ratio):
+        self.ratio = ratio
+        # Same geometry FigureCanvasQTAgg would use for a widget of this size
+        self.fig = Figure(figsize=(width / 100, height / 100), dpi=100 * ratio)
+        self.agg = FigureCanvasAgg(self.fig)
+        self.fig.patch.set_alpha(0)
+
+        # FULL CENTERING: No margins on the figure itself
+        self.fig.subplots_adjust(left=0, right=1, bottom=0, top=1)
+
+        self.ax = self.fig.add_subplot(111, projection="3d")
+        self.ax.dist = 4.0  # Maximum zoom
+
+        self._scene_key = None
+        self._max_h = None
+
+    def build_scene(self, chart):
+        """Creates the bars once per bar layout; frames only mutate them."""
+        self.ax.clear()
+        self.ax.set_axis_off()
+        self.ax.set_facecolor((0, 0, 0, 0))
+        for axis in [self.ax.xaxis, self.ax.yaxis, self.ax.zaxis]:
+            axis.set_pane_color((0, 0, 0, 0))
+
+        # Face shading only depends on the (axis-aligned) normals, so the
+        # colors computed here stay valid while the vertices move.
+        self.bars = self.ax.bar3d(
+            chart.x_pos,
+            chart.y_pos,
+            chart.z_pos,
+            chart.dx_base,
+            chart.dy_base,
+            np.ones(chart.num_bars),
+            color=chart.label_colors,
+            shade=True,
+            edgecolor="white",
+            linewidth=1.2,
+            alpha=chart.bar_alpha,
+        )
+
+        self.ax.view_init(elev=20, azim=-60)
+
+        # --- TRUE CENTRALIZATION logic ---
+        total_width = (chart.num_bars * 0.6) - 0.2
+        center_x = total_width / 2
+
+        zoom = max(1.0, chart.num_bars * 0.4)
+        self.ax.set_xlim(center_x - zoom, center_x + zoom)
+        self.ax.set_ylim(-zoom, zoom)
+        self._max_h = None
+
+    def render(self, chart, polys):
+        """
+        Draws chart's bars with the given cuboid faces. Returns the frame as
+        (image, origin, labels): a copy of the Agg buffer, where to draw it
+        and the label sprites to draw over it as (position, QImage) pairs.
+        """
+        scene_key = (chart.num_bars, chart.bar_alpha, tuple(chart.label_colors))
+        if self._scene_key != scene_key:
+            self.build_scene(chart)
+            self._scene_key = scene_key
+
+        self.bars.set_verts(polys)
+        max_h = max(8, np.max(chart.logic_values))
+        if max_h != self._max_h:
+            self.ax.set_zlim(0, max_h * 1.1)
+            self._max_h = max_h
+        self.agg.draw()
+
+        buf = self.agg.buffer_rgba()
+        h_px, w_px = buf.shape[:2]
+        # Copied out, since the next chart to render reuses the buffer
+        image = QImage(buf, w_px, h_px, 4 * w_px, QImage.Format.Format_RGBA8888).copy()
+        image.setDevicePixelRatio(self.ratio)
+        return image, QPointF(), self.place_labels(chart)
+
+    def place_labels(self, chart):
+        n = chart.num_bars
+        xs = np.concatenate((chart.label_x, chart.label_x))
+        ys = np.concatenate((chart.label_y, chart.label_y))
+        zs = np.concatenate((chart.value_z, np.full(n, -0.5)))
+
+        # Same projection the last Agg draw used, then display -> widget coords.
+        px, py, _ = proj3d.proj_transform(xs, ys, zs, self.ax.M)
+        disp = self.ax.transData.transform(np.column_stack((px, py)))
+        ratio = self.ratio
+        wx = disp[:, 0] / ratio
+        wy = (self.fig.bbox.height - disp[:, 1]) / ratio
+
+        labels = []
+        for i in range(2 * n):
+            bar = i % n
+            if i < n:
+                sprite = _outlined_label(
+                    f"{chart.logic_values[bar]:.0f}",
+                    chart.label_colors[bar],
+                    16,
+                    4,
+                    "bottom",
+                    self.fig.dpi,
+                    ratio,
+                )
+            else:
+                sprite = _outlined_label(
+                    f"G{bar}",
+                    chart.label_colors[bar],
+                    14,
+                    3,
+                    "top",
+                    self.fig.dpi,
+                    ratio,
+                )
+            if sprite is None:
+                continue
+            image, anchor_x, anchor_y = sprite
+            labels.append(
+                (QPointF(wx[i] - anchor_x / ratio, wy[i] - anchor_y / ratio), image)
+            )
+        return labels
+
+
+_renderers = OrderedDict()
+
+
+def get_chart_renderer(width, height, ratio):
+    """Shared renderer for charts of this size; the last few sizes are kept."""
+    key = (width, height, ratio)
+    renderer = _renderers.get(key)
+    if renderer is None:
+        renderer = _renderers[key] = ChartRenderer(width, height, ratio)
+        if len(_renderers) > _RENDERER_SIZES:
+            _renderers.popitem(last=False)
+    else:
+        _renderers.move_to_end(key)
+    return renderer
@@ -0,0 +1,253 @@
+from functools import lru_cache
+
+import numpy as np
+from PyQt6.QtCore import QLineF, QPointF, Qt
+from PyQt6.QtGui import (
+    QBrush,
+    QColor,
+    QFont,
+    QFontMetricsF,
+    QImage,
+    QPainter,
+    QPainterPath,
+    QPen,
+    QPolygonF,
+)
+
+# The fixed mplot3d view of the chart: view_init(elev=20, azim=-60) with the
+# default camera (distance 10, focal length 1) and box aspect, and the 2D
+# view limits Axes3D uses to frame it
+_ELEV = np.deg2rad(20)
+_AZIM = np.deg2rad(-60)
+_DIST = 10.0
+# Axes3D.set_box_aspect(None): the (4, 4, 3) default scaled by matplotlib's
+# constant, which it tunes to match the mpl 3.2 look; 25/24 makes up for the
+# axes automargin added since
+_BOX = np.array((4, 4, 3), dtype=float)
+_BOX *= 1.8294640721620434 * 25 / 24 / np.linalg.norm(_BOX)
+_VIEW_LO, _VIEW_HI = -0.95 / _DIST, 0.9 / _DIST
+
+
+def _face_shade():
+    """
+    Brightness art3d._shade_colors gives the faces of a bar3d cuboid, in its
+    face order (-z, +z, -y, +y, -x, +x): the normal dotted with the default
+    LightSource(azdeg=225, altdeg=19.4712), mapped from [-1, 1] to [0.3, 1].
+    """
+    az, alt = np.deg2rad(90 - 225), np.deg2rad(19.4712)
+    light = (np.cos(az) * np.cos(alt), np.sin(az) * np.cos(alt), np.sin(alt))
+    normals = np.array(
+        [(0, 0, -1), (0, 0, 1), (0, -1, 0), (0, 1, 0), (-1, 0, 0), (1, 0, 0)]
+    )
+    return 0.3 + 0.7 * (normals @ light + 1) / 2
+
+
+_FACE_SHADE = _face_shade()
+
+# Matplotlib sizes (points at 100 dpi) in logical pixels
+_PT = 100 / 72
+_EDGE_WIDTH = 1.2 * _PT
+
+
+def _projection(xlim, ylim, zlim):
+    """Axes3D.get_proj() for the chart's view: data -> normalized view coords."""
+    (x0, x1), (y0, y1), (z0, z1) = xlim, ylim, zlim
+    sx, sy, sz = _BOX / (x1 - x0, y1 - y0, z1 - z0)
+    world = np.array(
+        [
+            [sx, 0, 0, -x0 * sx],
+            [0, sy, 0, -y0 * sy],
+            [0, 0, sz, -z0 * sz],
+            [0, 0, 0, 1],
+        ]
+    )
+
+    w = np.array(
+        (
+            np.cos(_ELEV) * np.cos(_AZIM),
+            np.cos(_ELEV) * np.sin(_AZIM),
+            np.sin(_ELEV),
+        )
+    )
+    u = np.cross((0, 0, 1), w)
+    u /= np.linalg.norm(u)
+    v = np.cross(w, u)
+    eye = _BOX / 2 + _DIST * w
+    view = np.eye(4)
+    view[:3, :3] = (u, v, w)
+    view[:3, 3] = -view[:3, :3] @ eye
+
+    persp = np.array(
+        [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, -_DIST], [0, 0, -1, 0]], dtype=float
+    )
+    return persp @ view @ world
+
+
+@lru_cache(maxsize=256)
+def _outlined_label(text, color, fontsize, stroke, va, ratio):
+    """
+    Renders a bold, white-outlined chart label once, like the matplotlib
+    engine's labels. Returns (QImage, anchor_x, anchor_y) with the anchor in
+    device pixels, where the (ha="center", va=va) text position falls.
+    """
+    font = QFont("DejaVu Sans")
+    font.setBold(True)
+    font.setPixelSize(max(1, round(fontsize * _PT * ratio)))
+    metrics = QFontMetricsF(font)
+    ink = metrics.tightBoundingRect("lp")
+
+    path = QPainterPath()
+    path.addText(0, 0, font, text)
+    pen_width = stroke * _PT * ratio
+    margin = pen_width
+    bounds = path.boundingRect().adjusted(-margin, -margin, margin, margin)
+
+    image = QImage(
+        max(1, int(bounds.width()) + 1),
+        max(1, int(bounds.height()) + 1),
+        QImage.Format.Format_ARGB32_Premultiplied,
+    )
+    image.fill(0)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.translate(-bounds.left(), -bounds.top())
+    pen = QPen(QColor("white"), pen_width)
+    pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
+    painter.strokePath(path, pen)
+    painter.fillPath(path, QColor(color))
+    painter.end()
+    image.setDevicePixelRatio(ratio)
+
+    # Baseline at y=0 in path coordinates; matplotlib aligns the line box
+    anchor_y = ink.bottom() if va == "bottom" else ink.top()
+    center_x = metrics.horizontalAdvance(text) / 2
+    return image, center_x - bounds.left(), anchor_y - bounds.top()
+
+
+class PainterChartRenderer:
+    """
+    QPainter chart engine. Projects the bar cuboids with the same fixed
+    camera the matplotlib engine uses, depth-sorts the faces like
+    Poly3DCollection and draws them as shaded polygons, so a frame is a few
+    dozen drawPolygon calls instead of an mplot3d draw.
+    """
+
+    def __init__(self):
+        self._view_key = None
+        self._matrix = None
+        self._brushes_key = None
+        self._brushes = []
+        # Square-capped segments take the raster engine's fast line path and
+        # look the same as Agg's round joins at this width
+        self.pen = QPen(QColor(255, 255, 255), _EDGE_WIDTH)
+        self.pen.setCapStyle(Qt.PenCapStyle.SquareCap)
+
+    def view(self, chart):
+        """Projection matrix for the chart's current axis limits."""
+        max_h = max(8, np.max(chart.logic_values))
+        key = (chart.num_bars, max_h)
+        if key != self._view_key:
+            total_width = (chart.num_bars * 0.6) - 0.2
+            center_x = total_width / 2
+            zoom = max(1.0, chart.num_bars * 0.4)
+            self._matrix = _projection(
+                (center_x - zoom, center_x + zoom), (-zoom, zoom), (0, max_h * 1.1)
+            )
+            self._view_key = key
+        return self._matrix
+
+    def brushes(self, chart):
+        key = (tuple(chart.label_colors), chart.bar_alpha)
+        if key != self._brushes_key:
+            self._brushes = []
+            for color in chart.label_colors:
+                base = QColor(color)
+                for shade in _FACE_SHADE:
+                    self._brushes.append(
+                        QBrush(
+                            QColor.fromRgbF(
+                                base.redF() * shade,
+                                base.greenF() * shade,
+                                base.blueF() * shade,
+                                chart.bar_alpha,
+                            )
+                        )
+                    )
+            edge = QColor(255, 255, 255)
+            edge.setAlphaF(chart.bar_alpha)
+            self.pen.setColor(edge)
+            self._brushes_key = key
+        return self._brushes
+
+    def project(self, chart, points, width, height):
+        """Data points (n, 3) -> widget coordinates (n, 2) and view depth (n,)."""
+        m = self.view(chart)
+        v = points @ m[:, :3].T + m[:, 3]
+        xs, ys, zs = (v[:, :3] / v[:, 3:]).T
+
+        # The 3D axes fill a centered square; 2D view limits map onto it
+        side = min(width, height)
+        k = side / (_VIEW_HI - _VIEW_LO)
+        wx = (width - side) / 2 + (xs - _VIEW_LO) * k
+        wy = height - (height - side) / 2 - (ys - _VIEW_LO) * k
+        return np.column_stack((wx, wy)), zs
+
+    def paint(self, painter, chart, polys, width, height, ratio):
+        """Draws the cuboid faces polys (n, 4, 3) and the labels."""
+        points, depth = self.project(chart, polys.reshape(-1, 3), width, height)
+        points = points.reshape(-1, 4, 2)
+        brushes = self.brushes(chart)
+
+        # Farthest first, by mean depth, as Poly3DCollection sorts
+        order = np.argsort(depth.reshape(-1, 4).mean(axis=1))[::-1]
+
+        painter.save()
+        # Each face is filled and then outlined before the next one covers it,
+        # so the hints switch per face. The fills skip antialiasing; the
+        # antialiased edges drawn over them hide that.
+        for i, quad in zip(order.tolist(), points[order].tolist()):
+            corners = [QPointF(x, y) for x, y in quad]
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(brushes[i])
+            painter.drawPolygon(QPolygonF(corners))
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(self.pen)
+            painter.drawLines(
+                [QLineF(corners[j - 1], corners[j]) for j in range(len(corners))]
+            )
+        painter.restore()
+
+        self.paint_labels(painter, chart, width, height, ratio)
+
+    def paint_labels(self, painter, chart, width, height, ratio):
+        n = chart.num_bars
+        xs = np.concatenate((chart.label_x, chart.label_x))
+        ys = np.concatenate((chart.label_y, chart.label_y))
+        zs = np.concatenate((chart.value_z, np.full(n, -0.5)))
+        pos, _ = self.project(chart, np.column_stack((xs, ys, zs)), width, height)
+
+        for i in range(2 * n):
+            bar = i % n
+            if i < n:
+                text = f"{chart.logic_values[bar]:.0f}"
+                size, stroke, va = 16, 4, "bottom"
+            else:
+                text, size, stroke, va = f"G{bar}", 14, 3, "top"
+            image, anchor_x, anchor_y = _outlined_label(
+                text, chart.label_colors[bar], size, stroke, va, ratio
+            )
+            painter.drawImage(
+                QPointF(pos[i, 0] - anchor_x / ratio, pos[i, 1] - anchor_y / ratio),
+                image,
+            )
+
+
+_global_renderer = None
+
+
+def get_painter_chart_renderer():
+    global _global_renderer
+    if _global_renderer is None:
+        _global_renderer = PainterChartRenderer()
+    return _global_renderer
@@ -1,21 +1,131 @@
 import math
+from functools import lru_cache
+from typing import NamedTuple
 
-from PyQt6.QtCore import QRectF, Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QColor, QPainter, QPainterPath, QPen
+import numpy as np
+from PyQt6.QtCore import QPointF, QRectF, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QPainter, QPainterPath, QPen, QPolygonF, QRegion
 from PyQt6.QtWidgets import QWidget
 
-from src.infrastructure.config import load_data
+from src.infrastructure.config import get_snapshot
 from src.infrastructure.signals import signals
+from src.presentation.components.frame_clock import get_frame_clock
+
+_BASE_SPATIAL_FREQ = 0.05
+_TIME_FREQ = 0.5
+_BORDER_FRAME_MS = 50
+
+
+class _BorderGeometry(NamedTuple):
+    base: np.ndarray  # (n, 2) points on the smooth rounded rect
+    normal_sin: np.ndarray  # (n, 2) outward normal * sin(d * spatial_freq)
+    normal_cos: np.ndarray  # (n, 2) outward normal * cos(d * spatial_freq)
+
+
+@lru_cache(maxsize=64)
+def _border_geometry(x, y, w, h, radius):
+    """
+    Samples the rounded-rect perimeter once per (rect, radius).
+
+    Edges are sampled every ~5px and corners every ~3px of arc length, in the
+    same order the border is drawn (top, top-right corner, right, ...).
+    """
+    radius = min(radius, w / 2, h / 2)
+
+    perimeter = 2 * (w - 2 * radius) + 2 * (h - 2 * radius) + 2 * math.pi * radius
+    target_cycles = max(1, round(perimeter * _BASE_SPATIAL_FREQ / (2 * math.pi)))
+    spatial_freq = (
+        (target_cycles * 2 * math.pi) / perimeter
+        if perimeter > 0
+        else _BASE_SPATIAL_FREQ
+    )
+
+    len_h = w - 2 * radius
+    len_v = h - 2 * radius
+    arc_len = math.pi * radius / 2
+    t_h = np.linspace(0.0, 1.0, max(1, int(len_h / 5)) + 1)
+    t_v = np.linspace(0.0, 1.0, max(1, int(len_v / 5)) + 1)
+    t_c = np.linspace(0.0, 1.0, max(1, int(arc_len / 3)) + 1)
+
+    xs, ys, nxs, nys, ds = [], [], [], [], []
+    current_d = 0.0
+
+    def edge(px, py, nx, ny, dist):
+        xs.append(px)
+        ys.append(py)
+        nxs.append(np.full_like(px, nx))
+        nys.append(np.full_like(px, ny))
+        ds.append(current_d + dist)
+
+    def corner(cx, cy, start_angle):
+        angle = start_angle + (math.pi / 2) * t_c
+        cos_a, sin_a = np.cos(angle), np.sin(angle)
+        xs.append(cx + radius * cos_a)
+        ys.append(cy + radius * sin_a)
+        nxs.append(cos_a)
+        nys.append(sin_a)
+        ds.append(current_d + arc_len * t_c)
+
+    # 1. Top Edge
+    dist = len_h * t_h
+    edge(x + radius + dist, np.full_like(dist, y), 0.0, -1.0, dist)
+    current_d += len_h
+    # 2. Top-Right Corner
+    corner(x + w - radius, y + radius, -math.pi / 2)
+    current_d += arc_len
+    # 3. Right Edge
+    dist = len_v * t_v
+    edge(np.full_like(dist, x + w), y + radius + dist, 1.0, 0.0, dist)
+    current_d += len_v
+    # 4. Bottom-Right Corner
+    corner(x + w - radius, y + h - radius, 0.0)
+    current_d += arc_len
+    # 5. Bottom Edge
+    dist = len_h * t_h
+    edge(x + w - radius - dist, np.full_like(dist, y + h), 0.0, 1.0, dist)
+    current_d += len_h
+    # 6. Bottom-Left Corner
+    corner(x + radius, y + h - radius, math.pi / 2)
+    current_d += arc_len
+    # 7. Left Edge
+    dist = len_v * t_v
+    edge(np.full_like(dist, x), y + h - radius - dist, -1.0, 0.0, dist)
+    current_d += len_v
+    # 8. Top-Left Corner
+    corner(x + radius, y + radius, math.pi)
+
+    def join(parts):
+        # Each segment starts where the previous one ended; drop the repeat.
+        return np.concatenate([parts[0]] + [p[1:] for p in parts[1:]])
+
+    base = np.column_stack((join(xs), join(ys)))
+    normal = np.column_stack((join(nxs), join(nys)))
+    spatial = join(ds) * spatial_freq
+
+    geo = _BorderGeometry(
+        base,
+        normal * np.sin(spatial)[:, None],
+        normal * np.cos(spatial)[:, None],
+    )
+    for arr in geo:
+        arr.setflags(write=False)
+    return geo
 
 
 class RoughBoxWidget(QWidget):
+    # Subclasses that paint no rough border of their own set this to False,
+    # so the border animation never repaints them
+    animated_border = True
+    # Corner radius the animated border is drawn with (None: border_radius)
+    band_radius = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.offset = 0.0
         self.rough_slide = 1.0
 
-        self.anim_timer = QTimer(self)
-        self.anim_timer.timeout.connect(self.animate_border)
+        # Frame clock subscription while the border is animating
+        self.anim_tick = None
 
         # Cache visuals to avoid reading file in paintEvent
         self.bg_alpha = 150
@@ -26,7 +136,7 @@ class RoughBoxWidget(QWidget):
 
     def update_config(self):
         try:
-            d = load_data()
+            d = get_snapshot()
             vis = d.get("global_config", {}).get("visuals", {})
             self.bg_alpha = vis.get("bg_alpha", 150)
             self.roughness_base = vis.get("rough_slide", 1.0)
@@ -39,8 +149,7 @@ class RoughBoxWidget(QWidget):
             )
 
             if not self.animation_enabled:
-                if self.anim_timer.isActive():
-                    self.anim_timer.stop()
+                self._stop_border_tick()
             elif hasattr(self, "should_animate") and self.should_animate:
                 self.start_animation()
 
@@ -50,13 +159,29 @@ class RoughBoxWidget(QWidget):
 
     def start_animation(self):
         self.should_animate = True
+        if not self.animated_border:
+            return
         if not hasattr(self, "animation_enabled") or self.animation_enabled:
-            if not self.anim_timer.isActive():
-                self.anim_timer.start(50)
+            if self.anim_tick is None:
+                self.anim_tick = get_frame_clock().register(
+                    self.animate_border, _BORDER_FRAME_MS, widget=self
+                )
 
     def stop_animation(self):
         self.should_animate = False
-        self.anim_timer.stop()
+        self._stop_border_tick()
+
+    # Lifecycle hooks, called by SlidingStackedWidget for its pages
+    def on_shown(self):
+        self.start_animation()
+
+    def on_hidden(self):
+        self.stop_animation()
+
+    def _stop_border_tick(self):
+        if self.anim_tick is not None:
+            get_frame_clock().unregister(self.anim_tick)
+            self.anim_tick = None
 
     border_path_update = pyqtSignal(object)
 
@@ -70,10 +195,26 @@ class RoughBoxWidget(QWidget):
             )
             self.border_path_update.emit(path)
 
-        self.update()
+        # Only the band around the border changes between frames
+        self.update(self.border_region())
+
+    def border_region(self):
+        """Band around the animated border, in widget coordinates."""
+        rect = self.rect().adjusted(5, 5, -5, -5)
+        radius = self.band_radius
+        if radius is None:
+            radius = getattr(self, "border_radius", 10.0)
+        radius = max(0.0, min(radius, rect.width() / 2, rect.height() / 2))
+
+        # Noise amplitude + pen width + antialiasing on both sides of the
+        # edge; inside, also how far the rounded corners pull the path in.
+        margin = math.ceil(2.0 * abs(self.roughness_base) + 2)
+        inner = margin + math.ceil(radius * (1 - math.sqrt(0.5)))
+        band = QRegion(rect.adjusted(-margin, -margin, margin, margin))
+        return band.subtracted(QRegion(rect.adjusted(inner, inner, -inner, -inner)))
 
     def cleanup(self):
-        self.anim_timer.stop()
+        self._stop_border_tick()
 
     def draw_rough_box(
         self,
@@ -161,174 +302,24 @@ class RoughBoxWidget(QWidget):
 
     @staticmethod
     def get_rough_path(rect, offset, roughness, radius=10):
-        path = QPainterPath()
-        x, y, w, h = rect.x(), rect.y(), rect.width(), rect.height()
-
-        radius = min(radius, w / 2, h / 2)
+        geo = _border_geometry(rect.x(), rect.y(), rect.width(), rect.height(), radius)
 
+        # noise(d) = sin(d * f + phase) * amplitude, expanded so that the
+        # per-point sin/cos terms come from the cached geometry.
+        phase = offset * _TIME_FREQ
         amplitude = 2.0 * roughness
+        points = geo.base + (
+            geo.normal_sin * math.cos(phase) + geo.normal_cos * math.sin(phase)
+        ) * amplitude
 
-        base_spatial_freq = 0.05
-        time_freq = 0.5
-
-        perimeter = 2 * (w - 2 * radius) + 2 * (h - 2 * radius) + 2 * math.pi * radius
-        target_cycles = max(1, round(perimeter * base_spatial_freq / (2 * math.pi)))
-        spatial_freq = (
-            (target_cycles * 2 * math.pi) / perimeter
-            if perimeter > 0
-            else base_spatial_freq
-        )
-
-        def get_noise(d):
-            return math.sin(d * spatial_freq + offset * time_freq) * amplitude
-
-        current_d = 0.0
-
-        # 1. Top Edge
-        start_x = x + radius
-        start_y = y
-        path.moveTo(start_x, start_y - get_noise(0))
-
-        len_top = w - 2 * radius
-        steps_top = max(1, int(len_top / 5))
-
-        for i in range(steps_top + 1):
-            ft = i / steps_top
-            dist_on_seg = len_top * ft
-
-            noise = get_noise(current_d + dist_on_seg)
-
-            px = start_x + dist_on_seg
-            py = start_y - noise
-            path.lineTo(px, py)
-
-        current_d += len_top
-
-        # 2. Top-Right Corner
-        cx_tr = x + w - radius
-        cy_tr = y + radius
-        arc_len = math.pi * radius / 2
-        steps_corner = max(1, int(arc_len / 3))
-
-        for i in range(steps_corner + 1):
-            ft = i / steps_corner
-            dist_on_seg = arc_len * ft
-
-            angle_rad = -math.pi / 2 + (math.pi / 2) * ft
-
-            noise = get_noise(current_d + dist_on_seg)
-            r_noisy = radius + noise
-
-            px = cx_tr + r_noisy * math.cos(angle_rad)
-            py = cy_tr + r_noisy * math.sin(angle_rad)
-            path.lineTo(px, py)
-
-        current_d += arc_len
-
-        # 3. Right Edge
-        start_y_right = y + radius
-        len_right = h - 2 * radius
-        steps_right = max(1, int(len_right / 5))
-
-        for i in range(steps_right + 1):
-            ft = i / steps_right
-            dist_on_seg = len_right * ft
-
-            noise = get_noise(current_d + dist_on_seg)
-
-            px = x + w + noise
-            py = start_y_right + dist_on_seg
-            path.lineTo(px, py)
-
-        current_d += len_right
-
-        # 4. Bottom-Right Corner
-        cx_br = x + w - radius
-        cy_br = y + h - radius
-
-        for i in range(steps_corner + 1):
-            ft = i / steps_corner
-            dist_on_seg = arc_len * ft
-
-            angle_rad = 0 + (math.pi / 2) * ft
-
-            noise = get_noise(current_d + dist_on_seg)
-            r_noisy = radius + noise
-
-            px = cx_br + r_noisy * math.cos(angle_rad)
-            py = cy_br + r_noisy * math.sin(angle_rad)
-            path.lineTo(px, py)
-
-        current_d += arc_len
-
-        # 5. Bottom Edge
-        start_x_bottom = x + w - radius
-        len_bottom = w - 2 * radius
-
-        for i in range(steps_top + 1):
-            ft = i / steps_top
-            dist_on_seg = len_bottom * ft
-
-            noise = get_noise(current_d + dist_on_seg)
-
-            px = start_x_bottom - dist_on_seg
-            py = y + h + noise
-            path.lineTo(px, py)
-
-        current_d += len_bottom
-
-        # 6. Bottom-Left Corner
-        cx_bl = x + radius
-        cy_bl = y + h - radius
-
-        for i in range(steps_corner + 1):
-            ft = i / steps_corner
-            dist_on_seg = arc_len * ft
-
-            angle_rad = math.pi / 2 + (math.pi / 2) * ft
-
-            noise = get_noise(current_d + dist_on_seg)
-            r_noisy = radius + noise
-
-            px = cx_bl + r_noisy * math.cos(angle_rad)
-            py = cy_bl + r_noisy * math.sin(angle_rad)
-            path.lineTo(px, py)
-
-        current_d += arc_len
-
-        # 7. Left Edge
-        start_y_left = y + h - radius
-        len_left = h - 2 * radius
-
-        for i in range(steps_right + 1):
-            ft = i / steps_right
-            dist_on_seg = len_left * ft
-
-            noise = get_noise(current_d + dist_on_seg)
-
-            px = x - noise
-            py = start_y_left - dist_on_seg
-            path.lineTo(px, py)
-
-        current_d += len_left
-
-        # 8. Top-Left Corner
-        cx_tl = x + radius
-        cy_tl = y + radius
-
-        for i in range(steps_corner + 1):
-            ft = i / steps_corner
-            dist_on_seg = arc_len * ft
-
-            angle_rad = math.pi + (math.pi / 2) * ft
-
-            noise = get_noise(current_d + dist_on_seg)
-            r_noisy = radius + noise
-
-            px = cx_tl + r_noisy * math.cos(angle_rad)
-            py = cy_tl + r_noisy * math.sin(angle_rad)
-            path.lineTo(px, py)
+        polygon = QPolygonF()
+        polygon.fill(QPointF(), len(points))
+        buffer = polygon.data()
+        buffer.setsize(points.nbytes)
+        np.frombuffer(buffer, dtype=np.float64).reshape(points.shape)[:] = points
 
+        path = QPainterPath()
+        path.addPolygon(polygon)
         path.closeSubpath()
         return path
 
@@ -5,6 +5,8 @@ from src.presentation.components.rough_box import RoughBoxWidget
 
 
 class RoughPillWidget(RoughBoxWidget):
+    band_radius = 10
+
     def __init__(self, parent=None):
         super().__init__()
         self.setParent(parent)
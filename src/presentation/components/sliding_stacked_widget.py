@@ -2,9 +2,44 @@ from PyQt6.QtCore import (
     QEasingCurve,
     QParallelAnimationGroup,
     QPoint,
+    QPointF,
     QPropertyAnimation,
+    Qt,
+    QVariantAnimation,
 )
-from PyQt6.QtWidgets import QStackedLayout, QStackedWidget
+from PyQt6.QtGui import QPainter
+from PyQt6.QtWidgets import QStackedLayout, QStackedWidget, QWidget
+
+
+class _SnapshotLayer(QWidget):
+    """Paints the two page snapshots of a running slide transition."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.current = None
+        self.next = None
+        self.offset_x = 0
+        self.progress = 0.0
+        self.hide()
+
+    def set_progress(self, value):
+        self.progress = value
+        self.update()
+
+    def release(self):
+        self.hide()
+        self.current = None
+        self.next = None
+
+    def paintEvent(self, event):
+        if self.current is None or self.next is None:
+            return
+        painter = QPainter(self)
+        shift = self.offset_x * self.progress
+        painter.drawPixmap(QPointF(-shift, 0), self.current)
+        painter.drawPixmap(QPointF(self.offset_x - shift, 0), self.next)
+        painter.end()
 
 
 class SlidingStackedWidget(QStackedWidget):
@@ -13,6 +48,31 @@ class SlidingStackedWidget(QStackedWidget):
         self.anim_duration = 500
         self.transition_active = False
         self.layout().setStackingMode(QStackedLayout.StackingMode.StackAll)
+        self.snapshot_layer = _SnapshotLayer(self)
+        self._finish_snapshot = None
+        self._next_widget = None
+
+        # Page whose on_shown hook ran last; pages get on_hidden when they
+        # stop being current (switch, removal), so hidden pages stop timers
+        self._active = None
+        self.currentChanged.connect(lambda _: self._set_active(self.currentWidget()))
+
+    def _set_active(self, widget):
+        if widget is self._active:
+            return
+        old, self._active = self._active, widget
+        if old is not None:
+            try:
+                if hasattr(old, "on_hidden"):
+                    old.on_hidden()
+            except RuntimeError:
+                pass  # Object might be deleted
+        if widget is not None and hasattr(widget, "on_shown"):
+            widget.on_shown()
+
+    def pages_on_screen(self):
+        """The current page, plus the incoming one while a transition runs."""
+        return [w for w in (self.currentWidget(), self._next_widget) if w is not None]
 
     def addWidget(self, widget):
         idx = super().addWidget(widget)
@@ -22,6 +82,12 @@ class SlidingStackedWidget(QStackedWidget):
             widget.hide()
         return idx
 
+    def insertWidget(self, index, widget):
+        idx = super().insertWidget(index, widget)
+        if idx != self.currentIndex():
+            widget.hide()
+        return idx
+
     def setCurrentIndex(self, index):
         # When setting index instantly, we must handle visibility manually due to StackAll
         old_widget = self.currentWidget()
@@ -34,6 +100,7 @@ class SlidingStackedWidget(QStackedWidget):
         if new_widget:
             new_widget.show()
             new_widget.raise_()
+        self._set_active(new_widget)
 
     def slide_to(self, index):
         current_idx = self.currentIndex()
@@ -47,13 +114,26 @@ class SlidingStackedWidget(QStackedWidget):
             self.setCurrentIndex(index)
             return
 
+        if self.transition_active and self._finish_snapshot:
+            # Jump the running snapshot transition to its end state
+            try:
+                self.anim_group.finished.disconnect()
+            except Exception:
+                pass
+            self.anim_group.stop()
+            self._finish_snapshot()
+            current_idx = self.currentIndex()
+            current_widget = self.currentWidget()
+            if current_idx == index:
+                return
+
         if self.transition_active:
             try:
                 self.anim_group.finished.disconnect()
             except Exception:
                 pass
             self.anim_group.stop()
-            if hasattr(self, "_next_widget") and self._next_widget:
+            if self._next_widget:
                 try:
                     self._next_widget.hide()
                 except RuntimeError:
@@ -62,6 +142,8 @@ class SlidingStackedWidget(QStackedWidget):
 
         self.transition_active = True
         self._next_widget = next_widget
+        self._finish_snapshot = None
+        self._set_active(next_widget)
 
         # Geometry
         width = self.width()
@@ -85,9 +167,16 @@ class SlidingStackedWidget(QStackedWidget):
         elif current_idx == 0 and index == self.count() - 1:
             direction = -1
 
+        offset_x = width * direction
+
+        if getattr(current_widget, "supports_snapshot", True) and getattr(
+            next_widget, "supports_snapshot", True
+        ):
+            self._slide_snapshots(index, current_widget, next_widget, offset_x)
+            return
+
         # Setup Start Positions
         # Next starts off-screen
-        offset_x = width * direction
         next_widget.setGeometry(offset_x, 0, width, height)
         next_widget.show()
         next_widget.raise_()  # Ensure top
@@ -121,15 +210,62 @@ class SlidingStackedWidget(QStackedWidget):
                 current_widget.hide()
                 current_widget.move(0, 0)
                 next_widget.move(0, 0)
-                super(SlidingStackedWidget, self).setCurrentIndex(index)
+                # Pages may have been inserted or removed meanwhile
+                super(SlidingStackedWidget, self).setCurrentIndex(
+                    self.indexOf(next_widget)
+                )
+            except RuntimeError:
+                pass  # Widget deleted during animation
+            except Exception as e:
+                print(f"Error in slide animation finish: {e}")
+            finally:
+                self.transition_active = False
+                self._next_widget = None
+
+        self.anim_group.finished.connect(on_finished)
+        self.anim_group.start()
+
+    def _slide_snapshots(self, index, current_widget, next_widget, offset_x):
+        """
+        Slides pixmap snapshots of both pages instead of moving the live widget
+        trees, so each animation frame is just two drawPixmap calls.
+        """
+        next_widget.setGeometry(self.rect())
+        layer = self.snapshot_layer
+        layer.current = current_widget.grab()
+        layer.next = next_widget.grab()
+        layer.offset_x = offset_x
+        layer.progress = 0.0
+        layer.setGeometry(self.rect())
+        layer.show()
+        layer.raise_()
+        current_widget.hide()
+
+        self.anim_group = QVariantAnimation()
+        self.anim_group.setDuration(self.anim_duration)
+        self.anim_group.setStartValue(0.0)
+        self.anim_group.setEndValue(1.0)
+        self.anim_group.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self.anim_group.valueChanged.connect(layer.set_progress)
+
+        def on_finished():
+            try:
+                next_widget.show()
+                next_widget.raise_()
+                super(SlidingStackedWidget, self).setCurrentIndex(
+                    self.indexOf(next_widget)
+                )
             except RuntimeError:
                 pass  # Widget deleted during animation
             except Exception as e:
                 print(f"Error in slide animation finish: {e}")
             finally:
+                layer.release()
                 self.transition_active = False
                 self._next_widget = None
+                self._finish_snapshot = None
 
+        self._finish_snapshot = on_finished
         self.anim_group.finished.connect(on_finished)
         self.anim_group.start()
 
@@ -137,4 +273,5 @@ class SlidingStackedWidget(QStackedWidget):
         # Ensure all widgets resize to fit
         for i in range(self.count()):
             self.widget(i).setGeometry(self.rect())
+        self.snapshot_layer.setGeometry(self.rect())
         super().resizeEvent(event)
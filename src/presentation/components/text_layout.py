@@ -0,0 +1,96 @@
+from PyQt6.QtCore import QPointF, QRectF, Qt
+from PyQt6.QtGui import (
+    QFont,
+    QFontMetrics,
+    QFontMetricsF,
+    QPen,
+    QStaticText,
+    QTransform,
+)
+
+_TEXT = 0
+_RECT = 1
+_PIXMAP = 2
+
+
+class TextLayout:
+    """
+    Display list for one laid-out message.
+
+    Implements the small subset of the QPainter API that the slide layout code
+    uses (save/restore, translate, setFont/setPen, drawText, drawRect,
+    drawPixmap) but records absolute draw operations instead of painting.
+    Text is kept as prepared QStaticText and pixmaps are stored already
+    scaled, so replay() is a flat sequence of draw calls.
+    """
+
+    def __init__(self):
+        self.ops = []
+        self._dx = 0.0
+        self._dy = 0.0
+        self._font = QFont()
+        self._pen = QPen()
+        self._stack = []
+
+    # --- QPainter-compatible recording API ---
+
+    def save(self):
+        self._stack.append((self._dx, self._dy, self._font, self._pen))
+
+    def restore(self):
+        self._dx, self._dy, self._font, self._pen = self._stack.pop()
+
+    def translate(self, dx, dy):
+        self._dx += dx
+        self._dy += dy
+
+    def font(self):
+        return QFont(self._font)
+
+    def setFont(self, font):
+        self._font = QFont(font)
+
+    def setPen(self, pen):
+        self._pen = QPen(pen)
+
+    def fontMetrics(self):
+        return QFontMetrics(self._font)
+
+    def drawText(self, x, y, text):
+        if not text:
+            return
+        static = QStaticText(text)
+        static.setTextFormat(Qt.TextFormat.PlainText)
+        static.prepare(QTransform(), self._font)
+        # drawText takes the baseline, drawStaticText the top-left corner
+        top = self._dy + y - QFontMetricsF(self._font).ascent()
+        self.ops.append(
+            (_TEXT, QPointF(self._dx + x, top), static, self._font, self._pen)
+        )
+
+    def drawRect(self, x, y, w, h):
+        self.ops.append((_RECT, QRectF(self._dx + x, self._dy + y, w, h), self._pen))
+
+    def drawPixmap(self, x, y, pixmap):
+        self.ops.append((_PIXMAP, QPointF(self._dx + x, self._dy + y), pixmap))
+
+    # --- Playback ---
+
+    def replay(self, painter):
+        painter.save()
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        for op in self.ops:
+            kind = op[0]
+            if kind == _TEXT:
+                _, pos, static, font, pen = op
+                painter.setFont(font)
+                painter.setPen(pen)
+                painter.drawStaticText(pos, static)
+            elif kind == _RECT:
+                _, rect, pen = op
+                painter.setPen(pen)
+                painter.drawRect(rect)
+            else:
+                _, pos, pixmap = op
+                painter.drawPixmap(pos, pixmap)
+        painter.restore()
@@ -7,32 +7,82 @@ from PyQt6.QtCore import QFileSystemWatcher, Qt, QTimer
 from PyQt6.QtGui import QGuiApplication, QRegion
 from PyQt6.QtWidgets import QVBoxLayout, QWidget
 
+from src.infrastructure.command_server import CommandServer
 from src.infrastructure.config import (
     DATA_FILE,
-    get_config_dir,
+    config_store,
+    current_class_state,
+    flush_data,
     get_current_class_data,
-    load_data,
-    save_data,
+    get_snapshot,
+    update_data,
 )
+from src.infrastructure.ipc import PID_FILE, get_socket_name, write_pid_file
 from src.infrastructure.signals import signals
+from src.presentation.components.frame_clock import get_frame_clock
+from src.presentation.components.latex_renderer import get_latex_renderer
 from src.presentation.components.rough_box import RoughBoxWidget
 from src.presentation.components.rough_pill import RoughPillWidget
 from src.presentation.components.sliding_stacked_widget import SlidingStackedWidget
-from src.presentation.slides import TextInfoSlide, create_slide
-from src.presentation.slides.chart_slide import BarChartSlide
-
-PID_FILE = get_config_dir() / "app.pid"
+from src.presentation.slides import SLIDE_TYPES, create_slide
+
+DEFAULT_LIVE_SLIDES = 4
+DEFAULT_PRELOAD_RADIUS = 1
+DEFAULT_PREROLL_SECONDS = 2
+
+
+def match_slides(entries, configs):
+    """
+    Pairs each slide config with an existing slide entry (or None). Slides
+    with a uid only match the same uid; a slide without one, or an old entry
+    written before uids existed, falls back to an identical config and then
+    to the first unclaimed entry of the same type, in order.
+    """
+    free = list(entries)
+    matched = [None] * len(configs)
+
+    def claim(i, entry):
+        if any(e is entry for e in free):
+            matched[i] = entry
+            free.remove(entry)
+
+    by_uid = {e["config"].get("uid"): e for e in entries if e["config"].get("uid")}
+    for i, s in enumerate(configs):
+        entry = by_uid.get(s.get("uid"))
+        if entry is not None and entry["config"].get("type") == s.get("type"):
+            claim(i, entry)
+
+    for i, s in enumerate(configs):
+        if matched[i] is None:
+            entry = next((e for e in free if e["config"] == s), None)
+            if entry is not None:
+                claim(i, entry)
+
+    for i, s in enumerate(configs):
+        if matched[i] is not None:
+            continue
+        for e in free:
+            if e["config"].get("type") != s.get("type"):
+                continue
+            if s.get("uid") and e["config"].get("uid"):
+                continue  # Two different slides
+            claim(i, e)
+            break
+
+    return matched
 
 
 class SlideScrollerApp(QWidget):
     def __init__(self):
         super().__init__()
-        # Write PID
-        PID_FILE.write_text(str(os.getpid()))
+        # Commands from `ssc`; the PID file tells the CLI where to find them
+        self.command_server = CommandServer(
+            get_socket_name(os.getpid()), self.handle_command, self
+        )
+        write_pid_file(self.command_server.name)
 
         # Load initial data
-        load_data()
-        d = load_data()
+        d = get_snapshot()
         cfg = d.get("global_config", {})
 
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
@@ -64,6 +114,7 @@ class SlideScrollerApp(QWidget):
 
         self.slides_data = []
         self.current_index = 0
+        self.preroll_index = -1
         self.locked_slide_index = -1
         self.dock_alignment = "default"
         self._is_docking = False
@@ -75,13 +126,10 @@ class SlideScrollerApp(QWidget):
         self.timer_label = RoughPillWidget(self)
         self.timer_label.show()
 
-        self.clock_timer = QTimer(self)
-        self.clock_timer.timeout.connect(self.tick)
-        self.clock_timer.start(1000)
-
-        self.keep_on_top_timer = QTimer(self)
-        self.keep_on_top_timer.timeout.connect(self.force_keep_on_top)
-        self.keep_on_top_timer.start(500)
+        # Slide countdown and stay-on-top share the animation frame clock
+        clock = get_frame_clock()
+        self.clock_tick = clock.register(self.tick, 1000)
+        self.keep_on_top_tick = clock.register(self.force_keep_on_top, 500)
 
         self.watcher = QFileSystemWatcher(self)
         if DATA_FILE.exists():
@@ -93,18 +141,17 @@ class SlideScrollerApp(QWidget):
         signals.lock_slide.connect(self.set_lock)
         signals.close_app.connect(self.force_close)
 
-        self.rebuild()
-
         cls = get_current_class_data()
         saved_lock = cls.get("state", {}).get("locked_slide", -1)
         saved_last = cls.get("state", {}).get("last_slide_index", 0)
 
+        # Start where we left off, so only that slide's neighbours get built
+        self.current_index = saved_lock if saved_lock != -1 else saved_last
+        self.rebuild()
+
         if saved_lock != -1:
             self.set_lock(saved_lock)
-        elif saved_last < len(self.slides_data):
-            self.current_index = saved_last
-            if self.stack.count() > self.current_index:
-                self.stack.setCurrentIndex(self.current_index)
+        else:
             self.update_view()
 
         self.flags = (
@@ -124,13 +171,10 @@ class SlideScrollerApp(QWidget):
         self._last_event_ts = 0
 
     def set_lock(self, idx):
-        d = load_data()
-        cid = d["global_config"]["current_class_id"]
-        if "state" not in d["classes"][cid]:
-            d["classes"][cid]["state"] = {}
-        d["classes"][cid]["state"]["locked_slide"] = idx
-        save_data(d)
+        def lock(d):
+            current_class_state(d)["locked_slide"] = idx
 
+        update_data(lock)
         self.set_lock_internal(idx)
 
     def set_lock_internal(self, idx):
@@ -138,14 +182,17 @@ class SlideScrollerApp(QWidget):
         if idx != -1 and idx < len(self.slides_data):
             self.current_index = idx
             self.rem_time = self.slides_data[idx]["time"]
-            self.stack.slide_to(idx)
+            self.show_slide(idx)
             self.update_view()
         self.update_overlay_pos()
 
     def _cleanup_and_exit(self):
+        self.command_server.close()
         if PID_FILE.exists():
             PID_FILE.unlink()
         self.save_geo()
+        flush_data()
+        get_latex_renderer().shutdown()
 
     def force_close(self):
         self._cleanup_and_exit()
@@ -156,57 +203,31 @@ class SlideScrollerApp(QWidget):
         event.accept()
 
     def save_geo(self):
-        d = load_data()
-        if not d:
-            d = {}
-
-        if "global_config" not in d:
-            d["global_config"] = {}
-        cfg = d["global_config"]
-
-        # Check if changed
-        current_x = self.pos().x()
-        current_y = self.pos().y()
-        current_w = self.width()
-        current_h = self.height()
-
-        old_x = cfg.get("x", 100)
-        old_y = cfg.get("y", 100)
-        old_w = cfg.get("width", 600)
-        old_h = cfg.get("height", 500)
-        old_last_slide = (
-            d.get("classes", {})
-            .get(cfg.get("current_class_id", "Geral"), {})
-            .get("state", {})
-            .get("last_slide_index", 0)
-        )
+        cfg = get_snapshot().get("global_config", {})
+        state = get_current_class_data().get("state", {})
+        x, y = self.pos().x(), self.pos().y()
+        w, h = self.width(), self.height()
+        index = self.current_index
 
-        curr_id = cfg.get("current_class_id", "Geral")
-        if "classes" not in d:
-            d["classes"] = {}
-        if curr_id not in d["classes"]:
-            d["classes"][curr_id] = {}
-        if "state" not in d["classes"][curr_id]:
-            d["classes"][curr_id]["state"] = {}
-
-        # Update values
-        cfg["x"] = current_x
-        cfg["y"] = current_y
-        cfg["width"] = current_w
-        cfg["height"] = current_h
-        d["classes"][curr_id]["state"]["last_slide_index"] = self.current_index
-
-        # Avoid unnecessary writes if nothing changed (prevents reload loop)
+        # Avoid unnecessary writes if nothing changed
         if (
-            current_x == old_x
-            and current_y == old_y
-            and current_w == old_w
-            and current_h == old_h
-            and self.current_index == old_last_slide
+            x == cfg.get("x", 100)
+            and y == cfg.get("y", 100)
+            and w == cfg.get("width", 600)
+            and h == cfg.get("height", 500)
+            and index == state.get("last_slide_index", 0)
         ):
             return
 
-        save_data(d)
+        def store(d):
+            cfg = d.setdefault("global_config", {})
+            cfg["x"] = x
+            cfg["y"] = y
+            cfg["width"] = w
+            cfg["height"] = h
+            current_class_state(d)["last_slide_index"] = index
+
+        update_data(store)
 
     def mousePressEvent(self, e):
         if e.modifiers() & Qt.KeyboardModifier.AltModifier:
@@ -225,17 +246,20 @@ class SlideScrollerApp(QWidget):
         if str(DATA_FILE) not in self.watcher.files() and DATA_FILE.exists():
             self.watcher.addPath(str(DATA_FILE))
 
-        # Load new data to check if we really need to rebuild
+        # Our own write-behind saves echo back here; nothing to reload
+        if not config_store.changed_on_disk():
+            return
+
+        # Load new data to check if we really need to rebuild.
+        # The store parses the file once; every update_data subscriber
+        # below then reads the same cached snapshot.
         try:
-            new_data = load_data()
-            new_cls = new_data.get("classes", {}).get(
-                new_data.get("global_config", {}).get("current_class_id", "Geral"), {}
-            )
-            new_slides = new_cls.get("active_slides", [])
+            new_data = get_snapshot()
+            new_slides = get_current_class_data().get("active_slides", ())
 
             # Compare with current slides structure
             # We reconstruct the simple list of types/durations to compare
-            current_slides_config = []
+            current_slides_config = ()
             if hasattr(self, "_last_loaded_slides"):
                 current_slides_config = self._last_loaded_slides
 
@@ -264,69 +288,166 @@ class SlideScrollerApp(QWidget):
             pass  # Swallow errors to prevent crash
 
     def rebuild(self):
+        """
+        Reconciles the slide list with active_slides. Existing slides are
+        matched to the new configs (by uid, then by identical config, then
+        by type in order for slides without a uid), kept, moved and updated
+        in place via apply_config; only leftover widgets are destroyed. New
+        slides start as bare entries and get a widget from the pool.
+        """
         cls = get_current_class_data()
-        new_slides_config = cls.get("active_slides", [])
-
-        # Access old config
-        old_slides_config = []
-        if hasattr(self, "_last_loaded_slides"):
-            old_slides_config = self._last_loaded_slides
-
-        # Check if we are currently showing the "No Slides" placeholder
-        is_placeholder = (not old_slides_config) and (len(self.slides_data) > 0)
-
-        match_count = 0
-        if not is_placeholder:
-            # Find matching prefix
-            for i in range(min(len(new_slides_config), len(old_slides_config))):
-                if new_slides_config[i] == old_slides_config[i]:
-                    match_count += 1
-                else:
-                    break
-
-        # 1. Remove non-matching tail
-        while len(self.slides_data) > match_count:
-            data = self.slides_data.pop()
+        new_slides_config = cls.get("active_slides", ())
+
+        current = self.stack.currentWidget()
+        old_entries = [e for e in self.slides_data if e["config"] is not None]
+        matched = match_slides(old_entries, new_slides_config)
+
+        entries = []
+        for s, entry in zip(new_slides_config, matched):
+            if s.get("type") not in SLIDE_TYPES:
+                continue
+            if entry is not None and entry["widget"] is not None:
+                if entry["config"] != s:
+                    if hasattr(entry["widget"], "apply_config"):
+                        entry["widget"].apply_config(s)
+                    else:
+                        entry = None
+            if entry is None:
+                entry = {"widget": None}
+            entry["config"] = s
+            entry["time"] = s.get("duration", 10)
+            entries.append(entry)
+
+        # Handle Empty Case (reusing a placeholder that is already there)
+        if not entries:
+            placeholder = [e for e in self.slides_data if e["config"] is None]
+            if placeholder:
+                entries = placeholder
+            else:
+                w = create_slide("text")
+                w.messages = ["# No Slides"]
+                entries = [{"widget": w, "time": 5, "config": None}]
+
+        # Destroy widgets that have no place in the new list
+        kept = {id(e["widget"]) for e in entries if e["widget"] is not None}
+        replaced_current = False
+        for data in self.slides_data:
             w = data["widget"]
-            if hasattr(w, "cleanup"):
-                w.cleanup()
-            self.stack.removeWidget(w)
-            w.deleteLater()
-
-        # 2. Add new widgets
-        for i in range(match_count, len(new_slides_config)):
-            s = new_slides_config[i]
-            t = s["type"]
-            dur = s.get("duration", 10)
-            w = create_slide(t, slide_config=s)
-            if w:
-                self.stack.addWidget(w)
-                self.slides_data.append({"widget": w, "time": dur})
-
-        # 3. Handle Empty Case
-        if not self.slides_data:
-            w = TextInfoSlide()
-            w.messages = [{"content": "# No Slides", "duration": 5}]
-            self.stack.addWidget(w)
-            self.slides_data.append({"widget": w, "time": 5})
-
+            if w is None or id(w) in kept:
+                continue
+            replaced_current = replaced_current or w is current
+            self.destroy_slide_widget(w)
+
+        # Bring the stack into the new order, moving only what is misplaced
+        live = [e["widget"] for e in entries if e["widget"] is not None]
+        moved = False
+        for i, w in enumerate(live):
+            if self.stack.indexOf(w) != i:
+                if self.stack.indexOf(w) != -1:
+                    self.stack.removeWidget(w)
+                    moved = True
+                self.stack.insertWidget(i, w)
+
+        self.slides_data = entries
         self._last_loaded_slides = new_slides_config
 
-        # 4. Restore State
+        # Restore State
         self.locked_slide_index = cls.get("state", {}).get("locked_slide", -1)
 
-        if self.current_index >= len(self.slides_data):
+        # Follow the slide on screen to its new position
+        index = next(
+            (i for i, e in enumerate(entries) if e["widget"] is current), None
+        )
+        if current is not None and not replaced_current and index is not None:
+            self.current_index = index
+        elif self.current_index >= len(self.slides_data):
             self.current_index = 0
 
         # Update view/timer logic
-        if self.current_index < len(self.slides_data):
-            self.stack.setCurrentIndex(self.current_index)
-
-            if self.current_index >= match_count:
-                self.update_view()
+        self.show_slide(self.current_index, animate=False)
+        if moved:
+            # Removals made other pages current for a moment (StackAll shows them)
+            for w in live:
+                if w is not self.stack.currentWidget():
+                    w.hide()
+        if replaced_current or current is None:
+            self.update_view()
 
+        self.update_pool()
         self.update_overlay_pos()
 
+    def slide_widget(self, index):
+        """Returns the widget of slide index, creating it if it is not live."""
+        entry = self.slides_data[index]
+        if entry["widget"] is None:
+            config = entry["config"]
+            w = create_slide(config["type"], slide_config=config)
+            # Live widgets sit in the stack in slide order
+            pos = sum(1 for e in self.slides_data[:index] if e["widget"] is not None)
+            entry["widget"] = w
+            self.stack.insertWidget(pos, w)
+        return entry["widget"]
+
+    def release_slide(self, index):
+        """Destroys the widget of slide index; it is rebuilt when next needed."""
+        entry = self.slides_data[index]
+        if entry["widget"] is None or entry["config"] is None:
+            return
+        w, entry["widget"] = entry["widget"], None
+        self.destroy_slide_widget(w)
+
+    def destroy_slide_widget(self, w):
+        if hasattr(w, "cleanup"):
+            w.cleanup()
+        self.stack.removeWidget(w)
+        w.deleteLater()
+
+    def show_slide(self, index, animate=True):
+        """Makes slide index current, sliding to it unless animate is False."""
+        self.current_index = index
+        page = self.stack.indexOf(self.slide_widget(index))
+        if animate:
+            self.stack.slide_to(page)
+        else:
+            self.stack.setCurrentIndex(page)
+
+    def slide_distance(self, index):
+        """Steps between slide index and the current one, either way round."""
+        ahead = (index - self.current_index) % len(self.slides_data)
+        return min(ahead, len(self.slides_data) - ahead)
+
+    def pool_config(self):
+        return get_snapshot().get("global_config", {}).get("slide_pool", {})
+
+    def update_pool(self):
+        """
+        Keeps widgets only for the slides within `slide_pool.radius` steps of
+        the current one, at most `slide_pool.live` of them (farthest released
+        first). The current, locked, pre-rolled and on-screen slides always
+        stay live. Everything else is a bare config entry until it comes into
+        range.
+        """
+        if not self.slides_data:
+            return
+        pool = self.pool_config()
+        radius = max(0, int(pool.get("radius", DEFAULT_PRELOAD_RADIUS)))
+        budget = max(1, int(pool.get("live", DEFAULT_LIVE_SLIDES)))
+
+        pinned = {self.current_index, self.locked_slide_index, self.preroll_index}
+        by_distance = sorted(
+            range(len(self.slides_data)),
+            key=lambda i: (i not in pinned, self.slide_distance(i)),
+        )
+        wanted = {i for i in by_distance[:budget] if self.slide_distance(i) <= radius}
+        wanted |= pinned & set(by_distance)
+
+        on_screen = self.stack.pages_on_screen()
+        for i, entry in enumerate(self.slides_data):
+            if i not in wanted and not any(entry["widget"] is w for w in on_screen):
+                self.release_slide(i)
+        for i in sorted(wanted):
+            self.slide_widget(i)
+
     def update_ui_from_config(self, data):
         # handle updates that don't require full rebuild
         # e.g. check lock state
@@ -367,6 +488,7 @@ class SlideScrollerApp(QWidget):
         if new_lock != self.locked_slide_index:
             self.set_lock_internal(new_lock)
 
+        self.update_pool()
         self.update_overlay_pos()
 
         # Check for dock action
@@ -401,25 +523,73 @@ class SlideScrollerApp(QWidget):
                 self.process_event(event)
 
     def process_event(self, event):
+        # Legacy path: events written into dashboard.json by an `ssc` that
+        # could not reach the command channel
         match event.get("type"):
             case "inc":
-                # Find chart slide
-                chart_idx = -1
-                for i, s in enumerate(self.slides_data):
-                    if isinstance(s["widget"], BarChartSlide):
-                        chart_idx = i
-                        break
-
-                if chart_idx != -1:
-                    # Switch if needed
-                    if self.current_index != chart_idx:
-                        self.current_index = chart_idx
-                        self.stack.slide_to(chart_idx)
-                        self.update_view()
-
-                    # Trigger effect
-                    w = self.slides_data[chart_idx]["widget"]
-                    w.trigger_increment_effect(event.get("bar_id"), event.get("val"))
+                error = self.increment_bar(event.get("bar_id"), event.get("val"))
+                if error:
+                    print(error)
+
+    def handle_command(self, command):
+        """
+        Applies one command from the command channel. Returns None on success
+        or an error message for the CLI to print.
+        """
+        match command.get("type"):
+            case "inc":
+                return self.increment_bar(command.get("bar_id"), command.get("val"))
+            case "dock":
+                pos = command.get("pos")
+                if pos not in ("tl", "tr", "bl", "br"):
+                    return f"Unknown dock position: {pos}"
+                margin = get_snapshot().get("global_config", {}).get("dock_margin", 20)
+                self.process_dock(pos, margin)
+            case "lock":
+                idx = int(command.get("id", -1))
+                if not 0 <= idx < len(self.slides_data):
+                    return f"Index {idx} out of range"
+                self.set_lock(idx)
+            case "unlock":
+                self.set_lock(-1)
+            case other:
+                return f"Unknown command: {other}"
+        return None
+
+    def increment_bar(self, bar_id, val):
+        bars = get_current_class_data().get("bars", ())
+        bar_id, val = int(bar_id), float(val)
+        if not 0 <= bar_id < len(bars):
+            return f"Bar ID {bar_id} out of range"
+
+        def add(d):
+            cid = d.get("global_config", {}).get("current_class_id", "Geral")
+            bars = d.get("classes", {}).get(cid, {}).get("bars", [])
+            if 0 <= bar_id < len(bars):
+                bars[bar_id] += val
+
+        update_data(add)
+        # The watcher ignores this write as our own, so announce it here:
+        # every live chart, not just the one celebrating, shows the new bars
+        signals.update_data.emit()
+
+        # Find chart slide
+        chart_idx = -1
+        for i, s in enumerate(self.slides_data):
+            if (s["config"] or {}).get("type") == "chart":
+                chart_idx = i
+                break
+
+        if chart_idx != -1:
+            # Switch if needed
+            if self.current_index != chart_idx:
+                self.show_slide(chart_idx)
+                self.update_view()
+
+            # Trigger effect
+            w = self.slide_widget(chart_idx)
+            w.trigger_increment_effect(bar_id)
+        return None
 
     def process_dock(self, pos, margin):
         screen = self.screen()
@@ -438,7 +608,7 @@ class SlideScrollerApp(QWidget):
         w, h = self.width(), self.height()
 
         # Get taskbar offset
-        d = load_data()
+        d = get_snapshot()
         taskbar_offset = d.get("global_config", {}).get("taskbar_offset", 0)
         logging.info(
             f"Process Dock: pos={pos}, margin={margin}, taskbar_offset={taskbar_offset}"
@@ -497,10 +667,12 @@ class SlideScrollerApp(QWidget):
     def update_mask_shape(self, path):
         region = QRegion(path.toFillPolygon().toPolygon())
         self.stack.setMask(region)
-        # Force update/repaint, especially important for WebEngineView
-        self.stack.update()
+        # Force update/repaint, especially important for WebEngineView. The
+        # mask only moves inside the border band, so that is all we repaint.
+        band = self.frame.border_region().translated(-self.stack.pos())
+        self.stack.update(band)
         if self.stack.currentWidget():
-            self.stack.currentWidget().update()
+            self.stack.currentWidget().update(band)
 
     def update_ui(self):
         self.update_overlay_pos()
@@ -582,25 +754,42 @@ class SlideScrollerApp(QWidget):
 
         d = self.slides_data[self.current_index]
         self.rem_time = d["time"]
-        cw = d["widget"]
-
-        if hasattr(cw, "start_animation"):
-            cw.start_animation()
-
+        self.preroll_index = -1
         self.update_overlay_pos()
 
     def tick(self):
+        if not self.stack.transition_active:
+            self.update_pool()
         if self.locked_slide_index != -1:
             return
         self.rem_time -= 1
         self.update_overlay_pos()
         if self.rem_time <= 0:
             self.next_slide()
+        elif self.preroll_index == -1:
+            preroll = self.pool_config().get("preroll", DEFAULT_PREROLL_SECONDS)
+            if self.rem_time <= preroll:
+                self.preroll()
+
+    def preroll(self):
+        """
+        Readies the next slide off-screen ahead of the switch: builds its
+        widget, sizes it to the page, runs its warm_up hook and paints it
+        once, so layouts, page pixmaps and the chart's Agg buffer are cached
+        and the transition starts from a finished frame.
+        """
+        index = (self.current_index + 1) % len(self.slides_data)
+        if index == self.current_index:
+            return
+        self.preroll_index = index
+        w = self.slide_widget(index)
+        w.setGeometry(self.stack.rect())
+        if hasattr(w, "warm_up"):
+            w.warm_up()
+        if getattr(w, "supports_snapshot", True):
+            w.grab()
 
     def next_slide(self):
-        cw = self.slides_data[self.current_index]["widget"]
-        if hasattr(cw, "stop_animation"):
-            cw.stop_animation()
-        self.current_index = (self.current_index + 1) % len(self.slides_data)
-        self.stack.slide_to(self.current_index)
+        # The stack starts and stops slide animations via on_shown/on_hidden
+        self.show_slide((self.current_index + 1) % len(self.slides_data))
         self.update_view()
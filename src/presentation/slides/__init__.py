@@ -1,21 +1,39 @@
-from .chart_slide import BarChartSlide
-from .deadline_slide import DeadlineSlide
-from .text_slide import TextInfoSlide
-from .web_slide import WebSlide
+from importlib import import_module
 
 # ImageSlide is not fully used yet but we can add it if needed
 
+# Slide type -> (module, class). A slide module, and whatever heavy
+# dependencies it pulls in (matplotlib, QtWebEngine, ...), is only imported
+# the first time a slide of that type is created.
+SLIDE_TYPES = {
+    "chart": ("chart_slide", "BarChartSlide"),
+    "text": ("text_slide", "TextInfoSlide"),
+    "deadline": ("deadline_slide", "DeadlineSlide"),
+    "web": ("web_slide", "WebSlide"),
+}
+
+
+def get_slide_class(slide_type):
+    entry = SLIDE_TYPES.get(slide_type)
+    if entry is None:
+        return None
+    module, name = entry
+    return getattr(import_module(f".{module}", __name__), name)
+
 
 def create_slide(slide_type, slide_config=None, **kwargs):
     if slide_config is None:
         slide_config = {}
 
-    if slide_type == "chart":
-        return BarChartSlide(slide_config=slide_config)
-    elif slide_type == "text":
-        return TextInfoSlide(slide_config=slide_config)
-    elif slide_type == "deadline":
-        return DeadlineSlide(slide_config=slide_config)
-    elif slide_type == "web":
-        return WebSlide(slide_config=slide_config)
-    return None
+    cls = get_slide_class(slide_type)
+    if cls is None:
+        return None
+    return cls(slide_config=slide_config)
+
+
+def __getattr__(name):
+    # Keeps `from src.presentation.slides import BarChartSlide` working
+    for module, cls in SLIDE_TYPES.values():
+        if cls == name:
+            return getattr(import_module(f".{module}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
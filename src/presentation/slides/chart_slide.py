@@ -1,27 +1,60 @@
-import matplotlib
-from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QVBoxLayout, QWidget
-
-matplotlib.use("QtAgg")
+import ctypes
 import math
-import random
 
-import matplotlib.patheffects as path_effects
 import numpy as np
-from matplotlib.animation import FuncAnimation
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
 from PyQt6.QtCore import (
     QEasingCurve,
     QPoint,
+    QPointF,
     QPropertyAnimation,
+    QRect,
+    Qt,
     QTimer,
     pyqtProperty,
 )
-from PyQt6.QtGui import QBrush, QColor, QPainter, QPixmap
+from PyQt6 import sip
+from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap
+from PyQt6.QtWidgets import QVBoxLayout, QWidget
 
-from src.infrastructure.config import get_current_class_data, load_data
+from src.infrastructure.config import get_current_class_data, get_snapshot
 from src.infrastructure.signals import signals
+from src.presentation.components.frame_clock import get_frame_clock
+from src.presentation.components.painter_chart_renderer import (
+    get_painter_chart_renderer,
+)
+
+# One breathing cycle, rounded to whole frames (was 0.15 rad/frame, ~41.9
+# frames) so the pre-rendered loop wraps around seamlessly.
+_BREATH_FRAMES = 42
+_BREATH_STEP = 2 * math.pi / _BREATH_FRAMES
+_RING_BUDGET_BYTES = 64 * 1024 * 1024
+
+# visuals.chart_engine: mplot3d/Agg, or the lightweight QPainter renderer
+CHART_ENGINES = ("matplotlib", "qpainter")
+DEFAULT_CHART_ENGINE = "matplotlib"
+
+_CHART_FRAME_MS = 50
+_CONFETTI_FRAME_MS = 16
+
+# Distinct widths in the happy character's spin (frames of scale_x)
+_SPIN_STEPS = 24
+
+CONFETTI_PARTICLES = 300
+_CONFETTI_COLORS = 32
+_CONFETTI_SPRITE = 16
+
+# Unit cube faces in the order Axes3D.bar3d emits them (-z, +z, -y, +y, -x, +x)
+_CUBOID = np.array(
+    [
+        ((0, 0, 0), (0, 1, 0), (1, 1, 0), (1, 0, 0)),
+        ((0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1)),
+        ((0, 0, 0), (1, 0, 0), (1, 0, 1), (0, 0, 1)),
+        ((0, 1, 0), (0, 1, 1), (1, 1, 1), (1, 1, 0)),
+        ((0, 0, 0), (0, 0, 1), (0, 1, 1), (0, 1, 0)),
+        ((1, 0, 0), (1, 1, 0), (1, 1, 1), (1, 0, 1)),
+    ],
+    dtype=float,
+)
 
 
 class HappyCharacterWidget(QWidget):
@@ -35,6 +68,9 @@ class HappyCharacterWidget(QWidget):
         assets_dir = Path(__file__).parent.parent.parent / "assets"
         self.pixmap = QPixmap(str(assets_dir / "happy.png"))
         self._rotation_y = 0.0
+        self._fitted = None
+        self._fitted_key = None
+        self._spin_frames = None
 
         # Timer for auto-hide
         self.hide_timer = QTimer(self)
@@ -52,46 +88,66 @@ class HappyCharacterWidget(QWidget):
 
     rotation_y = pyqtProperty(float, get_rotation_y, set_rotation_y)
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
-
-        # Center point
-        w = self.width()
-        h = self.height()
-        cx = w / 2
-        cy = h / 2
+    def fitted_pixmap(self):
+        """The source image scaled to fit the widget, at device resolution."""
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr)
+        if self._fitted_key != key:
+            fitted = self.pixmap.scaled(
+                round(self.width() * dpr),
+                round(self.height() * dpr),
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+            fitted.setDevicePixelRatio(dpr)
+            self._fitted = fitted
+            self._fitted_key = key
+            self._spin_frames = None
+        return self._fitted
+
+    def spin_frames(self):
+        """
+        The Y-axis spin baked into horizontally squeezed copies of the fitted
+        image; frame i is scale_x = i / _SPIN_STEPS (frame 0 is edge-on and
+        draws nothing).
+        """
+        fitted = self.fitted_pixmap()
+        if self._spin_frames is None:
+            frames = [None]
+            for i in range(1, _SPIN_STEPS):
+                frame = fitted.scaled(
+                    max(1, round(fitted.width() * i / _SPIN_STEPS)),
+                    fitted.height(),
+                    Qt.AspectRatioMode.IgnoreAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation,
+                )
+                frame.setDevicePixelRatio(fitted.devicePixelRatio())
+                frames.append(frame)
+            frames.append(fitted)
+            self._spin_frames = frames
+        return self._spin_frames
 
+    def paintEvent(self, event):
         # Calculate scale to simulate Y-axis rotation
         scale_x = abs(math.cos(math.radians(self._rotation_y)))
+        frame = self.spin_frames()[round(scale_x * _SPIN_STEPS)]
+        if frame is None or frame.isNull():
+            return
 
-        painter.translate(cx, cy)
-
-        # Apply Y-rotation (flipping - vertical axis spin)
-        painter.scale(scale_x, 1.0)
-
-        painter.translate(-cx, -cy)
-
-        # Scale pixmap to fit widget bounds while preserving aspect ratio
-        scaled_pixmap = self.pixmap.scaled(
-            w,
-            h,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
-
-        # Center the scaled pixmap
-        px = (w - scaled_pixmap.width()) / 2
-        py = (h - scaled_pixmap.height()) / 2
+        # Center the frame; whole pixels so the blit needs no resampling
+        dpr = frame.devicePixelRatio()
+        px = round((self.width() - frame.width() / dpr) / 2)
+        py = round((self.height() - frame.height() / dpr) / 2)
 
-        painter.drawPixmap(int(px), int(py), scaled_pixmap)
+        painter = QPainter(self)
+        painter.drawPixmap(px, py, frame)
 
     def play(self, invert=False):
         self.show()
         self.raise_()
 
         self._rotation_y = 0.0
+        self.spin_frames()  # Resample before the animation, not during it
         parent_h = self.parent().height()
         start_pos = QPoint(-300, parent_h)
         end_pos = QPoint(50, parent_h - 350)
@@ -134,46 +190,47 @@ class HappyCharacterWidget(QWidget):
         self.out_anim.start()
 
 
-class BarChartCanvas(FigureCanvas):
+class BarChartCanvas(QWidget):
     def __init__(self):
-        self.fig = Figure(figsize=(5, 5), dpi=100)
-        super().__init__(self.fig)
-        self.fig.patch.set_alpha(0)
-
-        # FULL CENTERING: No margins on the figure itself
-        self.fig.subplots_adjust(left=0, right=1, bottom=0, top=1)
-
+        super().__init__()
         self.setStyleSheet("background: transparent;")
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
 
-        self.ax = self.fig.add_subplot(111, projection="3d")
-        self.ax.dist = 4.0  # Maximum zoom
         self.colors = ["#ff007f", "#00e5ff", "#ffcc00", "#bd93f9", "#50fa7b"]
 
         self.load_configs()
         signals.update_data.connect(self.load_configs)
 
+        self.frame = 0
+
+        # Cuboid faces of the latest frame, rendered on the next paint
+        self._polys = None
+        self._pending = False
+        # What paintEvent shows: (QImage, origin, labels)
+        self._shown = None
+
+        # Pre-rendered breathing cycle: phase index -> (QImage, origin, ())
+        self._ring = {}
+        self._ring_key = None
+        self._ring_enabled = False
+        self._ring_bytes = 0
+
         self.anim = None
         self.is_running = False
         self.init_animation()
 
     def init_animation(self):
-        self.anim = FuncAnimation(
-            self.fig, self.update_plot, interval=50, cache_frame_data=False
-        )
-        self.anim.event_source.stop()
+        # Frame clock subscription while running; anim is falsy after cleanup
+        self.anim = True
+        self.anim_tick = None
 
     def cleanup(self):
-        if self.anim:
-            try:
-                self.anim.event_source.stop()
-            except Exception:
-                pass
-            self.anim = None
+        self.stop_animation()
+        self.anim = None
 
     def load_configs(self):
         cls = get_current_class_data()
-        d = load_data()
+        d = get_snapshot()
         self.logic_values = np.array(cls.get("bars", [5.0]), dtype=float)
 
         # Initialize display values if first run
@@ -187,6 +244,9 @@ class BarChartCanvas(FigureCanvas):
         vis = d.get("global_config", {}).get("visuals", {})
         self.intensity = vis.get("breathing_intensity", 0.2)
         self.bar_alpha = vis.get("bar_alpha", 0.85)
+        self.engine = vis.get("chart_engine", DEFAULT_CHART_ENGINE)
+        if self.engine not in CHART_ENGINES:
+            self.engine = DEFAULT_CHART_ENGINE
 
         self.num_bars = len(self.logic_values)
         self.x_pos = np.arange(self.num_bars) * 0.6
@@ -195,15 +255,38 @@ class BarChartCanvas(FigureCanvas):
         self.dx_base = 0.4
         self.dy_base = 0.4
 
+        self.label_colors = [
+            self.colors[i % len(self.colors)] for i in range(self.num_bars)
+        ]
+        self.label_x = self.x_pos + self.dx_base / 2
+        self.label_y = self.y_pos + self.dy_base / 2
+        self.value_z = np.maximum(self.display_values, 0.1) + 0.5
+
     def start_animation(self):
         if not self.is_running and self.anim:
-            self.anim.event_source.start()
+            self.anim_tick = get_frame_clock().register(
+                self.next_frame, _CHART_FRAME_MS, widget=self
+            )
             self.is_running = True
 
+    def warm_up(self):
+        """Queues the next frame while hidden, so a grab() renders it."""
+        if self.anim and not self.is_running:
+            self.update_plot(self.frame)
+
     def stop_animation(self):
-        if self.is_running and self.anim:
-            self.anim.event_source.stop()
-            self.is_running = False
+        if self.anim_tick is not None:
+            get_frame_clock().unregister(self.anim_tick)
+            self.anim_tick = None
+        self.is_running = False
+        self.release_ring()
+        # A hidden chart keeps only its arrays; any later paint renders again
+        self._shown = None
+        self._pending = self._polys is not None
+
+    def next_frame(self):
+        self.frame += 1
+        self.update_plot(self.frame)
 
     def update_plot(self, frame):
         if not self.anim:
@@ -212,156 +295,290 @@ class BarChartCanvas(FigureCanvas):
         # Smooth interpolation towards logic_values
         # Move 5% of the difference per frame
         diff = self.logic_values - self.display_values
-        if np.max(np.abs(diff)) > 0.01:
+        settled = np.max(np.abs(diff)) <= 0.01
+        if not settled:
             self.display_values += diff * 0.05
         else:
             self.display_values = np.copy(self.logic_values)
 
-        self.ax.clear()
-        self.ax.set_axis_off()
-        self.ax.set_facecolor((0, 0, 0, 0))
-        for axis in [self.ax.xaxis, self.ax.yaxis, self.ax.zaxis]:
-            axis.set_pane_color((0, 0, 0, 0))
+        # Once values settle the animation is purely periodic: the first
+        # cycle is recorded as it is drawn and then played back as blits.
+        phase_idx = frame % _BREATH_FRAMES
+        ring_key = self.current_ring_key() if settled else None
+        if ring_key != self._ring_key:
+            self.release_ring()
+            self._ring_key = ring_key
+            self._ring_enabled = ring_key is not None
+
+        if self._ring_enabled and phase_idx in self._ring:
+            self._shown = self._ring[phase_idx]
+            self._pending = False
+            self.update()
+            return
 
-        osc = np.sin(frame * 0.15 + np.arange(self.num_bars))
+        osc = np.sin(phase_idx * _BREATH_STEP + np.arange(self.num_bars))
         h = np.maximum(self.display_values + (osc * self.intensity), 0.1)
         deformation = 1.0 - (osc * 0.1 * self.intensity)
         current_dx = self.dx_base * deformation
         current_dy = self.dy_base * deformation
         shift = (self.dx_base - current_dx) / 2
-        current_x = self.x_pos + shift
-        current_y = self.y_pos + shift
-
-        cols = [self.colors[i % len(self.colors)] for i in range(self.num_bars)]
-
-        self.ax.bar3d(
-            current_x,
-            current_y,
-            self.z_pos,
-            current_dx,
-            current_dy,
-            h,
-            color=cols,
-            shade=True,
-            edgecolor="white",
-            linewidth=1.2,
-            alpha=self.bar_alpha,
-        )
 
-        for i, val in enumerate(h):
-            cx = self.x_pos[i] + self.dx_base / 2
-            cy = self.y_pos[i] + self.dy_base / 2
-
-            text = self.ax.text(
-                cx,
-                cy,
-                val + 0.5,
-                f"{self.logic_values[i]:.0f}",
-                ha="center",
-                va="bottom",
-                fontsize=16,
-                fontweight="bold",
-                color=cols[i],
-                zorder=20,
-            )
-            text.set_path_effects(
-                [
-                    path_effects.withStroke(linewidth=4, foreground="white"),
-                    path_effects.Normal(),
-                ]
-            )
+        # Same box layout as Axes3D.bar3d, mutated in place on the
+        # shared renderer's collection instead of rebuilding the scene.
+        origin = np.column_stack((self.x_pos + shift, self.y_pos + shift, self.z_pos))
+        size = np.column_stack((current_dx, current_dy, h))
+        polys = origin[:, None, None, :] + size[:, None, None, :] * _CUBOID
+        self._polys = polys.reshape(-1, 4, 3)
 
-            label = self.ax.text(
-                cx,
-                cy,
-                -0.5,
-                f"G{i}",
-                ha="center",
-                va="top",
-                fontsize=14,
-                fontweight="bold",
-                color=cols[i],
-                zorder=20,
+        # Value labels ride on top of each bar
+        self.value_z = h + 0.5
+
+        if self._ring_enabled:
+            # Render now so the finished frame can be captured
+            self._shown = self.record_ring_frame(phase_idx, self.render_frame())
+            self._pending = False
+        else:
+            self._pending = True
+        self.update()
+
+    def render_frame(self):
+        """The current frame as (QImage, origin, labels), in either engine."""
+        ratio = self.devicePixelRatioF()
+        if self.engine == "qpainter":
+            image = QImage(
+                max(1, round(self.width() * ratio)),
+                max(1, round(self.height() * ratio)),
+                QImage.Format.Format_RGBA8888_Premultiplied,
             )
-            label.set_path_effects(
-                [
-                    path_effects.withStroke(linewidth=3, foreground="white"),
-                    path_effects.Normal(),
-                ]
+            image.setDevicePixelRatio(ratio)
+            image.fill(0)
+            painter = QPainter(image)
+            get_painter_chart_renderer().paint(
+                painter, self, self._polys, self.width(), self.height(), ratio
             )
+            painter.end()
+            return image, QPointF(), ()
+
+        # Imported on first use: only this engine needs matplotlib's 3D toolkit
+        from src.presentation.components.mpl_chart_renderer import get_chart_renderer
+
+        renderer = get_chart_renderer(self.width(), self.height(), ratio)
+        return renderer.render(self, self._polys)
+
+    def current_ring_key(self):
+        return (
+            self.engine,
+            self.logic_values.tobytes(),
+            self.intensity,
+            self.bar_alpha,
+            self.width(),
+            self.height(),
+            self.devicePixelRatioF(),
+        )
 
-        self.ax.view_init(elev=20, azim=-60)
-
-        # --- TRUE CENTRALIZATION logic ---
-        total_width = (self.num_bars * 0.6) - 0.2
-        center_x = total_width / 2
+    def record_ring_frame(self, phase_idx, frame):
+        """
+        Flattens a rendered frame's labels into it, crops it to its content
+        and stores it; returns the flattened frame.
+        """
+        image, _, labels = frame
+        image = image.convertToFormat(QImage.Format.Format_RGBA8888_Premultiplied)
+        painter = QPainter(image)
+        for pos, sprite in labels:
+            painter.drawImage(pos, sprite)
+        painter.end()
+
+        ratio = image.devicePixelRatio()
+        w_px = image.width()
+        bits = image.constBits()
+        bits.setsize(image.sizeInBytes())
+        alpha = np.frombuffer(bits, dtype=np.uint8).reshape(
+            image.height(), image.bytesPerLine()
+        )[:, 3 : 4 * w_px : 4]
+        rows, cols = np.nonzero(alpha)
+        if len(rows):
+            x0, y0 = int(cols.min()), int(rows.min())
+            image = image.copy(
+                QRect(x0, y0, int(cols.max()) + 1 - x0, int(rows.max()) + 1 - y0)
+            )
+        else:
+            x0 = y0 = 0
+        frame = (image, QPointF(x0 / ratio, y0 / ratio), ())
+
+        self._ring_bytes += image.sizeInBytes()
+        if self._ring_bytes > _RING_BUDGET_BYTES:
+            # Too large to keep a whole cycle; stay on live rendering
+            self.release_ring()
+            return frame
+        self._ring[phase_idx] = frame
+        return frame
+
+    def release_ring(self):
+        self._ring = {}
+        self._ring_bytes = 0
+        self._ring_enabled = False
 
-        zoom = max(1.0, self.num_bars * 0.4)
-        self.ax.set_xlim(center_x - zoom, center_x + zoom)
-        self.ax.set_ylim(-zoom, zoom)
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # The shown frame has the old size; render the same one again
+        if self._polys is not None:
+            self._pending = True
 
-        max_h = max(8, np.max(self.logic_values))
-        self.ax.set_zlim(0, max_h * 1.1)
+    def paintEvent(self, event):
+        if self._polys is None:
+            return
+        painter = QPainter(self)
+        painter.eraseRect(event.rect())
+        if self.engine == "qpainter" and not self._ring_enabled:
+            # Live frames are painted straight onto the widget
+            get_painter_chart_renderer().paint(
+                painter,
+                self,
+                self._polys,
+                self.width(),
+                self.height(),
+                self.devicePixelRatioF(),
+            )
+        else:
+            if self._pending or self._shown is None:
+                self._pending = False
+                self._shown = self.render_frame()
+            image, origin, labels = self._shown
+            painter.drawImage(origin, image)
+            for pos, sprite in labels:
+                painter.drawImage(pos, sprite)
+        painter.end()
 
     def set_display_values(self, values):
         """Update values for animation without full reload."""
         self.logic_values = np.array(values, dtype=float)
 
 
+# QPainter.PixmapFragment's members, in declaration order
+_FRAGMENT_FIELDS = (
+    "x",
+    "y",
+    "sourceLeft",
+    "sourceTop",
+    "width",
+    "height",
+    "scaleX",
+    "scaleY",
+    "rotation",
+    "opacity",
+)
+
+
+class _PixmapFragment(ctypes.Structure):
+    _fields_ = [(name, ctypes.c_double) for name in _FRAGMENT_FIELDS]
+
+
+_fragments_fillable = None
+
+
+def fragments_fillable():
+    """
+    Whether a sip.array of PixmapFragment is a plain C array of ten doubles
+    (qreal can be float, and sip's element layout is not a documented API),
+    so NumPy can fill it in place. Probed once on a two-element array.
+    """
+    global _fragments_fillable
+    if _fragments_fillable is None:
+        probe = sip.array(QPainter.PixmapFragment, 2)
+        first = sip.unwrapinstance(probe[0])
+        second = sip.unwrapinstance(probe[1])
+        fillable = second - first == ctypes.sizeof(_PixmapFragment)
+        if fillable:
+            for i, name in enumerate(_FRAGMENT_FIELDS):
+                setattr(probe[1], name, i + 1.0)
+            raw = _PixmapFragment.from_address(second)
+            fillable = [getattr(raw, name) for name in _FRAGMENT_FIELDS] == list(
+                range(1, len(_FRAGMENT_FIELDS) + 1)
+            )
+        _fragments_fillable = fillable
+    return _fragments_fillable
+
+
 class ConfettiWidget(QWidget):
+    """
+    Struct-of-arrays particle system: one NumPy array per attribute, advanced
+    and culled with whole-array operations. Colors come from a small random
+    palette baked into a sprite atlas, so every particle is a fragment of
+    that atlas and a frame is one drawPixmapFragments call over a fragment
+    array that NumPy fills in place.
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-        self.particles = []
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_particles)
+        self.xy = np.empty((0, 2))
+        self.vel = np.empty((0, 2))
+        self.rotation = np.empty(0)
+        self.rot_speed = np.empty(0)
+        self.sizes = np.empty(0)
+        self.color_index = np.empty(0, dtype=np.intp)
+        self.atlas = None
+        self.tick = None
         self.active = False
 
         self.stop_timer = QTimer(self)
         self.stop_timer.setSingleShot(True)
         self.stop_timer.timeout.connect(self.stop)
-        # self.color_mode removed
+
+    def particle_count(self):
+        vis = get_snapshot().get("global_config", {}).get("visuals", {})
+        try:
+            return max(0, int(vis.get("confetti_particles", CONFETTI_PARTICLES)))
+        except (TypeError, ValueError):
+            return CONFETTI_PARTICLES
 
     def explode(self, invert=False):
         self.active = True
-        self.particles = []
-        # color_mode ignored, always colorful
+        n = self.particle_count()
+        rng = np.random.default_rng()
 
         w, h = self.width(), self.height()
+        self.xy = np.tile((w / 2, h / 2), (n, 1)).astype(float)
+        self.vel = (rng.random((n, 2)) - 0.5) * 40
+        self.vel[:, 1] -= 10
+        self.sizes = rng.integers(5, 13, n).astype(float)
+        self.rotation = rng.random(n) * 360
+        self.rot_speed = (rng.random(n) - 0.5) * 20
+        self.color_index = rng.integers(0, _CONFETTI_COLORS, n)
+        self.atlas = self.build_atlas(rng.integers(50, 256, (_CONFETTI_COLORS, 3)))
 
-        # Create particles
-        for _ in range(300):
-            self.particles.append(
-                {
-                    "x": w / 2,
-                    "y": h / 2,
-                    "vx": (random.random() - 0.5) * 40,
-                    "vy": (random.random() - 0.5) * 40 - 10,
-                    "size": random.randint(5, 12),
-                    "color": self.get_color(),
-                    "rotation": random.random() * 360,
-                    "rot_speed": (random.random() - 0.5) * 20,
-                }
-            )
-
-        self.timer.start(16)
         self.show()
         self.raise_()
+        if self.tick is None:
+            self.tick = get_frame_clock().register(
+                self.update_particles, _CONFETTI_FRAME_MS, widget=self
+            )
 
-        # Stop after 3 seconds
         # Stop after 3 seconds (reset timer if already running)
         self.stop_timer.stop()
         self.stop_timer.start(3000)
 
-    def get_color(self):
-        # Colorful confetti
-        return QColor(
-            random.randint(50, 255), random.randint(50, 255), random.randint(50, 255)
-        )
+    def build_atlas(self, palette):
+        """
+        One solid square per palette color, each in a cell with a transparent
+        1px border so the smooth transform antialiases the rotated edges.
+        """
+        cell = _CONFETTI_SPRITE + 2
+        atlas = QPixmap(cell * len(palette), cell)
+        atlas.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(atlas)
+        for i, (r, g, b) in enumerate(palette.tolist()):
+            painter.fillRect(
+                i * cell + 1, 1, _CONFETTI_SPRITE, _CONFETTI_SPRITE, QColor(r, g, b)
+            )
+        painter.end()
+        return atlas
 
     def stop(self):
         self.active = False
-        self.timer.stop()
+        if self.tick is not None:
+            get_frame_clock().unregister(self.tick)
+            self.tick = None
         self.hide()
 
     def update_particles(self):
@@ -369,40 +586,60 @@ class ConfettiWidget(QWidget):
             return
 
         w, h = self.width(), self.height()
-        keep = []
-
-        for p in self.particles:
-            p["x"] += p["vx"]
-            p["y"] += p["vy"]
-            p["vy"] += 0.5  # Gravity
-            p["rotation"] += p["rot_speed"]
-            p["vx"] *= 0.95  # Drag
+        self.xy += self.vel
+        self.vel[:, 1] += 0.5  # Gravity
+        self.rotation += self.rot_speed
+        self.vel[:, 0] *= 0.95  # Drag
+
+        x, y = self.xy[:, 0], self.xy[:, 1]
+        keep = (y < h + 20) & (x > -20) & (x < w + 20)
+        if not keep.all():
+            self.xy = self.xy[keep]
+            self.vel = self.vel[keep]
+            self.rotation = self.rotation[keep]
+            self.rot_speed = self.rot_speed[keep]
+            self.sizes = self.sizes[keep]
+            self.color_index = self.color_index[keep]
 
-            if p["y"] < h + 20 and p["x"] > -20 and p["x"] < w + 20:
-                keep.append(p)
-
-        self.particles = keep
         self.update()
 
-        if not self.particles:
+        if not len(self.xy):
             self.stop()
 
     def paintEvent(self, event):
-        if not self.active:
+        n = len(self.xy)
+        if not self.active or not n or self.atlas is None:
             return
 
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # One row of _FRAGMENT_FIELDS per particle, written straight into the
+        # fragment array when its layout allows it
+        fragments = sip.array(QPainter.PixmapFragment, n)
+        if fragments_fillable():
+            size = n * ctypes.sizeof(_PixmapFragment)
+            buffer = sip.voidptr(sip.unwrapinstance(fragments[0]), size, True)
+            view = np.frombuffer(buffer, dtype=np.float64).reshape(n, 10)
+        else:
+            view = np.empty((n, 10))
+
+        cell = _CONFETTI_SPRITE + 2
+        view[:, 0:2] = self.xy
+        view[:, 2] = self.color_index * cell
+        view[:, 3] = 0
+        view[:, 4:6] = cell
+        view[:, 6] = self.sizes / _CONFETTI_SPRITE
+        view[:, 7] = view[:, 6]
+        view[:, 8] = self.rotation
+        view[:, 9] = 1
+        if not fragments_fillable():
+            for i, row in enumerate(view.tolist()):
+                fragment = fragments[i]
+                for name, value in zip(_FRAGMENT_FIELDS, row):
+                    setattr(fragment, name, value)
 
-        for p in self.particles:
-            painter.save()
-            painter.translate(p["x"], p["y"])
-            painter.rotate(p["rotation"])
-            painter.setBrush(QBrush(p["color"]))
-            painter.setPen(Qt.PenStyle.NoPen)
-            s = p["size"]
-            painter.drawRect(int(-s / 2), int(-s / 2), int(s), int(s))
-            painter.restore()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.drawPixmapFragments(fragments, self.atlas)
+        painter.end()
 
 
 class BarChartSlide(QWidget):
@@ -421,6 +658,10 @@ class BarChartSlide(QWidget):
         self.happy = HappyCharacterWidget(self)
         self.confetti = ConfettiWidget(self)
 
+    def apply_config(self, slide_config):
+        # Bars and visuals come from the class data, not the slide config
+        self.slide_config = slide_config or {}
+
     def cleanup(self):
         self.canvas.cleanup()
 
@@ -430,33 +671,37 @@ class BarChartSlide(QWidget):
     def stop_animation(self):
         self.canvas.stop_animation()
 
+    def warm_up(self):
+        self.canvas.warm_up()
+
+    def on_shown(self):
+        self.start_animation()
+
+    def on_hidden(self):
+        self.stop_animation()
+        self.confetti.stop()
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
         self.confetti.resize(self.size())
         # Happy widget positions itself during animation
 
-    def trigger_increment_effect(self, bar_id, val):
-        from src.infrastructure.config import (
-            load_data,
-            save_data,
-        )
-
-        # 1. Update Persistent Data
-        d = load_data()
-        cls_id = d.get("global_config", {}).get("current_class_id", "Geral")
-        bars = d.get("classes", {}).get(cls_id, {}).get("bars", [])
-
-        if 0 <= bar_id < len(bars):
-            bars[bar_id] += val
-            save_data(d)
-            # This triggers file watch -> load_configs -> update canvas logic_values
+    def trigger_increment_effect(self, bar_id):
+        """
+        Celebrates an increment the caller has already applied to the shared
+        snapshot. The bars are taken from there rather than adding to what is
+        on screen, which may or may not include the increment yet (a slide
+        built after the update already does).
+        """
+        values = np.array(get_current_class_data().get("bars", ()), dtype=float)
+        if not 0 <= bar_id < len(values):
+            print(f"Bar ID {bar_id} out of range")
+            return
 
-            # 2. Trigger Animations
-            # Check for invert/dark mode
-            inv = d.get("global_config", {}).get("color_inverted", False)
+        self.canvas.set_display_values(values)
 
-            self.happy.play(invert=inv)
-            self.confetti.explode(invert=inv)
+        # Check for invert/dark mode
+        inv = get_snapshot().get("global_config", {}).get("color_inverted", False)
 
-        else:
-            print(f"Bar ID {bar_id} out of range")
+        self.happy.play(invert=inv)
+        self.confetti.explode(invert=inv)
@@ -1,9 +1,18 @@
-from datetime import datetime
+from bisect import bisect_left, insort
+from collections import Counter
+from datetime import date, datetime, time, timedelta
 
 from PyQt6.QtCore import QPointF, QRectF, Qt, QTimer
-from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter, QTextDocument
-
-from src.infrastructure.config import get_current_class_data, load_data
+from PyQt6.QtGui import (
+    QColor,
+    QFont,
+    QFontMetrics,
+    QPainter,
+    QPixmap,
+    QTextDocument,
+)
+
+from src.infrastructure.config import get_current_class_data, get_snapshot
 from src.infrastructure.signals import signals
 from src.presentation.components.rough_box import RoughBoxWidget
 
@@ -18,27 +27,141 @@ class Pastel:
     DARK_YELLOW = "#b58900"
 
 
+DATE_FORMAT = "%d/%m/%Y"
+
+EXPIRED = "expired"
+URGENT = "urgent"
+SOON = "soon"
+LATER = "later"
+
+
+def _entry_date(entry):
+    return entry[0]
+
+
+class DeadlineIndex:
+    """
+    Deadlines parsed once and kept sorted by date.
+
+    Entries are (datetime, task, date label) tuples. sync() diffs the
+    configured list against what is already indexed and only parses,
+    inserts or removes what changed. Days left and urgency bucket are cached
+    per distinct date until refresh() sees a new day.
+    """
+
+    def __init__(self):
+        self.entries = []
+        self.counts = Counter()
+        self.today = date.today()
+        self.status = {}
+        self._source = None
+
+    @staticmethod
+    def _parse(raw):
+        date_str, task = raw
+        if task is None:
+            return None
+        try:
+            dt = datetime.strptime(date_str, DATE_FORMAT)
+        except (TypeError, ValueError):
+            return None
+        return (dt, task, dt.strftime(DATE_FORMAT))
+
+    def sync(self, items):
+        """Brings the index in line with items. Returns True if it changed."""
+        if items is self._source:
+            return False
+        self._source = items
+
+        counts = Counter((item.get("date"), item.get("task")) for item in items)
+        if counts == self.counts:
+            return False
+
+        for raw, n in (self.counts - counts).items():
+            entry = self._parse(raw)
+            for _ in range(n if entry else 0):
+                self._remove(entry)
+        for raw, n in (counts - self.counts).items():
+            entry = self._parse(raw)
+            for _ in range(n if entry else 0):
+                # Same-date entries keep their configured order
+                insort(self.entries, entry, key=_entry_date)
+        self.counts = counts
+        return True
+
+    def _remove(self, entry):
+        i = bisect_left(self.entries, entry[0], key=_entry_date)
+        while i < len(self.entries) and self.entries[i][0] == entry[0]:
+            if self.entries[i] == entry:
+                del self.entries[i]
+                return
+            i += 1
+
+    def refresh(self):
+        """Drops the cached buckets if the day changed. Returns True if so."""
+        today = date.today()
+        if today == self.today:
+            return False
+        self.today = today
+        self.status = {}
+        return True
+
+    def status_of(self, dt):
+        """(days left, bucket) for a deadline, computed once per date and day."""
+        status = self.status.get(dt)
+        if status is None:
+            days = (dt.date() - self.today).days
+            if days < 0:
+                bucket = EXPIRED
+            elif days <= 7:
+                bucket = URGENT
+            elif days <= 15:
+                bucket = SOON
+            else:
+                bucket = LATER
+            status = self.status[dt] = (days, bucket)
+        return status
+
+    def page(self, start, count):
+        return self.entries[start : start + count]
+
+    def __len__(self):
+        return len(self.entries)
+
+
 class DeadlineSlide(RoughBoxWidget):
+    # Content comes from a cached page pixmap and there is no rough border
+    animated_border = False
+
     def __init__(self, slide_config=None):
         super().__init__()
         self.slide_config = slide_config or {}
         self.deadlines = []
-        self.parsed_deadlines = []
+        self.index = DeadlineIndex()
 
         # Pagination
         self.current_page = 0
         self.items_per_page = 5
         self.total_pages = 1
+        self.shown = False
         self.page_timer = QTimer(self)
         self.page_timer.timeout.connect(self.next_page)
 
+        # Rendered page: (key, pixmap), rebuilt only when _page_key() changes
+        self._page_cache = None
+
+        # Days left only change at midnight (armed while shown)
+        self.midnight_timer = QTimer(self)
+        self.midnight_timer.setSingleShot(True)
+        self.midnight_timer.timeout.connect(self.on_midnight)
+
         # Connect to update signals
         signals.update_data.connect(self.load_specific)
         self.load_specific()
 
     def load_specific(self):
         cls = get_current_class_data()
-        d = load_data()
+        d = get_snapshot()
 
         # If slide_config has date/title, create a single deadline entry
         if self.slide_config and "date" in self.slide_config:
@@ -64,56 +187,127 @@ class DeadlineSlide(RoughBoxWidget):
         # Legend intensity from config
         self.rough_legend = vis.get("rough_legend", 0.5)
 
-        # Parse deadlines once
-        self.parsed_deadlines = []
-        for item in self.deadlines:
-            try:
-                dt = datetime.strptime(item["date"], "%d/%m/%Y")
-                self.parsed_deadlines.append((dt, item["task"]))
-            except Exception:
-                pass
-        self.parsed_deadlines.sort(key=lambda x: x[0])
+        # Only new or removed deadlines are parsed
+        changed = self.index.sync(self.deadlines)
+        self.index.refresh()
+        self.update_pagination(reset=changed)
+        self.update()
+
+    def apply_config(self, slide_config):
+        """Takes an edited slide config without recreating the widget."""
+        self.slide_config = slide_config or {}
+        self.load_specific()
+        self.update_page_timer()  # The duration may have changed
 
+    def update_pagination(self, reset=False):
         # Calculate layout and limit
         available_h = self.height() - 140
         line_height = self.font_size * 2.5  # Rough estimate including padding
         if line_height < 30:
             line_height = 30
 
-        calculated_limit = max(1, int(available_h / line_height))
-        self.items_per_page = calculated_limit
+        items_per_page = max(1, int(available_h / line_height))
+        total_pages = max(1, (len(self.index) + items_per_page - 1) // items_per_page)
 
-        self.total_pages = (
-            len(self.parsed_deadlines) + self.items_per_page - 1
-        ) // self.items_per_page
-        if self.total_pages < 1:
-            self.total_pages = 1
+        if (
+            not reset
+            and items_per_page == self.items_per_page
+            and total_pages == self.total_pages
+        ):
+            return
 
+        self.items_per_page = items_per_page
+        self.total_pages = total_pages
         self.current_page = 0
+        self.update_page_timer()
 
-        # Setup rotation
+    def update_page_timer(self):
+        # Setup rotation (only while this slide is on screen)
         total_duration = self.slide_config.get("duration", 10)
-        if self.total_pages > 1:
+        if self.total_pages > 1 and self.shown:
             page_duration = max(3, total_duration / self.total_pages)
             self.page_timer.start(int(page_duration * 1000))
         else:
             self.page_timer.stop()
 
-        self.update()
-
     def next_page(self):
         self.current_page = (self.current_page + 1) % self.total_pages
         self.update()
 
+    def schedule_midnight(self):
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), time.min)
+        # A second late so date.today() has certainly rolled over
+        self.midnight_timer.start(int((midnight - now).total_seconds() * 1000) + 1000)
+
+    def on_midnight(self):
+        self.index.refresh()
+        self.schedule_midnight()
+        self.update()
+
+    def on_shown(self):
+        super().on_shown()
+        self.shown = True
+        self.update_page_timer()
+        if self.index.refresh():
+            self.update()
+        self.schedule_midnight()
+
+    def on_hidden(self):
+        super().on_hidden()
+        self.shown = False
+        self.page_timer.stop()
+        self.midnight_timer.stop()
+
     def resizeEvent(self, event):
         # Recalculate items per page on resize
-        self.load_specific()
+        self.update_pagination()
         super().resizeEvent(event)
 
+    def _page_key(self):
+        start_idx = self.current_page * self.items_per_page
+        return (
+            self.current_page,
+            self.total_pages,
+            tuple(self.index.page(start_idx, self.items_per_page)),
+            self.font_family,
+            self.font_size,
+            self.text_color,
+            self.color_inverted,
+            self.rough_legend,
+            self.width(),
+            self.height(),
+            self.devicePixelRatioF(),
+            # "Days left" only changes at midnight
+            self.index.today,
+        )
+
+    def get_page(self):
+        """Returns the current page rendered into a widget-sized pixmap."""
+        key = self._page_key()
+        if self._page_cache is not None and self._page_cache[0] == key:
+            return self._page_cache[1]
+
+        ratio = key[-2]
+        page = QPixmap(
+            max(1, round(self.width() * ratio)), max(1, round(self.height() * ratio))
+        )
+        page.setDevicePixelRatio(ratio)
+        page.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(page)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.draw_page(painter)
+        painter.end()
+
+        self._page_cache = (key, page)
+        return page
+
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.drawPixmap(0, 0, self.get_page())
+        painter.end()
 
+    def draw_page(self, painter):
         w = self.width()
         h = self.height()
 
@@ -144,25 +338,22 @@ class DeadlineSlide(RoughBoxWidget):
         </tr>
         """
 
-        if not self.parsed_deadlines:
+        if not self.index:
             return
 
-        today = datetime.now()
-
         start_idx = self.current_page * self.items_per_page
-        end_idx = start_idx + self.items_per_page
-        page_items = self.parsed_deadlines[start_idx:end_idx]
+        page_items = self.index.page(start_idx, self.items_per_page)
 
-        for i, (dt, task) in enumerate(page_items):
-            days = (dt - today).days + 1
+        for dt, task, label in page_items:
+            days, bucket = self.index.status_of(dt)
 
-            if days < 0:
+            if bucket == EXPIRED:
                 color = Pastel.GRAY
                 txt = "Expirado"
-            elif days <= 7:
+            elif bucket == URGENT:
                 color = Pastel.RED
                 txt = f"{days} dias"
-            elif days <= 15:
+            elif bucket == SOON:
                 color = Pastel.DARK_YELLOW if self.color_inverted else Pastel.ORANGE
                 txt = f"{days} dias"
             else:
@@ -172,7 +363,7 @@ class DeadlineSlide(RoughBoxWidget):
             html += f"""
             <tr>
                 <td style='border-bottom: 1px solid #555;'>{task}</td>
-                <td style='border-bottom: 1px solid #555; text-align: center;'>{dt.strftime("%d/%m/%Y")}</td>
+                <td style='border-bottom: 1px solid #555; text-align: center;'>{label}</td>
                 <td style='border-bottom: 1px solid #555; text-align: center; color:{color}; font-weight:bold'>{txt}</td>
             </tr>
             """
@@ -253,5 +444,3 @@ class DeadlineSlide(RoughBoxWidget):
                 base_c.setAlpha(255 if active else 80)
                 painter.setBrush(base_c)
                 painter.drawEllipse(QPointF(sx + i * 20, rect.bottom() - 15), 3, 3)
-
-        painter.end()
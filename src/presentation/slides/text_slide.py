@@ -1,4 +1,5 @@
 import logging
+from collections import OrderedDict
 
 from PyQt6.QtCore import (
     QEasingCurve,
@@ -9,17 +10,28 @@ from PyQt6.QtCore import (
     QTimer,
     pyqtProperty,
 )
-from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPixmap
 
-from src.infrastructure.config import get_current_class_data, load_data, save_data
+from src.infrastructure.config import (
+    current_class_state,
+    get_current_class_data,
+    get_snapshot,
+    update_data,
+)
 from src.infrastructure.signals import signals
 from src.presentation.components.latex_renderer import get_latex_renderer
 from src.presentation.components.rough_box import RoughBoxWidget
+from src.presentation.components.text_layout import TextLayout
 
 logger = logging.getLogger(__name__)
 
+PAGE_CACHE_SIZE = 8
+
 
 class TextInfoSlide(RoughBoxWidget):
+    # Content comes from a cached page pixmap and there is no rough border
+    animated_border = False
+
     def __init__(self, slide_config=None):
         super().__init__()
         self.slide_config = slide_config or {}
@@ -31,15 +43,21 @@ class TextInfoSlide(RoughBoxWidget):
         self.content_timer.timeout.connect(self.next_internal_slide)
         signals.update_data.connect(self.load_specific)
         signals.lock_notice.connect(self.set_lock)
+        signals.latex_rendered.connect(self.on_latex_rendered)
 
         self.slide_offset = 0.0
         self.is_animating = False
         self.animation = None
 
+        # Laid-out messages keyed by content and everything that affects layout
+        self._layouts = {}
+        # Rendered pages (LRU), so transitions are just two pixmap blits
+        self._pages = OrderedDict()
+
         self.load_specific()
 
     def load_specific(self):
-        d = load_data()
+        d = get_snapshot()
 
         # Get total slide duration
         self.total_duration = (
@@ -51,7 +69,7 @@ class TextInfoSlide(RoughBoxWidget):
             # New format: messages list (just content strings)
             if "messages" in self.slide_config:
                 self.messages = [
-                    msg.get("content", "") if isinstance(msg, dict) else msg
+                    msg if isinstance(msg, str) else msg.get("content", "")
                     for msg in self.slide_config["messages"]
                 ]
             # Old format: single content field (backward compatibility)
@@ -65,7 +83,7 @@ class TextInfoSlide(RoughBoxWidget):
             notices = cls.get("notices", [])
             if notices:
                 self.messages = [
-                    n.get("content", "") if isinstance(n, dict) else n for n in notices
+                    n if isinstance(n, str) else n.get("content", "") for n in notices
                 ]
             else:
                 self.messages = ["# Vazio"]
@@ -93,20 +111,41 @@ class TextInfoSlide(RoughBoxWidget):
         )
 
         self.locked_index = -1
+        self._layouts.clear()
+        self._pages.clear()
         self.update_timer()
 
+        # Render formulas ahead of time so the first paint doesn't block
+        get_latex_renderer().prefetch(
+            self.messages, self.font_size, self.text_color.name()
+        )
+
+    def apply_config(self, slide_config):
+        """Takes an edited slide config without recreating the widget."""
+        self.slide_config = slide_config or {}
+        self.load_specific()
+        count = max(1, len(self.messages))
+        self.current_msg_index %= count
+        self.next_msg_index %= count
+        self.update()
+
+    def on_latex_rendered(self, cache_key):
+        # A formula finished in the background; drop layouts with placeholders
+        self._layouts.clear()
+        self._pages.clear()
+        self.update()
+
     def update_timer(self):
         if self.content_timer.isActive():
             self.content_timer.setInterval(int(self.item_duration * 1000))
 
     def set_lock(self, idx):
         self.locked_index = idx
-        d = load_data()
-        cid = d["global_config"]["current_class_id"]
-        if "state" not in d["classes"][cid]:
-            d["classes"][cid]["state"] = {}
-        d["classes"][cid]["state"]["locked_notice"] = idx
-        save_data(d)
+
+        def lock(d):
+            current_class_state(d)["locked_notice"] = idx
+
+        update_data(lock)
 
         if idx != -1:
             self.current_msg_index = idx
@@ -160,20 +199,67 @@ class TextInfoSlide(RoughBoxWidget):
         self.update()
 
     def draw_text_content(self, painter, rect, msg_index, x_offset):
+        painter.drawPixmap(QPointF(x_offset, 0), self.get_page(rect, msg_index))
+
+    def _layout_key(self, rect, msg_index):
         msg = self.messages[msg_index % len(self.messages)]
+        return (
+            msg,
+            rect.width(),
+            rect.height(),
+            self.font_family,
+            self.font_size,
+            self.text_color.name(),
+            self.text_align,
+        )
 
+    def get_layout(self, rect, msg_index):
+        """Returns the cached display list for a message, laying it out once."""
+        key = self._layout_key(rect, msg_index)
+        layout = self._layouts.get(key)
+        if layout is None:
+            layout = TextLayout()
+            self.layout_text_content(layout, rect, key[0])
+            self._layouts[key] = layout
+        return layout
+
+    def get_page(self, rect, msg_index):
+        """Returns the message rendered into a widget-sized pixmap (LRU cached)."""
+        ratio = self.devicePixelRatioF()
+        key = self._layout_key(rect, msg_index) + (self.width(), self.height(), ratio)
+        page = self._pages.get(key)
+        if page is not None:
+            self._pages.move_to_end(key)
+            return page
+
+        page = QPixmap(
+            max(1, round(self.width() * ratio)), max(1, round(self.height() * ratio))
+        )
+        page.setDevicePixelRatio(ratio)
+        page.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(page)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.get_layout(rect, msg_index).replay(painter)
+        painter.end()
+
+        self._pages[key] = page
+        if len(self._pages) > PAGE_CACHE_SIZE:
+            self._pages.popitem(last=False)
+        return page
+
+    def layout_text_content(self, layout, rect, msg):
         # Check if message contains a table (lines with | separators)
         if self._is_table_content(msg):
-            self.draw_table_content(painter, rect, msg, x_offset)
+            self.draw_table_content(layout, rect, msg)
         elif "$" in msg:
-            self.draw_latex_content(painter, rect, msg, x_offset)
+            self.draw_latex_content(layout, rect, msg)
         else:
             # Render plain text/markdown with manual alignment
             padding_x = 50
             padding_y = 30
 
-            painter.save()
-            painter.translate(rect.x() + x_offset, rect.y())
+            layout.save()
+            layout.translate(rect.x(), rect.y())
 
             content_width = rect.width() - (padding_x * 2)
             content_height = rect.height() - (padding_y * 2)
@@ -214,8 +300,8 @@ class TextInfoSlide(RoughBoxWidget):
                 if line_type == "title":
                     title_font = QFont(self.font_family, int(self.font_size * 1.5))
                     title_font.setBold(True)
-                    painter.setFont(title_font)
-                    painter.setPen(self.text_color)
+                    layout.setFont(title_font)
+                    layout.setPen(self.text_color)
                     title_fm = QFontMetrics(title_font)
 
                     if self.text_align == "center":
@@ -226,21 +312,21 @@ class TextInfoSlide(RoughBoxWidget):
                     else:
                         x = padding_x
 
-                    painter.drawText(int(x), int(y_pos + title_fm.ascent()), text)
+                    layout.drawText(int(x), int(y_pos + title_fm.ascent()), text)
                     y_pos += h
                 else:
-                    painter.setFont(font)
-                    painter.setPen(self.text_color)
+                    layout.setFont(font)
+                    layout.setPen(self.text_color)
 
                     if self.text_align == "center":
                         x = padding_x + (content_width - fm.horizontalAdvance(text)) / 2
                     else:
                         x = padding_x
 
-                    painter.drawText(int(x), int(y_pos + fm.ascent()), text)
+                    layout.drawText(int(x), int(y_pos + fm.ascent()), text)
                     y_pos += h
 
-            painter.restore()
+            layout.restore()
 
     def _is_table_content(self, msg):
         """Check if message contains table format (rows with | separators)."""
@@ -276,16 +362,16 @@ class TextInfoSlide(RoughBoxWidget):
 
         return title, headers, rows
 
-    def draw_table_content(self, painter, rect, msg, x_offset):
-        """Draw a table with lines using QPainter."""
+    def draw_table_content(self, layout, rect, msg):
+        """Lays out a table, grid lines included, into layout."""
         renderer = get_latex_renderer()
         title, headers, rows = self._parse_table(msg)
 
         padding_x = 50
         padding_y = 30
 
-        painter.save()
-        painter.translate(rect.x() + x_offset, rect.y())
+        layout.save()
+        layout.translate(rect.x(), rect.y())
 
         content_width = rect.width() - (padding_x * 2)
         content_height = rect.height() - (padding_y * 2)
@@ -364,14 +450,14 @@ class TextInfoSlide(RoughBoxWidget):
                 self.font_family, int(self.font_size * 1.3 * scale_factor)
             )
             title_font.setBold(True)
-            painter.setFont(title_font)
-            painter.setPen(self.text_color)
+            layout.setFont(title_font)
+            layout.setPen(self.text_color)
 
             title_fm = QFontMetrics(title_font)
             x_title = (
                 padding_x + (content_width - title_fm.horizontalAdvance(title)) / 2
             )
-            painter.drawText(int(x_title), int(y_pos + title_fm.ascent()), title)
+            layout.drawText(int(x_title), int(y_pos + title_fm.ascent()), title)
             y_pos += scaled_title_height
 
         # Draw table border
@@ -380,8 +466,8 @@ class TextInfoSlide(RoughBoxWidget):
         table_width = content_width
         table_height = sum(scaled_row_heights)
 
-        painter.setPen(self.text_color)
-        painter.drawRect(
+        layout.setPen(self.text_color)
+        layout.drawRect(
             int(table_x), int(table_y), int(table_width), int(table_height)
         )
 
@@ -389,7 +475,7 @@ class TextInfoSlide(RoughBoxWidget):
         font_size_scaled = max(int(self.font_size * scale_factor), 10)
         header_font = QFont(self.font_family, font_size_scaled)
         header_font.setBold(True)
-        painter.setFont(header_font)
+        layout.setFont(header_font)
         fm_scaled = QFontMetrics(header_font)
 
         header_row_height = scaled_row_heights[0]
@@ -398,18 +484,18 @@ class TextInfoSlide(RoughBoxWidget):
             cell_y = table_y
 
             # Draw cell border
-            painter.drawRect(
+            layout.drawRect(
                 int(cell_x), int(cell_y), int(col_width), int(header_row_height)
             )
 
             # Draw header text centered
             text_x = cell_x + (col_width - fm_scaled.horizontalAdvance(header)) / 2
             text_y = cell_y + header_row_height / 2 + fm_scaled.ascent() / 3
-            painter.drawText(int(text_x), int(text_y), header)
+            layout.drawText(int(text_x), int(text_y), header)
 
         # Draw data rows
         cell_font = QFont(self.font_family, font_size_scaled)
-        painter.setFont(cell_font)
+        layout.setFont(cell_font)
 
         current_y = table_y + header_row_height
         for row_idx, row in enumerate(rows):
@@ -420,7 +506,7 @@ class TextInfoSlide(RoughBoxWidget):
                 cell_x = table_x + (col_idx * col_width)
 
                 # Draw cell border
-                painter.drawRect(
+                layout.drawRect(
                     int(cell_x), int(current_y), int(col_width), int(row_h)
                 )
 
@@ -445,7 +531,7 @@ class TextInfoSlide(RoughBoxWidget):
 
                     for seg in segments:
                         if seg[0] == "text":
-                            painter.drawText(
+                            layout.drawText(
                                 int(seg_x), int(seg_y + fm_scaled.ascent() / 3), seg[1]
                             )
                             seg_x += fm_scaled.horizontalAdvance(seg[1])
@@ -453,14 +539,9 @@ class TextInfoSlide(RoughBoxWidget):
                             pixmap = seg[1]
                             scaled_w = int(pixmap.width() * scale_factor)
                             scaled_h = int(pixmap.height() * scale_factor)
-                            scaled_pixmap = pixmap.scaled(
-                                scaled_w,
-                                scaled_h,
-                                Qt.AspectRatioMode.KeepAspectRatio,
-                                Qt.TransformationMode.SmoothTransformation,
-                            )
+                            scaled_pixmap = renderer.scaled(pixmap, scaled_w, scaled_h)
                             img_y = seg_y - scaled_h / 2
-                            painter.drawPixmap(int(seg_x), int(img_y), scaled_pixmap)
+                            layout.drawPixmap(int(seg_x), int(img_y), scaled_pixmap)
                             seg_x += scaled_w
                 elif "$" not in cell:
                     # Plain text
@@ -468,11 +549,11 @@ class TextInfoSlide(RoughBoxWidget):
                         cell_x + (col_width - fm_scaled.horizontalAdvance(cell)) / 2
                     )
                     text_y = current_y + row_h / 2 + fm_scaled.ascent() / 3
-                    painter.drawText(int(text_x), int(text_y), cell)
+                    layout.drawText(int(text_x), int(text_y), cell)
 
             current_y += row_h
 
-        painter.restore()
+        layout.restore()
 
     def _parse_bold(self, text):
         """Parse text for **bold** markdown and return list of (is_bold, text) tuples."""
@@ -496,7 +577,7 @@ class TextInfoSlide(RoughBoxWidget):
 
         return parts
 
-    def draw_latex_content(self, painter, rect, msg, x_offset):
+    def draw_latex_content(self, layout, rect, msg):
         renderer = get_latex_renderer()
         lines = msg.split("\n")
 
@@ -504,12 +585,12 @@ class TextInfoSlide(RoughBoxWidget):
         padding_x = 50
         padding_y = 30
 
-        painter.save()
-        painter.translate(rect.x() + padding_x + x_offset, rect.y())
+        layout.save()
+        layout.translate(rect.x() + padding_x, rect.y())
 
         font = QFont(self.font_family, self.font_size)
-        painter.setFont(font)
-        painter.setPen(self.text_color)
+        layout.setFont(font)
+        layout.setPen(self.text_color)
 
         content_width = rect.width() - (padding_x * 2)
         content_height = rect.height() - (padding_y * 2)
@@ -553,7 +634,7 @@ class TextInfoSlide(RoughBoxWidget):
                                 ("text", part_text, text_width, fm.height(), True)
                             )
                         else:
-                            fm = painter.fontMetrics()
+                            fm = layout.fontMetrics()
                             text_width = fm.horizontalAdvance(part_text)
                             segment_data.append(
                                 ("text", part_text, text_width, fm.height(), False)
@@ -616,9 +697,9 @@ class TextInfoSlide(RoughBoxWidget):
                 title_text = data
                 title_font = QFont(self.font_family, int(self.font_size * 1.5))
                 title_font.setBold(True)
-                painter.save()
-                painter.setFont(title_font)
-                painter.setPen(self.text_color)
+                layout.save()
+                layout.setFont(title_font)
+                layout.setPen(self.text_color)
 
                 fm = QFontMetrics(title_font)
                 title_width = fm.horizontalAdvance(title_text)
@@ -628,11 +709,11 @@ class TextInfoSlide(RoughBoxWidget):
                 else:
                     x_title = (content_width - title_width) / 2
 
-                painter.drawText(
+                layout.drawText(
                     int(x_title), int(y_position + fm.height() * 0.8), title_text
                 )
                 y_position += line_heights[i]
-                painter.restore()
+                layout.restore()
                 continue
 
             segment_data = data
@@ -661,35 +742,37 @@ class TextInfoSlide(RoughBoxWidget):
                 if seg[0] == "text":
                     text, width, height, is_bold = seg[1], seg[2], seg[3], seg[4]
                     if is_bold:
-                        painter.save()
+                        layout.save()
                         bold_font = QFont(self.font_family, self.font_size)
                         bold_font.setBold(True)
-                        painter.setFont(bold_font)
+                        layout.setFont(bold_font)
 
                     y_text = y_position + (max_height - height) / 2 + height * 0.8
-                    painter.drawText(int(x_position), int(y_text), text)
+                    layout.drawText(int(x_position), int(y_text), text)
                     x_position += width
 
                     if is_bold:
-                        painter.restore()
+                        layout.restore()
                 elif seg[0] == "latex":
                     pixmap, width, height, is_display = seg[1], seg[2], seg[3], seg[4]
                     scaled_width = int(width * min_scale_factor)
                     scaled_height = int(height * min_scale_factor)
                     y_img = y_position + (max_height - scaled_height) / 2
 
-                    scaled_pixmap = pixmap.scaled(
-                        scaled_width,
-                        scaled_height,
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation,
+                    scaled_pixmap = renderer.scaled(
+                        pixmap, scaled_width, scaled_height
                     )
-                    painter.drawPixmap(int(x_position), int(y_img), scaled_pixmap)
+                    layout.drawPixmap(int(x_position), int(y_img), scaled_pixmap)
                     x_position += scaled_pixmap.width()
 
             y_position += line_heights[i]
 
-        painter.restore()
+        layout.restore()
+
+    def resizeEvent(self, event):
+        self._layouts.clear()
+        self._pages.clear()
+        super().resizeEvent(event)
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -1,11 +1,4 @@
-import os
-
-os.environ["QT_QUICK_BACKEND"] = "software"
-os.environ["QT_OPENGL"] = "software"
-os.environ["QT_ENABLE_GBM"] = "0"
-os.environ["QT_WEBENGINE_CHROMIUM_FLAGS"] = "--use-vulkan --ignore-gpu-blocklist"
-
-from PyQt6.QtCore import Qt, QUrl
+from PyQt6.QtCore import Qt, QTimer, QUrl
 from PyQt6.QtWidgets import QVBoxLayout
 
 try:
@@ -30,6 +23,8 @@ class WebSlide(QWidget):
         self.default_margins = (0, 0, 0, 0)
         self.layout.setContentsMargins(*self.default_margins)
         self.supports_opacity = False
+        # Live page content does not grab reliably; slide the real widget
+        self.supports_snapshot = False
 
         if HAS_WEBENGINE:
             self.browser = QWebEngineView()
@@ -47,9 +42,53 @@ class WebSlide(QWidget):
         else:
             self.browser = None
 
+        # Lifecycle state applied once the page is off screen
+        self._hidden_state = None
+
         signals.update_data.connect(self.load_url)
         self.load_url()
 
+    def apply_config(self, slide_config):
+        """Takes an edited slide config; the page only reloads if the URL changed."""
+        self.slide_config = slide_config or {}
+        self.load_url()
+
+    def on_shown(self):
+        self._hidden_state = None
+        if self.browser:
+            self.page.setLifecycleState(QWebEnginePage.LifecycleState.Active)
+
+    def warm_up(self):
+        # A frozen page resumes, a discarded one reloads, before it is shown
+        self.on_shown()
+
+    def on_hidden(self):
+        if not self.browser:
+            return
+        # Frozen keeps the page in memory but stops JS and timers; "discarded"
+        # frees it and reloads on the next show
+        if self.slide_config.get("when_hidden") == "discarded":
+            self._hidden_state = QWebEnginePage.LifecycleState.Discarded
+        else:
+            self._hidden_state = QWebEnginePage.LifecycleState.Frozen
+        # Only non-visible pages may leave Active; if the stack is still
+        # sliding this one out, hideEvent applies it
+        self.apply_hidden_state()
+
+    def apply_hidden_state(self):
+        if self._hidden_state is None:
+            return
+        try:
+            if not self.page.isVisible():
+                self.page.setLifecycleState(self._hidden_state)
+        except RuntimeError:
+            pass  # Slide deleted by a rebuild meanwhile
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        # The view is hidden after this widget; freeze on the next turn
+        QTimer.singleShot(0, self.apply_hidden_state)
+
     def load_url(self):
         if self.browser:
             # Use slide_config if available, otherwise fallback to class data
@@ -0,0 +1,32 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# DATA_FILE is resolved when src.infrastructure.config is imported, so the
+# config directory has to point somewhere disposable before any src import
+os.environ["XDG_CONFIG_HOME"] = tempfile.mkdtemp(prefix="slide-scroller-tests-")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PyQt6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication(sys.argv[:1])
+
+
+@pytest.fixture
+def dashboard():
+    """Writes a dashboard.json and returns it; the store is flushed afterwards."""
+    from src.infrastructure.config import config_store, save_data
+
+    def write(data):
+        save_data(data)
+        return data
+
+    yield write
+    config_store.flush()
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from src.presentation.slides import chart_slide
+
+
+@pytest.fixture
+def confetti(qapp, dashboard):
+    dashboard({"global_config": {"visuals": {"confetti_particles": 50}}})
+    widget = chart_slide.ConfettiWidget()
+    widget.resize(200, 150)
+    widget.explode()
+    # A fixed frame instead of the random burst
+    widget.xy = np.column_stack((np.linspace(10, 190, 50), np.linspace(10, 140, 50)))
+    widget.rotation = np.linspace(0, 180, 50)
+    yield widget
+    widget.stop()
+    widget.deleteLater()
+
+
+def grab_pixels(widget):
+    image = widget.grab().toImage()
+    bits = image.constBits()
+    bits.setsize(image.sizeInBytes())
+    return np.frombuffer(bits, dtype=np.uint8).copy()
+
+
+def test_fragment_array_fallback_draws_the_same_frame(confetti, monkeypatch):
+    in_place = grab_pixels(confetti)
+    assert in_place.any()
+
+    monkeypatch.setattr(chart_slide, "_fragments_fillable", False)
+    assert np.array_equal(grab_pixels(confetti), in_place)
+
+
+def chart_data(engine):
+    return {
+        "global_config": {"visuals": {"chart_engine": engine}},
+        "classes": {"Geral": {"bars": [10.0, 20.0, 15.0]}},
+    }
+
+
+def test_switching_engine_drops_the_recorded_ring(qapp, dashboard):
+    from src.infrastructure.signals import signals
+
+    dashboard(chart_data("matplotlib"))
+    canvas = chart_slide.BarChartCanvas()
+    canvas.resize(300, 200)
+    for frame in range(chart_slide._BREATH_FRAMES + 1):
+        canvas.update_plot(frame)
+    recorded = list(canvas._ring.values())
+    assert len(recorded) == chart_slide._BREATH_FRAMES
+
+    dashboard(chart_data("qpainter"))
+    signals.update_data.emit()
+    assert canvas.engine == "qpainter"
+    for frame in range(chart_slide._BREATH_FRAMES + 1, 2 * chart_slide._BREATH_FRAMES):
+        canvas.update_plot(frame)
+        assert not any(canvas._shown is old for old in recorded)
+
+    canvas.cleanup()
+    canvas.deleteLater()
@@ -0,0 +1,26 @@
+from argparse import Namespace
+
+from src import cli
+from src.infrastructure.config import DATA_FILE
+
+
+def test_listing_slides_leaves_the_data_file_alone(dashboard, capsys):
+    dashboard({"classes": {"Geral": {"active_slides": [{"type": "text"}]}}})
+    before = DATA_FILE.read_bytes()
+
+    cli.cmd_slide(Namespace(action="list"))
+    cli.cmd_slide_content(Namespace(content_action="list", slide_id=0))
+
+    assert "TEXT" in capsys.readouterr().out
+    assert DATA_FILE.read_bytes() == before
+
+
+def test_editing_a_slide_backfills_its_uid(dashboard, capsys):
+    dashboard({"classes": {"Geral": {"active_slides": [{"type": "chart"}]}}})
+
+    cli.cmd_slide(
+        Namespace(action="edit", id=0, duration=5, url=None, zoom=None, content=None)
+    )
+
+    slide = cli.load_data()["classes"]["Geral"]["active_slides"][0]
+    assert slide["duration"] == 5 and slide["uid"]
@@ -0,0 +1,85 @@
+import json
+import os
+
+from src.infrastructure.config import (
+    DATA_FILE,
+    config_store,
+    flush_data,
+    get_current_class_data,
+    get_snapshot,
+    save_data,
+    update_data,
+)
+
+
+def external_write(data):
+    """Replaces dashboard.json the way another process (the CLI) would."""
+    temp = DATA_FILE.with_name("external.tmp")
+    temp.write_text(json.dumps(data), encoding="utf-8")
+    os.replace(temp, DATA_FILE)
+
+
+def bars_dashboard(bars):
+    return {
+        "global_config": {"current_class_id": "Geral"},
+        "classes": {"Geral": {"bars": bars}},
+    }
+
+
+def test_external_edit_read_before_the_watcher_is_still_a_change(dashboard):
+    dashboard(bars_dashboard([1.0]))
+    config_store.changed_on_disk()
+
+    external_write(bars_dashboard([2.0]))
+    # A timer tick reads the new file before the watcher slot runs
+    assert get_current_class_data()["bars"] == (2.0,)
+
+    assert config_store.changed_on_disk()
+    assert not config_store.changed_on_disk()
+
+
+def test_own_writes_are_not_changes(dashboard):
+    dashboard(bars_dashboard([1.0]))
+    config_store.changed_on_disk()
+
+    update_data(lambda d: d["classes"]["Geral"]["bars"].append(2.0))
+    assert flush_data()
+    assert not config_store.changed_on_disk()
+
+
+def test_save_keeps_queued_updates_and_copies_the_data(dashboard):
+    dashboard(bars_dashboard([1.0]))
+    update_data(lambda d: d["global_config"].__setitem__("fps_cap", 30))
+
+    # Saved before the write-behind queue ran
+    data = bars_dashboard([5.0])
+    save_data(data)
+    data["classes"]["Geral"]["bars"].append(6.0)
+
+    snapshot = get_snapshot()
+    assert snapshot["global_config"]["fps_cap"] == 30
+    assert snapshot["classes"]["Geral"]["bars"] == (5.0,)
+
+    assert flush_data()
+    on_disk = json.loads(DATA_FILE.read_text(encoding="utf-8"))
+    assert on_disk["global_config"]["fps_cap"] == 30
+    assert on_disk["classes"]["Geral"]["bars"] == [5.0]
+    assert not list(DATA_FILE.parent.glob("*.tmp"))
+
+
+def test_missing_file_is_recreated_and_loaded_once(dashboard, monkeypatch):
+    dashboard(bars_dashboard([1.0]))
+    DATA_FILE.unlink()
+
+    loads = []
+    load = config_store._load
+    monkeypatch.setattr(config_store, "_load", lambda d: loads.append(1) or load(d))
+    assert get_current_class_data()["bars"] == (10.0, 20.0, 15.0)
+    assert len(loads) == 1
+    assert config_store._stamp == config_store._file_stamp()
+
+    # The deletion came from outside; recreating the defaults did not
+    assert config_store.changed_on_disk()
+    assert not config_store.changed_on_disk()
+    get_snapshot()
+    assert len(loads) == 1
@@ -0,0 +1,66 @@
+from src.presentation.components.frame_clock import get_frame_clock
+
+
+def test_unregister_disconnects_from_the_widget(qapp, monkeypatch):
+    from PyQt6 import sip
+    from PyQt6.QtWidgets import QWidget
+
+    clock = get_frame_clock()
+    widget = QWidget()
+    for _ in range(5):
+        first = clock.register(lambda: None, 50, widget=widget)
+        second = clock.register(lambda: None, 16, widget=widget)
+        clock.unregister(first)
+        assert clock.watches(widget)
+        clock.unregister(second)
+        assert not clock.watches(widget)
+
+    # No destroyed connection is left to call back into the clock
+    calls = []
+    monkeypatch.setattr(clock, "unregister", calls.append)
+    sip.delete(widget)
+    assert calls == []
+
+
+def test_destroying_the_widget_ends_its_subscriptions(qapp):
+    from PyQt6 import sip
+    from PyQt6.QtWidgets import QWidget
+
+    clock = get_frame_clock()
+    widget = QWidget()
+    clock.register(lambda: None, 50, widget=widget)
+    clock.register(lambda: None, 16, widget=widget)
+    sip.delete(widget)
+
+    assert not any(s.widget is widget for s in clock.subscriptions)
+
+
+def test_obscured_widget_resumes_when_uncovered(qapp):
+    from PyQt6.QtWidgets import QWidget
+
+    clock = get_frame_clock()
+    window = QWidget()
+    window.resize(200, 200)
+    animated = QWidget(window)
+    animated.setGeometry(0, 0, 100, 100)
+    cover = QWidget(window)
+    cover.setAutoFillBackground(True)
+    cover.setGeometry(0, 0, 200, 200)
+    window.show()
+    qapp.processEvents()
+
+    ticks = []
+    sub = clock.register(lambda: ticks.append(1), 1000, widget=animated)
+    assert clock.is_suspended(sub)
+    assert any(s is sub for s in clock._suspended)
+
+    cover.hide()
+    qapp.processEvents()
+    # Resumed by the Paint of the uncovered widget, not a second later
+    assert not clock.is_suspended(sub)
+    assert sub.due <= clock.now()
+    assert not any(s is sub for s in clock._suspended)
+
+    clock.unregister(sub)
+    window.close()
+    window.deleteLater()
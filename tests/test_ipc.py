@@ -0,0 +1,40 @@
+import os
+import threading
+
+from src.infrastructure import ipc
+
+
+def test_send_command_round_trip(qapp):
+    from src.infrastructure.command_server import CommandServer
+
+    received = []
+
+    def handler(command):
+        received.append(command)
+        return None if command["cmd"] == "inc" else "Unknown command"
+
+    server = CommandServer(ipc.get_socket_name(os.getpid()), handler)
+    ipc.write_pid_file(server.name)
+    replies = []
+    client = threading.Thread(
+        target=lambda: replies.extend(
+            ipc.send_command({"cmd": c}) for c in ("inc", "nope")
+        )
+    )
+    client.start()
+    while client.is_alive():
+        qapp.processEvents()
+        client.join(0.001)
+    server.close()
+    ipc.PID_FILE.unlink()
+
+    assert received == [{"cmd": "inc"}, {"cmd": "nope"}]
+    assert replies == [
+        {"ok": True, "error": None},
+        {"ok": False, "error": "Unknown command"},
+    ]
+
+
+def test_send_command_without_an_app(qapp):
+    ipc.PID_FILE.unlink(missing_ok=True)
+    assert ipc.send_command({"cmd": "inc"}) is None
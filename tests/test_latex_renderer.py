@@ -0,0 +1,22 @@
+import hashlib
+
+from src.presentation.components import latex_renderer
+
+
+def test_cache_key_resolves_the_font_settings_once(qapp, tmp_path, monkeypatch):
+    import matplotlib
+
+    calls = []
+    resolve = latex_renderer._font_identity
+    monkeypatch.setattr(
+        latex_renderer, "_font_identity", lambda: calls.append(1) or resolve()
+    )
+    renderer = latex_renderer.LaTeXRenderer(cache_dir=tmp_path)
+
+    keys = [renderer._get_cache_key(r"\frac{1}{%d}" % i, 16, 150) for i in range(3)]
+
+    assert len(calls) == 1
+    fontset = matplotlib.rcParams["mathtext.fontset"]
+    fonts = ",".join(matplotlib.rcParams["font.family"])
+    content = rf"\frac{{1}}{{2}}_16_150_{fontset}_{fonts}"
+    assert keys[2] == hashlib.md5(content.encode()).hexdigest()
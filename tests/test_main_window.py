@@ -0,0 +1,94 @@
+import json
+import os
+
+import pytest
+
+from src.infrastructure.config import config_store, get_current_class_data
+
+
+@pytest.fixture
+def window(qapp):
+    from src.presentation.main_window import SlideScrollerApp
+
+    windows = []
+
+    def make():
+        windows.append(SlideScrollerApp())
+        return windows[-1]
+
+    yield make
+    for w in windows:
+        w.close()
+        w.deleteLater()
+    qapp.processEvents()
+
+
+def chart_dashboard():
+    return {
+        "global_config": {
+            "current_class_id": "Geral",
+            # Only the current slide is live, so the chart starts unbuilt
+            "slide_pool": {"live": 1, "radius": 0},
+        },
+        "classes": {
+            "Geral": {
+                "bars": [10.0, 20.0, 15.0],
+                "state": {"last_slide_index": 1},
+                "active_slides": [
+                    {"uid": "c", "type": "chart", "duration": 30},
+                    {"uid": "t", "type": "text", "duration": 30, "content": "# Hi"},
+                ],
+            }
+        },
+    }
+
+
+def test_increment_bar_builds_chart_with_the_new_value_once(dashboard, window):
+    dashboard(chart_dashboard())
+    app = window()
+    assert app.slides_data[0]["widget"] is None
+
+    assert app.increment_bar(2, 5) is None
+    canvas = app.slides_data[0]["widget"].canvas
+    assert get_current_class_data()["bars"][2] == 20.0
+    assert canvas.logic_values[2] == 20.0
+
+    assert app.increment_bar(2, 5) is None
+    assert get_current_class_data()["bars"][2] == 25.0
+    assert canvas.logic_values[2] == 25.0
+
+    assert config_store.flush()
+
+
+def test_external_edit_read_before_the_watcher_still_rebuilds(dashboard, window):
+    from src.infrastructure.config import DATA_FILE, get_snapshot
+
+    data = dashboard(chart_dashboard())
+    app = window()
+    assert len(app.slides_data) == 2
+
+    data["classes"]["Geral"]["active_slides"].pop(0)
+    temp = DATA_FILE.with_name("external.tmp")
+    temp.write_text(json.dumps(data), encoding="utf-8")
+    os.replace(temp, DATA_FILE)
+    get_snapshot()  # The pool tick got there first
+
+    app.on_file_changed(str(DATA_FILE))
+    assert [e["config"]["uid"] for e in app.slides_data] == ["t"]
+
+
+def test_increment_bar_updates_every_live_chart(dashboard, window):
+    data = chart_dashboard()
+    data["global_config"]["slide_pool"] = {"live": 3, "radius": 1}
+    data["classes"]["Geral"]["active_slides"].insert(
+        0, {"uid": "c0", "type": "chart", "duration": 30}
+    )
+    dashboard(data)
+    app = window()
+    charts = [app.slide_widget(i).canvas for i in (0, 1)]
+
+    assert app.increment_bar(1, 4) is None
+    for canvas in charts:
+        assert canvas.logic_values.tolist() == [10.0, 24.0, 15.0]
+
+    assert config_store.flush()
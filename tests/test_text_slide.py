@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+MESSAGES = [
+    "# Title\nSome plain text\n## Subtitle\nand a longer line of body text",
+    "# Grades\n| Name | Score |\n|---|---|\n| Ana | 9.5 |\n| Bruno | 7 |",
+]
+
+
+@pytest.fixture
+def slide(qapp, dashboard):
+    from src.presentation.slides.text_slide import TextInfoSlide
+
+    dashboard({})
+    widget = TextInfoSlide({"messages": MESSAGES})
+    widget.resize(600, 400)
+    yield widget
+    widget.deleteLater()
+
+
+def pixels(image):
+    image = image.convertToFormat(image.Format.Format_ARGB32_Premultiplied)
+    bits = image.constBits()
+    bits.setsize(image.sizeInBytes())
+    return np.frombuffer(bits, dtype=np.uint8).copy()
+
+
+@pytest.mark.parametrize("index", range(len(MESSAGES)))
+def test_recorded_layout_matches_direct_painting(slide, index):
+    from PyQt6.QtCore import QRect, Qt
+    from PyQt6.QtGui import QImage, QPainter
+
+    rect = QRect(0, 0, slide.width(), slide.height())
+    direct = QImage(slide.width(), slide.height(), QImage.Format.Format_ARGB32)
+    direct.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(direct)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    # The layout code only uses the QPainter calls TextLayout records
+    slide.layout_text_content(painter, rect, MESSAGES[index])
+    painter.end()
+
+    recorded = slide.get_page(rect, index).toImage()
+    assert pixels(direct).any()
+    assert np.array_equal(pixels(recorded), pixels(direct))